@@ -1,16 +1,35 @@
 import sys
 import os
 import json
+import re
 import logging
+import datetime
+import hashlib
+import glob
+import fnmatch
 import unicodedata
 import time  # 대기시간을 위한 time 모듈 추가
+import threading
+import bisect
+import math
+import csv
+import tempfile
+import http.client
+import urllib.request
+from array import array
+from collections import deque
+from itertools import accumulate, compress
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import google.generativeai as genai
+import google.ai.generativelanguage as glm
+from google.api_core import exceptions as google_exceptions
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QLabel, QLineEdit, QPushButton, QTextEdit, QRadioButton, 
                            QButtonGroup, QFileDialog, QMessageBox, QProgressBar, QGroupBox,
-                           QSplitter, QCheckBox, QTreeWidget, QTreeWidgetItem, QHeaderView,
-                           QStyle)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSettings
+                           QSplitter, QCheckBox, QTreeView, QHeaderView,
+                           QStyle, QTableView, QAbstractItemView, QMenu)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QSettings, QStandardPaths,
+                          QAbstractTableModel, QModelIndex, QTimer, QPoint)
 from PyQt5.QtGui import QFont
 
 # 로깅 설정
@@ -21,22 +40,1208 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 번역을 위한 쓰레드 클래스
-class TranslationThread(QThread):
-    # 시그널 정의
-    progress_signal = pyqtSignal(int, int)  # (현재 번역 중인 파일 인덱스, 전체 파일 수)
-    result_signal = pyqtSignal(list)  # 번역 결과 리스트
-    error_signal = pyqtSignal(str)  # 오류 메시지
-    
-    def __init__(self, api_key, filenames, language, chunk_size=10, delay_time=3, model_name="gemini-2.0-flash", custom_prompt=None):
-        super().__init__()
+# 모든 번역 요청에 공통으로 사용하는 생성 설정 및 안전 설정
+GENERATION_CONFIG = genai.types.GenerationConfig(temperature=0.8)
+SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+
+# 프로세스 전역 Gemini 클라이언트 관리자 (API 키/모델별 연결 재사용)
+class GeminiClientManager:
+    """API 키별 gRPC 클라이언트와 모델 객체를 실행 간에 재사용한다.
+
+    클라이언트는 스레드 안전하므로 동시에 동작하는 작업자들이 같은 연결을 공유하며,
+    일정 시간 이상 사용되지 않은 연결은 닫고 다음 사용 시 새로 생성한다.
+    """
+    IDLE_REFRESH_SECONDS = 300  # 이 시간 이상 유휴 상태인 연결은 갱신
+    CONTEXT_CACHE_TTL = datetime.timedelta(hours=1)  # 컨텍스트 캐시 유지 시간
+    # 컨텍스트 캐시에 등록할 수 있는 최소 토큰 수 (모델 이름 접두어 기준, 없으면 기본값)
+    CONTEXT_CACHE_MIN_TOKENS = {'gemini-2.5-flash': 1024, 'gemini-2.5-pro': 4096}
+    CONTEXT_CACHE_DEFAULT_MIN_TOKENS = 32768
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """프로세스 전역 관리자 인스턴스 반환"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}  # api_key -> {'client': 클라이언트, 'last_used': 마지막 사용 시각}
+        self._models = {}  # (api_key, model_name, system_instruction) -> GenerativeModel
+        self._cached_contents = {}  # (api_key, model_name, system_instruction) -> 캐시 정보
+        self._cache_unsupported = set()  # 캐시 등록이 불가능한 (model_name, system_instruction), 키와 무관
+        self._instruction_tokens = {}  # (model_name, system_instruction) -> 시스템 지시문 토큰 수
+        self._cache_create_lock = threading.Lock()
+
+    def _create_client(self, api_key):
+        """API 키 전용 GenerativeService 클라이언트 생성 (전역 genai.configure 미사용)"""
+        return glm.GenerativeServiceClient(client_options={"api_key": api_key})
+
+    @staticmethod
+    def _close_client(client):
+        """교체된 클라이언트의 연결(gRPC 채널)을 닫음"""
+        try:
+            client.transport.close()
+        except Exception as e:
+            logger.warning(f"이전 연결 종료 실패: {str(e)}")
+
+    def get_client(self, api_key):
+        """API 키에 해당하는 클라이언트 반환 (없거나 유휴 상태가 길면 새로 생성)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.get(api_key)
+            if entry is None or now - entry['last_used'] > self.IDLE_REFRESH_SECONDS:
+                if entry is not None:
+                    logger.info(f"유휴 연결 갱신 ({int(now - entry['last_used'])}초 미사용)")
+                    self._close_client(entry['client'])
+                entry = {'client': self._create_client(api_key), 'last_used': now}
+                self._clients[api_key] = entry
+                # 이전 클라이언트에 묶인 모델 객체는 폐기
+                self._models = {k: v for k, v in self._models.items() if k[0] != api_key}
+            entry['last_used'] = now
+            return entry['client']
+
+    def get_model(self, api_key, model_name, system_instruction=None):
+        """API 키, 모델 이름, 시스템 지시문에 해당하는 모델 객체 반환"""
+        client = self.get_client(api_key)
+        key = (api_key, model_name, system_instruction)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = genai.GenerativeModel(
+                    model_name=model_name,
+                    generation_config=GENERATION_CONFIG,
+                    safety_settings=SAFETY_SETTINGS,
+                    system_instruction=system_instruction
+                )
+                # 전역 기본 클라이언트 대신 키 전용 클라이언트 사용
+                model._client = client
+                self._models[key] = model
+            return model
+
+    def cache_min_tokens(self, model_name):
+        """모델의 컨텍스트 캐시 최소 토큰 수"""
+        name = model_name.split('/')[-1]
+        for prefix, min_tokens in self.CONTEXT_CACHE_MIN_TOKENS.items():
+            if name.startswith(prefix):
+                return min_tokens
+        return self.CONTEXT_CACHE_DEFAULT_MIN_TOKENS
+
+    def get_cached_model(self, api_key, model_name, system_instruction):
+        """시스템 지시문을 컨텍스트 캐시에 등록한 모델 반환 (캐시를 사용할 수 없으면 None)
+
+        캐시는 키/모델/지시문 조합마다 한 번만 만들고 만료 직전에 다시 만든다.
+        지시문이 최소 토큰 수에 못 미치거나 등록에 실패하면 모델/지시문 조합을 기록해
+        다른 키로도 다시 시도하지 않는다.
+        """
+        instruction_key = (model_name, system_instruction)
+        with self._lock:
+            if instruction_key in self._cache_unsupported:
+                return None
+            tokens = self._instruction_tokens.get(instruction_key)
+        key = (api_key, model_name, system_instruction)
+        if tokens is None:
+            # 등록 요청 전에 토큰 수부터 확인 (전역 잠금 밖에서 수행, 모델/지시문마다 한 번)
+            try:
+                tokens = self.get_model(api_key, model_name, system_instruction).count_tokens(".").total_tokens
+            except Exception as e:
+                logger.warning(f"시스템 지시문 토큰 수 확인 실패: {str(e)}")
+                return None
+            with self._lock:
+                self._instruction_tokens[instruction_key] = tokens
+            min_tokens = self.cache_min_tokens(model_name)
+            if tokens < min_tokens:
+                logger.info(f"컨텍스트 캐시를 사용하지 않습니다 (시스템 지시문 {tokens}토큰 < 최소 {min_tokens}토큰)")
+                with self._lock:
+                    self._cache_unsupported.add(instruction_key)
+                return None
+        with self._cache_create_lock:
+            with self._lock:
+                if instruction_key in self._cache_unsupported:
+                    return None
+            entry = self._cached_contents.get(key)
+            if entry is None or entry['expires'] - time.time() < 60:
+                cache_client = glm.CacheServiceClient(client_options={"api_key": api_key})
+                try:
+                    cached_content = cache_client.create_cached_content(
+                        glm.CreateCachedContentRequest(cached_content=glm.CachedContent(
+                            model=model_name if '/' in model_name else f"models/{model_name}",
+                            display_name="file-name-translator",
+                            system_instruction=glm.Content(parts=[glm.Part(text=system_instruction)]),
+                            ttl=self.CONTEXT_CACHE_TTL
+                        ))
+                    )
+                except Exception as e:
+                    logger.info(f"컨텍스트 캐시를 사용하지 않습니다 (시스템 지시문으로 대체): {str(e)}")
+                    with self._lock:
+                        self._cache_unsupported.add(instruction_key)
+                    return None
+                finally:
+                    # 캐시 등록은 키마다 한 시간에 한 번이므로 연결을 유지하지 않음
+                    self._close_client(cache_client)
+                model = genai.GenerativeModel.from_cached_content(
+                    cached_content,
+                    generation_config=GENERATION_CONFIG,
+                    safety_settings=SAFETY_SETTINGS
+                )
+                entry = {
+                    'model': model,
+                    'expires': time.time() + self.CONTEXT_CACHE_TTL.total_seconds()
+                }
+                self._cached_contents[key] = entry
+                logger.info(f"컨텍스트 캐시 등록 완료: {cached_content.name}")
+        model = entry['model']
+        model._client = self.get_client(api_key)
+        return model
+
+    def warm_up(self, api_key, model_name):
+        """연결을 미리 열어 첫 번역 요청의 연결 지연을 없앤다"""
+        try:
+            model = self.get_model(api_key, model_name)
+            model.count_tokens("ping")
+            logger.info(f"Gemini 연결 준비 완료 - 모델: {model_name}")
+        except Exception as e:
+            logger.warning(f"Gemini 연결 준비 실패: {str(e)}")
+
+def parse_api_keys(text):
+    """쉼표/공백/줄바꿈으로 구분된 API 키 문자열을 중복 없는 목록으로 변환"""
+    keys = []
+    for key in text.replace('\n', ',').replace(' ', ',').split(','):
+        key = key.strip()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+# API 키 하나의 요청 간격, 상태, 사용량
+class ApiKeyState:
+    def __init__(self, api_key, index):
         self.api_key = api_key
-        self.filenames = filenames
+        self.index = index
+        self.next_available = 0.0  # 다음 요청 가능 시각 (time.monotonic 기준)
+        self.cooldown_until = 0.0  # 429 응답 후 쿨다운 종료 시각
+        self.consecutive_rate_limits = 0
+        self.disabled = False  # 잘못된 키 등으로 더 이상 사용하지 않음
+        self.in_flight = False
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    @property
+    def label(self):
+        """화면/로그 표시용 키 이름 (키 값은 끝 4자리만 표시)"""
+        return f"키{self.index + 1}(…{self.api_key[-4:]})"
+
+    def status(self, now):
+        """현재 상태 문자열"""
+        if self.disabled:
+            return "사용 중지"
+        if self.cooldown_until > now:
+            return f"쿨다운 {int(self.cooldown_until - now)}초"
+        return "정상"
+
+
+# 여러 API 키의 요청 예산을 관리하고 청크를 정상 키에 분배하는 키 풀
+class ApiKeyPool:
+    """키마다 동시에 한 요청만 보내고, 요청이 끝난 뒤 min_interval 만큼 쉬게 한다.
+
+    429(할당량 초과)를 받은 키는 연속 횟수에 따라 길어지는 쿨다운 동안 제외하고,
+    인증 오류가 난 키는 실행이 끝날 때까지 사용하지 않는다.
+    """
+    RATE_LIMIT_COOLDOWN = 30.0  # 첫 429 이후 쿨다운 (초), 연속될수록 두 배
+    MAX_COOLDOWN = 600.0
+    ERROR_BACKOFF = 10.0  # 기타 API 오류 후 해당 키 대기 시간 (초)
+
+    def __init__(self, api_keys, min_interval):
+        self.min_interval = min_interval
+        self.keys = [ApiKeyState(api_key, i) for i, api_key in enumerate(api_keys)]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def try_acquire(self):
+        """지금 요청을 보낼 수 있는 키 중 사용량이 가장 적은 키를 반환 (없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                state for state in self.keys
+                if not state.disabled and not state.in_flight
+                and state.next_available <= now and state.cooldown_until <= now
+            ]
+            if not available:
+                return None
+            state = min(available, key=lambda key_state: (key_state.requests, key_state.index))
+            state.in_flight = True
+            state.requests += 1
+            return state
+
+    def release(self, state, error=None):
+        """요청 결과에 따라 키 상태 갱신"""
+        now = time.monotonic()
+        with self._lock:
+            state.in_flight = False
+            state.next_available = now + self.min_interval
+            if error is None:
+                state.consecutive_rate_limits = 0
+            elif isinstance(error, google_exceptions.ResourceExhausted):
+                state.rate_limited += 1
+                state.consecutive_rate_limits += 1
+                cooldown = min(self.RATE_LIMIT_COOLDOWN * 2 ** (state.consecutive_rate_limits - 1), self.MAX_COOLDOWN)
+                state.cooldown_until = now + cooldown
+                logger.warning(f"{state.label} 할당량 초과 - {int(cooldown)}초 쿨다운")
+            elif is_invalid_key_error(error):
+                state.errors += 1
+                state.disabled = True
+                logger.error(f"{state.label} 인증 오류 - 이번 실행에서 제외합니다: {str(error)}")
+            else:
+                state.errors += 1
+                state.next_available = now + max(self.min_interval, self.ERROR_BACKOFF)
+
+    def shift(self, seconds, since):
+        """일시정지한 시간만큼 키별 다음 요청 시각을 미뤄 재개 시 몰아서 요청하지 않게 함"""
+        with self._lock:
+            for state in self.keys:
+                if state.next_available > since:
+                    state.next_available += seconds
+                else:
+                    state.next_available = max(state.next_available, since + seconds)
+
+    def has_usable_keys(self):
+        """사용 중지되지 않은 키가 남아 있는지 여부"""
+        with self._lock:
+            return any(not state.disabled for state in self.keys)
+
+    def seconds_until_available(self):
+        """가장 빨리 사용 가능해지는 키까지 남은 시간 (사용할 수 있는 키가 없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            waits = [
+                max(state.next_available, state.cooldown_until) - now
+                for state in self.keys if not state.disabled and not state.in_flight
+            ]
+        return max(0.0, min(waits)) if waits else None
+
+    def usage(self):
+        """키별 사용량 및 상태 목록"""
+        now = time.monotonic()
+        with self._lock:
+            return [{
+                'key': state.label,
+                'requests': state.requests,
+                'errors': state.errors,
+                'rate_limited': state.rate_limited,
+                'status': state.status(now),
+            } for state in self.keys]
+
+
+def is_invalid_key_error(error):
+    """API 키 자체가 잘못되어 재시도해도 소용없는 오류인지 여부"""
+    if isinstance(error, (google_exceptions.PermissionDenied, google_exceptions.Unauthenticated)):
+        return True
+    return isinstance(error, google_exceptions.InvalidArgument) and 'API key' in str(error)
+
+
+def format_key_usage(usage):
+    """키별 사용량을 한 줄 문자열로 변환"""
+    return " | ".join(
+        f"{item['key']}: {item['requests']}회 요청, 429 {item['rate_limited']}회, {item['status']}"
+        for item in usage
+    )
+
+
+# 작업 스레드가 UI로 진행 상황/결과를 보내는 최소 간격 (초당 10회)
+UI_UPDATE_INTERVAL = 0.1
+
+# 윈도우 파일명에 사용할 수 없는 문자 (전각 문장부호 포함)
+FORBIDDEN_FILENAME_CHARS = ['\\', '/', ':', '*', '?', '"', '<', '>', '|', '？', '！', '；', '：']
+
+
+def sanitize_filename(name):
+    """번역된 이름 정규화 및 윈도우에서 사용할 수 없는 특수문자를 '_'로 치환"""
+    name = unicodedata.normalize('NFKC', name)
+    for char in FORBIDDEN_FILENAME_CHARS:
+        name = name.replace(char, '_')
+    return name
+
+
+# 시그널 발생 빈도 제한 (항목마다 보내면 UI 이벤트 루프가 밀림)
+class SignalThrottle:
+    def __init__(self, interval=UI_UPDATE_INTERVAL):
+        self.interval = interval
+        self._last_emit = 0.0
+
+    def ready(self, force=False):
+        """지금 시그널을 보내도 되는지 여부 (보내도 되면 시각 갱신)"""
+        now = time.monotonic()
+        if force or now - self._last_emit >= self.interval:
+            self._last_emit = now
+            return True
+        return False
+
+
+# 번역 대상 언어 (라디오 버튼 ID 순서와 동일)
+LANGUAGES = ['korean', 'english', 'japanese']
+LANGUAGE_LABELS = {'korean': '한국어', 'english': '영어', 'japanese': '일본어'}
+
+
+# 번역 실행 한 번의 요청 및 토큰 사용량 통계
+class RunMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0  # 입력 토큰 (캐시된 토큰 포함)
+        self.cached_tokens = 0  # 컨텍스트 캐시에서 제공된 입력 토큰 (재전송하지 않은 토큰)
+        self.output_tokens = 0
+        self.request_seconds = 0.0
+        self.context_cache = False  # 컨텍스트 캐시 사용 여부
+        self.key_usage = []  # API 키별 사용량
+        self.offline_resolved = 0  # 용어집/규칙으로 API 없이 번역한 항목 수
+        self.series_families = 0  # 템플릿 하나로 묶어 번역한 시리즈 수
+        self.series_members = 0  # 시리즈 템플릿으로 번역한 이름 수
+        self.chunk_size = 0  # 실행 종료 시점의 청크 크기 (자동 조절 시 학습된 값)
+        self.chunk_size_changes = 0  # 청크 크기 자동 조절 횟수
+        self.shared_cache_hits = 0  # 공유 캐시에서 받아 요청하지 않은 이름 수
+        self.shared_cache_stored = 0  # 공유 캐시 서버에 기록한 이름 수
+        self.hedging = {}  # 중복 요청 비율과 꼬리 지연 (RequestHedger.summary)
+
+    def record_response(self, response, elapsed):
+        """응답 한 건의 토큰 사용량과 소요 시간 기록"""
+        usage = getattr(response, 'usage_metadata', None)
+        with self._lock:
+            self.requests += 1
+            self.request_seconds += elapsed
+            if usage is not None:
+                self.prompt_tokens += usage.prompt_token_count
+                self.cached_tokens += usage.cached_content_token_count
+                self.output_tokens += usage.candidates_token_count
+
+    def summary(self):
+        """통계 요약 딕셔너리 반환"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'prompt_tokens': self.prompt_tokens,
+                'cached_tokens': self.cached_tokens,
+                'uncached_prompt_tokens': self.prompt_tokens - self.cached_tokens,
+                'output_tokens': self.output_tokens,
+                'avg_request_seconds': self.request_seconds / self.requests if self.requests else 0.0,
+                'context_cache': self.context_cache,
+                'key_usage': list(self.key_usage),
+                'offline_resolved': self.offline_resolved,
+                'series_families': self.series_families,
+                'series_members': self.series_members,
+                'chunk_size': self.chunk_size,
+                'chunk_size_changes': self.chunk_size_changes,
+                'shared_cache_hits': self.shared_cache_hits,
+                'shared_cache_stored': self.shared_cache_stored,
+                'hedged_requests': self.hedging.get('hedged_requests', 0),
+                'hedge_wins': self.hedging.get('hedge_wins', 0),
+                'hedge_rate': self.hedging.get('hedge_rate', 0.0),
+                'request_timeouts': self.hedging.get('request_timeouts', 0),
+                'latency_p95': self.hedging.get('latency_p95', 0.0),
+                'latency_p99': self.hedging.get('latency_p99', 0.0),
+                'unhedged_latency_p99': self.hedging.get('unhedged_latency_p99', 0.0),
+            }
+
+    def format_summary(self):
+        """상태 표시줄/로그용 요약 문자열"""
+        stats = self.summary()
+        return (f"요청 {stats['requests']}회, 로컬 규칙 번역 {stats['offline_resolved']}개, "
+                f"공유 캐시 {stats['shared_cache_hits']}개(기록 {stats['shared_cache_stored']}개), "
+                f"시리즈 {stats['series_families']}개({stats['series_members']}개 이름), 입력 토큰 {stats['prompt_tokens']} "
+                f"(캐시로 절약 {stats['cached_tokens']}), 출력 토큰 {stats['output_tokens']}, "
+                f"평균 응답 {stats['avg_request_seconds']:.2f}초, 중복 요청 {stats['hedged_requests']}회"
+                f"({stats['hedge_rate']:.1%}, 먼저 응답 {stats['hedge_wins']}회), 마감 초과 {stats['request_timeouts']}회, "
+                f"응답 p99 {stats['latency_p99']:.2f}초 (중복 요청이 없었다면 {stats['unhedged_latency_p99']:.2f}초)")
+
+
+# 응답 시간/오류율에 따라 청크 크기를 조절하는 AIMD 제어기
+class AdaptiveChunkSizer:
+    """성공이 이어지고 항목당 응답 시간이 나빠지지 않으면 조금씩 키우고(가산 증가),
+    429/시간 초과/응답 누락이 생기면 절반으로 줄인다(승산 감소).
+
+    여러 청크가 동시에 진행되므로 감소는 마지막 조절 이후에 보낸 청크의 결과에만 반응한다.
+    """
+    MIN_SIZE = 1
+    MAX_SIZE = 100
+    INCREASE_STEP = 2
+    LATENCY_TOLERANCE = 1.2  # 최고 기록 대비 이 배수까지는 항목당 응답 시간이 유지된 것으로 봄
+    LATENCY_LIMIT = 2.0  # 최고 기록 대비 이 배수를 넘으면 줄임
+    MIN_PARSE_RATIO = 0.9  # 이보다 많이 누락되면 응답이 어긋난 것으로 봄
+
+    def __init__(self, initial_size, max_size=MAX_SIZE):
+        self.max_size = max(self.MIN_SIZE, max_size)
+        self.size = min(max(self.MIN_SIZE, initial_size), self.max_size)
+        self.best_item_seconds = None  # 관찰한 항목당 최소 응답 시간
+        self.changes = []  # (이전 크기, 새 크기, 사유)
+        self._generation = 0  # 크기를 바꿀 때마다 증가
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """다음 청크 크기와 현재 세대 반환 (결과 보고 시 함께 전달)"""
+        with self._lock:
+            return self.size, self._generation
+
+    def _resize(self, new_size, reason):
+        new_size = min(max(self.MIN_SIZE, new_size), self.max_size)
+        if new_size == self.size:
+            return
+        logger.info(f"청크 크기 조절: {self.size} -> {new_size} ({reason})")
+        self.changes.append((self.size, new_size, reason))
+        if new_size < self.size:
+            self.best_item_seconds = None  # 줄인 뒤에는 기준 응답 시간을 다시 측정
+        self.size = new_size
+        self._generation += 1
+
+    def record_success(self, generation, sent_size, result_count, elapsed):
+        """응답을 받은 청크의 결과 반영"""
+        if sent_size <= 0:
+            return
+        with self._lock:
+            parse_ratio = result_count / sent_size
+            item_seconds = elapsed / sent_size
+            if parse_ratio < self.MIN_PARSE_RATIO:
+                if generation == self._generation:
+                    self._resize(self.size // 2, f"응답 누락/불일치 {sent_size - result_count}/{sent_size}개")
+                return
+            if self.best_item_seconds is None or item_seconds < self.best_item_seconds:
+                self.best_item_seconds = item_seconds
+            if generation != self._generation:
+                return  # 이전 크기로 보낸 청크 결과는 증가 판단에 쓰지 않음
+            if item_seconds > self.best_item_seconds * self.LATENCY_LIMIT:
+                self._resize(self.size // 2, f"항목당 응답 시간 증가 {item_seconds * 1000:.0f}ms (최고 {self.best_item_seconds * 1000:.0f}ms)")
+            elif parse_ratio == 1.0 and item_seconds <= self.best_item_seconds * self.LATENCY_TOLERANCE:
+                self._resize(self.size + self.INCREASE_STEP, f"응답 정상, 항목당 {item_seconds * 1000:.0f}ms")
+
+    def record_error(self, generation, error):
+        """요청 오류 반영 (429/시간 초과만 크기를 줄임)"""
+        if isinstance(error, google_exceptions.ResourceExhausted):
+            reason = "할당량 초과(429)"
+        elif isinstance(error, (google_exceptions.DeadlineExceeded, TimeoutError)):
+            reason = "시간 초과"
+        else:
+            return
+        with self._lock:
+            if generation == self._generation:
+                self._resize(self.size // 2, reason)
+
+
+# 응답 시간 분위수로 요청 마감 시간과 중복 요청(hedge) 시점을 정하는 제어기
+class RequestHedger:
+    """최근 응답 시간의 p99로 요청마다 마감 시간을 정하고, p95가 지나도록 응답이 없는 요청은
+    쉬고 있는 다른 키로 한 번 더 보내 먼저 온 응답을 사용한다(hedged request).
+
+    중복 요청은 보낸 요청 수의 BUDGET_RATIO 이내로 제한해 할당량을 아끼며,
+    표본이 MIN_SAMPLES개 모이기 전에는 기본 마감 시간만 적용하고 중복 요청을 보내지 않는다.
+    """
+    WINDOW = 200  # 분위수 계산에 쓰는 최근 응답 수
+    MIN_SAMPLES = 10
+    HEDGE_PERCENTILE = 0.95
+    DEADLINE_PERCENTILE = 0.99
+    DEADLINE_FACTOR = 3.0  # 마감 시간 = p99 x 이 배수
+    DEFAULT_DEADLINE = 120.0
+    MIN_DEADLINE = 10.0
+    MAX_DEADLINE = 300.0
+    ABANDON_FACTOR = 1.5  # 마감 시간의 이 배수가 지나도 돌아오지 않으면 요청을 포기
+    BUDGET_RATIO = 0.05  # 중복 요청 상한 (보낸 요청 대비)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=self.WINDOW)  # 최근 응답 시간 (초)
+        self._completed = []  # 끝난 요청 묶음 (실제 대기 시간과 원 요청 소요 시간 계산용)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts = 0
+
+    @staticmethod
+    def percentile(values, fraction):
+        """최근접 순위 분위수 (값이 없으면 None)"""
+        ordered = sorted(values)
+        if not ordered:
+            return None
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def record_latency(self, elapsed):
+        """응답을 받은 요청의 소요 시간 기록 (먼저 오지 않은 중복 응답 포함)"""
+        with self._lock:
+            self._recent.append(elapsed)
+
+    def deadline(self):
+        """새 요청에 적용할 마감 시간 (초)"""
+        with self._lock:
+            if len(self._recent) < self.MIN_SAMPLES:
+                return self.DEFAULT_DEADLINE
+            tail = self.percentile(self._recent, self.DEADLINE_PERCENTILE)
+        return min(max(tail * self.DEADLINE_FACTOR, self.MIN_DEADLINE), self.MAX_DEADLINE)
+
+    def hedge_delay(self):
+        """응답이 없으면 중복 요청을 보낼 경과 시간 (표본이 적으면 None)"""
+        with self._lock:
+            if len(self._recent) < self.MIN_SAMPLES:
+                return None
+            return self.percentile(self._recent, self.HEDGE_PERCENTILE)
+
+    def record_sent(self):
+        with self._lock:
+            self.requests += 1
+
+    def can_hedge(self):
+        """중복 요청 예산이 남았는지 여부"""
+        with self._lock:
+            return self.hedges < max(1, int(self.requests * self.BUDGET_RATIO))
+
+    def record_hedge(self):
+        with self._lock:
+            self.hedges += 1
+
+    def record_completion(self, request, finished_at, hedge_won, timed_out):
+        """요청 묶음의 결과가 정해졌을 때 기록 (request는 실행 루프의 요청 묶음 딕셔너리)"""
+        request['waited'] = finished_at - request['started']
+        with self._lock:
+            self._completed.append(request)
+            if hedge_won:
+                self.hedge_wins += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def summary(self, now):
+        """중복 요청 비율과 꼬리 지연 (중복 요청이 없었다면 원 요청을 기다렸을 시간과 비교)"""
+        with self._lock:
+            completed = list(self._completed)
+            summary = {
+                'hedged_requests': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'hedge_rate': self.hedges / self.requests if self.requests else 0.0,
+                'request_timeouts': self.timeouts,
+            }
+        waited = [request['waited'] for request in completed]
+        # 원 요청이 아직 끝나지 않았으면 지금까지 걸린 시간을 하한으로 사용
+        unhedged = [
+            request['primary_elapsed'] if request['primary_elapsed'] is not None else now - request['started']
+            for request in completed
+        ]
+        summary['latency_p95'] = self.percentile(waited, 0.95) or 0.0
+        summary['latency_p99'] = self.percentile(waited, 0.99) or 0.0
+        summary['unhedged_latency_p99'] = self.percentile(unhedged, 0.99) or 0.0
+        return summary
+
+
+def fold_case(text):
+    """길이를 유지하는 소문자 변환 (일치 위치를 원문에 그대로 대응시키기 위함)"""
+    return ''.join(lower if len(lower) == 1 else char for char, lower in ((char, char.lower()) for char in text))
+
+
+# 여러 용어를 한 번의 순회로 찾는 Aho-Corasick 매처
+class AhoCorasick:
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]  # 상태 -> 끝나는 패턴 번호 목록
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+        
+        # 너비 우선으로 실패 링크 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """(시작, 끝, 패턴 번호)를 모두 반환 (겹치는 일치 포함)"""
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._output[state]:
+                yield position + 1 - len(self.patterns[index]), position + 1, index
+
+
+def select_spans(spans):
+    """겹치는 일치 중 왼쪽부터 가장 긴 것을 골라 겹치지 않는 목록으로 정리"""
+    selected = []
+    end = 0
+    for span in sorted(spans, key=lambda span: (span[0], span[0] - span[1])):
+        if span[0] >= end:
+            selected.append(span)
+            end = span[1]
+    return selected
+
+
+# 번호 역참조(\1)나 번호 조건((?(1)...))이 있는 정규식은 다른 패턴과 묶으면 그룹 번호가 달라진다
+GROUP_NUMBER_REFERENCE_PATTERN = re.compile(r'\\(?:([1-9])|.)|\(\?\((\d)', re.S)
+
+
+def has_group_number_reference(pattern):
+    """정규식에 그룹 번호를 참조하는 부분이 있는지 확인 (이스케이프된 역슬래시는 제외)"""
+    return any(match.group(1) or match.group(2) for match in GROUP_NUMBER_REFERENCE_PATTERN.finditer(pattern))
+
+
+# 사용자 용어집/정규식 규칙으로 API 없이 이름을 번역하는 로컬 규칙 엔진
+class RuleEngine:
+    """한 줄에 규칙 하나 (# 으로 시작하면 주석)
+
+        원문 = 번역                 용어집 (대소문자 구분 없음)
+        re:IMG_(\\d+) = 사진_\\1        정규식 규칙 (역참조 사용 가능)
+
+    이름(확장자 제외)에서 글자가 모두 용어집/규칙 일치로 덮이면 로컬에서 번역을 끝내고,
+    그렇지 않으면 이름에 나온 용어만 프롬프트 힌트로 넘긴다.
+    """
+    def __init__(self, glossary=None, regex_rules=None):
+        self.glossary = dict(glossary or {})
+        self.regex_rules = list(regex_rules or [])  # (패턴 문자열, 치환 문자열)
+        self._terms = list(self.glossary)
+        self._matcher = AhoCorasick(fold_case(term) for term in self._terms)
+        # 정규식 규칙은 이름 붙은 그룹의 대안으로 묶어 한 번에 검색하고,
+        # 그룹 번호를 참조하는 규칙은 묶으면 번호가 달라지므로 따로 검색
+        self._regexes = [re.compile(pattern) for pattern, _ in self.regex_rules]
+        combined_indexes = [
+            index for index, (pattern, _) in enumerate(self.regex_rules)
+            if not has_group_number_reference(pattern)
+        ]
+        try:
+            self._combined = re.compile('|'.join(
+                f'(?P<r{index}>{self.regex_rules[index][0]})' for index in combined_indexes
+            )) if combined_indexes else None
+        except re.error:
+            # 규칙 사이에 같은 이름의 그룹이 있는 경우 등은 모두 따로 검색
+            self._combined = None
+            combined_indexes = []
+        self._separate_indexes = sorted(set(range(len(self.regex_rules))) - set(combined_indexes))
+
+    @classmethod
+    def from_text(cls, text):
+        """규칙 텍스트 파싱 (잘못된 줄이 있으면 ValueError)"""
+        glossary = {}
+        regex_rules = []
+        for line_number, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '=' not in line:
+                raise ValueError(f"{line_number}번째 줄: '원문 = 번역' 형식이 아닙니다.")
+            source, target = (part.strip() for part in line.split('=', 1))
+            if not source:
+                raise ValueError(f"{line_number}번째 줄: 원문이 비어 있습니다.")
+            if source.startswith('re:'):
+                pattern = source[3:].strip()
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"{line_number}번째 줄: 잘못된 정규식입니다 ({str(e)})")
+                regex_rules.append((pattern, target))
+            else:
+                glossary[unicodedata.normalize('NFC', source)] = target
+        return cls(glossary, regex_rules)
+
+    def __bool__(self):
+        return bool(self.glossary or self.regex_rules)
+
+    def _find_spans(self, text):
+        """(시작, 끝, 치환 문자열, 용어) 목록 - 용어는 정규식 일치면 None"""
+        spans = []
+        if self._combined is not None:
+            for match in self._combined.finditer(text):
+                if match.end() == match.start():
+                    continue
+                index = int(match.lastgroup[1:])
+                # 묶음 패턴에서는 그룹 번호가 달라지므로 해당 규칙으로 다시 일치시켜 치환
+                rule_match = self._regexes[index].match(text, match.start())
+                replacement = rule_match.expand(self.regex_rules[index][1]) if rule_match else match.group()
+                spans.append((match.start(), match.end(), replacement, None))
+        for index in self._separate_indexes:
+            for match in self._regexes[index].finditer(text):
+                if match.end() > match.start():
+                    spans.append((match.start(), match.end(), match.expand(self.regex_rules[index][1]), None))
+        for start, end, index in self._matcher.iter_matches(fold_case(text)):
+            term = self._terms[index]
+            spans.append((start, end, self.glossary[term], term))
+        return select_spans(spans)
+
+    def resolve(self, name):
+        """(로컬 번역 결과 또는 None, 이름에 나온 용어집 용어 목록) 반환"""
+        name = unicodedata.normalize('NFC', name)
+        stem, ext = os.path.splitext(name)
+        spans = self._find_spans(stem)
+        terms = [span[3] for span in spans if span[3] is not None]
+        if not spans:
+            return None, terms
+        
+        # 일치하지 않은 부분에 글자가 없으면(숫자/공백/기호만) 로컬 번역 완료
+        parts = []
+        position = 0
+        for start, end, replacement, _ in spans:
+            gap = stem[position:start]
+            if any(char.isalpha() for char in gap):
+                return None, terms
+            parts.append(gap)
+            parts.append(replacement)
+            position = end
+        tail = stem[position:]
+        if any(char.isalpha() for char in tail):
+            return None, terms
+        parts.append(tail)
+        return ''.join(parts) + ext, terms
+
+    def glossary_hint(self, terms):
+        """프롬프트에 넣을 용어집 힌트 문자열"""
+        return "\n".join(f"{term} → {self.glossary[term]}" for term in sorted(set(terms)))
+
+
+# 시리즈(번호만 다른 이름 묶음) 감지
+SERIES_NUMBER_PATTERN = re.compile(r'\d+')
+SERIES_PLACEHOLDER_PATTERN = re.compile(r'\{(\d+)\}')
+MIN_SERIES_SIZE = 3  # 이 개수 이상일 때만 템플릿 하나로 묶어서 번역
+
+
+class SeriesFamily:
+    """숫자 부분만 다른 이름 묶음 (템플릿 하나를 번역해 멤버 이름으로 펼침)"""
+    def __init__(self, template, members):
+        self.template = template  # 바뀌는 숫자 자리를 {1}, {2}... 로 바꾼 이름
+        self.members = members  # (원본 이름, 자리별 숫자 문자열 목록)
+        self.slot_count = len(members[0][1]) if members else 0
+
+    def expand(self, translated):
+        """번역된 템플릿을 멤버별 이름으로 펼침 (자리표시자가 정확히 남아 있지 않으면 None)"""
+        found = sorted(int(number) for number in SERIES_PLACEHOLDER_PATTERN.findall(translated))
+        if found != list(range(1, self.slot_count + 1)):
+            return None
+        return [
+            (name, SERIES_PLACEHOLDER_PATTERN.sub(lambda m: values[int(m.group(1)) - 1], translated))
+            for name, values in self.members
+        ]
+
+
+def group_series(names, min_size=MIN_SERIES_SIZE):
+    """이름을 문자/숫자 구간으로 나눠 숫자만 다른 묶음을 찾아 (요청 항목 목록, 템플릿 -> SeriesFamily) 반환
+
+    요청 항목 목록은 중복을 제거한 이름 순서를 유지하며, 묶음은 첫 멤버 위치에 템플릿 하나로 들어간다.
+    """
+    groups = {}
+    for name in dict.fromkeys(names):
+        texts = SERIES_NUMBER_PATTERN.split(name)
+        # 숫자가 없거나, 자리표시자와 헷갈리는 중괄호가 있거나, 번역할 글자가 없으면 묶지 않음
+        stem = os.path.splitext(name)[0]
+        if len(texts) < 2 or '{' in name or '}' in name or not any(ch.isalpha() for ch in SERIES_NUMBER_PATTERN.sub('', stem)):
+            groups[(name,)] = [name]
+            continue
+        groups.setdefault(tuple(texts), []).append(name)
+
+    items = []
+    families = {}
+    for texts, members in groups.items():
+        if len(members) < min_size:
+            items.extend(members)
+            continue
+        numbers = [SERIES_NUMBER_PATTERN.findall(name) for name in members]
+        # 모든 멤버가 같은 값인 숫자 자리는 템플릿에 그대로 두고, 바뀌는 자리만 자리표시자로 사용
+        variable = [i for i in range(len(numbers[0])) if len({values[i] for values in numbers}) > 1]
+        parts = [texts[0]]
+        for i in range(len(numbers[0])):
+            parts.append(f"{{{variable.index(i) + 1}}}" if i in variable else numbers[0][i])
+            parts.append(texts[i + 1])
+        template = ''.join(parts)
+        families[template] = SeriesFamily(template, [
+            (name, [values[i] for i in variable]) for name, values in zip(members, numbers)
+        ])
+        items.append(template)
+
+    # 원래 순서 유지 (템플릿은 첫 멤버 위치)
+    first_position = {}
+    for position, name in enumerate(dict.fromkeys(names)):
+        first_position.setdefault(name, position)
+    items.sort(key=lambda item: first_position[families[item].members[0][0]] if item in families else first_position[item])
+    return items, families
+
+
+# 유니코드 문자 체계(스크립트) 감지 - 이미 대상 언어인 이름은 번역 요청에서 제외
+SCRIPT_LATIN = 0x01
+SCRIPT_HANGUL = 0x02
+SCRIPT_HIRAGANA = 0x04
+SCRIPT_KATAKANA = 0x08
+SCRIPT_HAN = 0x10
+SCRIPT_OTHER = 0x20  # 표에 없는 그 밖의 문자 (키릴 문자 등)
+
+# (시작, 끝, 스크립트) 코드포인트 범위표 - 시작 순으로 정렬
+SCRIPT_RANGES = [
+    (0x0041, 0x005A, SCRIPT_LATIN),
+    (0x0061, 0x007A, SCRIPT_LATIN),
+    (0x00C0, 0x00D6, SCRIPT_LATIN),
+    (0x00D8, 0x00F6, SCRIPT_LATIN),
+    (0x00F8, 0x024F, SCRIPT_LATIN),
+    (0x1100, 0x11FF, SCRIPT_HANGUL),
+    (0x1E00, 0x1EFF, SCRIPT_LATIN),
+    (0x3005, 0x3005, SCRIPT_HAN),
+    (0x3041, 0x309F, SCRIPT_HIRAGANA),
+    (0x30A0, 0x30FF, SCRIPT_KATAKANA),
+    (0x3130, 0x318F, SCRIPT_HANGUL),
+    (0x31F0, 0x31FF, SCRIPT_KATAKANA),
+    (0x3400, 0x4DBF, SCRIPT_HAN),
+    (0x4E00, 0x9FFF, SCRIPT_HAN),
+    (0xA960, 0xA97F, SCRIPT_HANGUL),
+    (0xAC00, 0xD7FF, SCRIPT_HANGUL),
+    (0xF900, 0xFAFF, SCRIPT_HAN),
+    (0xFF21, 0xFF3A, SCRIPT_LATIN),
+    (0xFF41, 0xFF5A, SCRIPT_LATIN),
+    (0xFF66, 0xFF9F, SCRIPT_KATAKANA),
+    (0xFFA0, 0xFFDC, SCRIPT_HANGUL),
+    (0x20000, 0x2FA1F, SCRIPT_HAN),
+]
+_SCRIPT_RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
+
+# 언어별로 이미 그 언어라고 볼 수 있는 스크립트 조합 (필수 스크립트, 허용 스크립트)
+LANGUAGE_SCRIPTS = {
+    'korean': (SCRIPT_HANGUL, SCRIPT_HANGUL),
+    'english': (SCRIPT_LATIN, SCRIPT_LATIN),
+    'japanese': (SCRIPT_HIRAGANA | SCRIPT_KATAKANA, SCRIPT_HIRAGANA | SCRIPT_KATAKANA | SCRIPT_HAN),
+}
+
+
+def char_script(char):
+    """문자 하나의 스크립트 비트 (숫자/기호/공백 등 공통 문자는 0)"""
+    code = ord(char)
+    position = bisect.bisect_right(_SCRIPT_RANGE_STARTS, code) - 1
+    if position >= 0:
+        _, end, script = SCRIPT_RANGES[position]
+        if code <= end:
+            return script
+    return SCRIPT_OTHER if char.isalpha() else 0
+
+
+def classify_scripts(names):
+    """이름 목록의 스크립트 비트 조합을 array('B')로 반환 (확장자 제외, 문자별 결과는 묶음 전체에서 재사용)"""
+    char_cache = {char: char_script(char) for char in map(chr, range(128))}
+    masks = array('B')
+    for name in names:
+        mask = 0
+        for char in os.path.splitext(name)[0]:
+            script = char_cache.get(char)
+            if script is None:
+                script = char_cache[char] = char_script(char)
+            mask |= script
+        masks.append(mask)
+    return masks
+
+
+def is_already_translated(mask, languages):
+    """번역할 글자가 없거나, 요청한 모든 언어의 문자로만 이루어진 이름인지 확인"""
+    if not mask:
+        return True
+    for language in languages:
+        required, allowed = LANGUAGE_SCRIPTS[language]
+        if not (mask & required) or (mask & ~allowed):
+            return False
+    return True
+
+
+# 작업 스레드의 취소/일시정지 제어 (UI 스레드에서 호출)
+class RunControl:
+    """대기(sleep) 중에도 즉시 깨어나는 협조적 취소/일시정지 상태"""
+    def __init__(self):
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def paused(self):
+        return not self._resume_event.is_set()
+
+    def cancel(self):
+        """취소 요청 (일시정지 중이어도 바로 깨움)"""
+        self._cancel_event.set()
+        self._resume_event.set()
+
+    def pause(self):
+        if not self.cancelled:
+            self._resume_event.clear()
+
+    def resume(self):
+        self._resume_event.set()
+
+    def sleep(self, seconds):
+        """지정 시간 대기 (취소되면 즉시 반환), 취소 여부 반환"""
+        return self._cancel_event.wait(seconds)
+
+    def wait_if_paused(self):
+        """일시정지 중이면 재개/취소될 때까지 대기, 계속 진행할 수 있으면 True"""
+        self._resume_event.wait()
+        return not self.cancelled
+
+
+# 번역 결과를 청크 단위로 저장하는 체크포인트 (중단된 실행을 이어서 번역)
+class RunCheckpoint:
+    """루트 경로와 번역 설정별 JSONL 파일에 완료된 번역 결과를 추가 기록한다.
+
+    첫 줄은 루트 경로/설정 정보이고, 이후 각 줄은 번역 결과 하나다.
+    강제 종료로 마지막 줄이 잘려도 나머지 결과는 그대로 읽을 수 있다.
+    """
+    def __init__(self, root_path, settings):
+        self.root_path = os.path.normpath(root_path)
+        self.settings = settings
+        settings_key = hashlib.sha1(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(self.checkpoint_dir(), f"{self.root_key(root_path)}_{settings_key}.jsonl")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, root_path, languages, model_name, custom_prompt, rule_engine=None):
+        """번역 설정별 체크포인트 (화면 번역과 작업 대기열이 같은 파일을 이어서 사용)
+
+        용어집/규칙이 바뀌면 로컬 번역 결과가 달라지므로 다른 체크포인트를 사용한다.
+        """
+        rules = [sorted(rule_engine.glossary.items()), rule_engine.regex_rules] if rule_engine else []
+        return cls(root_path, {
+            'languages': languages,
+            'model': model_name,
+            'custom_prompt': custom_prompt,
+            'rules': rules,
+        })
+
+    @staticmethod
+    def checkpoint_dir():
+        """체크포인트 파일 저장 디렉토리"""
+        base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation) or os.path.expanduser('~')
+        return os.path.join(base_dir, 'checkpoints')
+
+    @staticmethod
+    def root_key(root_path):
+        """루트 경로 식별용 해시"""
+        normalized = os.path.normcase(os.path.normpath(root_path))
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def exists_for_root(cls, root_path):
+        """설정과 관계없이 해당 루트 경로의 체크포인트가 있는지 여부"""
+        return bool(glob.glob(os.path.join(cls.checkpoint_dir(), f"{cls.root_key(root_path)}_*.jsonl")))
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def load(self):
+        """저장된 번역 결과 목록 반환 (원본 이름 기준으로 마지막 결과만 유지)"""
+        results = {}
+        if not self.exists():
+            return []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 줄은 무시
+                    continue
+                if 'original' in record:
+                    results[record['original']] = record
+        return list(results.values())
+
+    def start(self):
+        """체크포인트 파일이 없으면 헤더와 함께 생성"""
+        if self.exists():
+            # 강제 종료로 마지막 줄이 잘렸으면 새 기록이 이어 붙지 않도록 줄바꿈 추가
+            with open(self.path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            header = {'checkpoint': 1, 'root': self.root_path, 'settings': self.settings, 'created': time.time()}
+            f.write(json.dumps(header, ensure_ascii=False) + '\n')
+
+    def append(self, results):
+        """완료된 청크의 번역 결과를 즉시 기록"""
+        if not results:
+            return
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for result in results:
+                    f.write(json.dumps(result, ensure_ascii=False) + '\n')
+                f.flush()
+
+    def remove(self):
+        """체크포인트 파일 삭제"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"체크포인트 삭제 실패: {str(e)}")
+
+
+# 팀이 함께 쓰는 번역 캐시 서버(cache_server.py) 클라이언트
+class SharedTranslationCache:
+    """(이름, 언어, 모델, 프롬프트 해시)별 번역을 서버에 묶음으로 조회/기록한다.
+
+    받은 번역은 프로세스 메모리 캐시에도 두어 다음 실행에서는 서버에 다시 묻지 않으며,
+    서버에 연결할 수 없으면 경고만 남기고 잠시 동안 캐시 없이 번역을 진행한다.
+    """
+    LOOKUP_BATCH = 500
+    STORE_BATCH = 200
+    TIMEOUT = 2.0
+    RETRY_AFTER = 60.0  # 연결 실패 후 다시 시도하기까지 대기 (초)
+    FRONT_CACHE_LIMIT = 200000
+
+    _front = {}  # (서버, 모델, 프롬프트 해시, 언어, 이름) -> 번역 (실행 간 공유)
+    _front_lock = threading.Lock()
+    _down_until = {}  # 서버 -> 다시 연결을 시도할 시각
+
+    def __init__(self, base_url, model_name, prompt_hash):
+        self.base_url = base_url.rstrip('/')
+        self.model_name = model_name
+        self.prompt_hash = prompt_hash
+        self._pending = []  # 서버에 아직 기록하지 않은 번역
+        self._lock = threading.Lock()
+
+    def _key(self, language, name):
+        return self.base_url, self.model_name, self.prompt_hash, language, name
+
+    def _remember(self, entries):
+        """(언어, 이름, 번역) 목록을 메모리 캐시에 추가 (한도를 넘으면 오래된 것부터 제거)"""
+        with self._front_lock:
+            front = self._front
+            for language, name, translated in entries:
+                front[self._key(language, name)] = translated
+            while len(front) > self.FRONT_CACHE_LIMIT:
+                del front[next(iter(front))]
+
+    def _post(self, path, payload):
+        """서버에 JSON 요청을 보내고 응답 반환 (서버를 쓸 수 없으면 None)"""
+        if time.monotonic() < self._down_until.get(self.base_url, 0.0):
+            return None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except (OSError, ValueError, http.client.HTTPException) as e:
+            self._down_until[self.base_url] = time.monotonic() + self.RETRY_AFTER
+            logger.warning(f"공유 캐시 서버를 사용할 수 없어 {self.RETRY_AFTER:.0f}초 동안 캐시 없이 진행: {self.base_url} - {str(e)}")
+            return None
+
+    def lookup(self, names, languages):
+        """모든 언어의 번역이 캐시에 있는 이름만 {이름: {언어: 번역}}으로 반환"""
+        found = {}
+        missing = []
+        with self._front_lock:
+            front = self._front
+            for name in names:
+                translations = {lang: front.get(self._key(lang, name)) for lang in languages}
+                if all(translations.values()):
+                    found[name] = translations
+                else:
+                    missing.append(name)
+        for start in range(0, len(missing), self.LOOKUP_BATCH):
+            response = self._post('/lookup', {
+                'model': self.model_name,
+                'prompt_hash': self.prompt_hash,
+                'languages': languages,
+                'names': missing[start:start + self.LOOKUP_BATCH],
+            })
+            if response is None:
+                break
+            remembered = []
+            for name, translations in (response.get('results') or {}).items():
+                remembered.extend((lang, name, text) for lang, text in translations.items() if text)
+                if all(translations.get(lang) for lang in languages):
+                    found[name] = {lang: translations[lang] for lang in languages}
+            self._remember(remembered)
+        return found
+
+    def store(self, results):
+        """새로 번역한 결과를 메모리 캐시에 넣고, 모이면 서버에 기록하여 기록한 이름 수 반환"""
+        entries = [{'name': result['original'], 'translations': result['translations']} for result in results]
+        if not entries:
+            return 0
+        self._remember((lang, entry['name'], text) for entry in entries for lang, text in entry['translations'].items())
+        with self._lock:
+            self._pending.extend(entries)
+            ready = len(self._pending) >= self.STORE_BATCH
+        return self.flush() if ready else 0
+
+    def flush(self):
+        """기록하지 않은 번역을 서버로 전송하고 기록한 이름 수 반환 (서버를 쓸 수 없으면 버림)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        stored = 0
+        for start in range(0, len(pending), self.STORE_BATCH):
+            batch = pending[start:start + self.STORE_BATCH]
+            if self._post('/store', {'model': self.model_name, 'prompt_hash': self.prompt_hash, 'entries': batch}) is None:
+                break
+            stored += len(batch)
+        return stored
+
+
+# 번역 요청 준비와 응답 처리 (화면 번역과 작업 대기열이 함께 사용)
+class TranslationPipeline:
+    """번역 설정 하나로 이름 목록을 번역하는 단계를 묶는다.
+
+    - 요청 전: 용어집/규칙 로컬 번역 -> 공유 캐시 조회 -> 시리즈 묶기 (prepare)
+    - 요청: API 키별 모델로 청크 하나를 번역하고 응답 시간을 기록 (translate_request)
+    - 응답 후: 재시도, 시리즈 펼치기, 체크포인트/공유 캐시 기록 (complete_request)
+    요청 배정과 키 풀, UI 신호는 실행하는 쓰레드(TranslationThread, JobQueueThread)가 맡는다.
+    """
+    def __init__(self, filenames, language, chunk_size=10, model_name="gemini-2.0-flash", custom_prompt=None, extra_languages=None, checkpoint=None, completed_translations=None, rule_engine=None, adaptive_chunk=False, shared_cache_url=None, label=None):
+        self.filenames = list(dict.fromkeys(filenames))  # 같은 이름은 한 번만 번역
+        self.checkpoint = checkpoint  # 청크 완료 시마다 결과를 기록할 체크포인트
+        self.completed_translations = completed_translations or []  # 이전 실행에서 이미 받은 결과
+        self.log_prefix = f"{label} - " if label else ""  # 로그에서 작업을 구분할 이름 (작업 대기열의 기준 폴더)
         self.language = language
+        # 함께 번역할 언어 목록 (첫 번째가 기본 언어)
+        self.languages = [language] + [lang for lang in (extra_languages or []) if lang != language]
         self.chunk_size = chunk_size
-        self.delay_time = delay_time
+        # 청크 크기 자동 조절 (chunk_size는 시작 크기로 사용)
+        self.chunk_sizer = AdaptiveChunkSizer(chunk_size) if adaptive_chunk else None
         self.model_name = model_name
         self.custom_prompt = custom_prompt
+        self.rule_engine = rule_engine  # 용어집/정규식 규칙 (API 호출 전 로컬 번역)
+        # 팀 공유 번역 캐시 (주소가 있으면 API 호출 전에 조회하고 받은 번역을 기록)
+        self.shared_cache = SharedTranslationCache(shared_cache_url, model_name, self.prompt_hash()) if shared_cache_url else None
+        self.glossary_terms = {}  # 원본 이름 -> 이름에 나온 용어집 용어
+        self.series_families = {}  # 템플릿 -> 숫자만 다른 이름 묶음
+        self.series_member_template = {}  # 시리즈 멤버 이름 -> 템플릿
+        self.retried_names = set()  # 응답에서 빠지거나 마감 시간을 넘겨 이미 한 번 다시 요청한 이름
+        self.total_chunks = 0  # 보낼 청크 수 (로그 표시용)
+        self.sent_chunks = 0
+        self.metrics = RunMetrics()
+        self.hedger = RequestHedger()  # 응답 시간 분위수 기반 요청 마감 시간/중복 요청
+        self._models = {}  # API 키 -> 모델 객체
         self.templates = {
             'korean': """
 # 파일명 번역 시스템 프롬프트
@@ -76,98 +1281,616 @@ Custom User Prompt:
 
 カスタムユーザープロンプト:
 {custom_prompt}
+""",
+            'multi': """
+# 다국어 파일명 번역 시스템 프롬프트
+- 이것은 파일명을 여러 언어로 동시에 번역하기 위한 AI 시스템입니다.
+- 입력은 한 줄에 하나의 파일명입니다. 입력 줄마다 JSON 배열 요소 하나를 입력과 같은 순서로 반환하세요.
+- 각 요소의 "original"에는 입력 파일명을 그대로 넣고, {languages} 키에는 해당 언어로 번역한 파일명을 넣으세요.
+- 파일명의 의미를 정확하게 파악하고, 각 언어 사용자가 이해하기 쉽게 번역하세요.
+- 파일명에 사용할 수 없는 특수문자(/, \, :, *, ?, ", <, >, |)는 사용하지 마세요.
+- 파일 확장자(.txt, .jpg 등)는 번역하지 않고 그대로 유지하세요.
+- 파일명은 간단명료하게 유지하고, 불필요한 조사나 특수문자를 추가하지 마세요.
+
+사용자 정의 프롬프트:
+{custom_prompt}
 """
         }
     
+    def build_template(self):
+        """시스템 지시문으로 사용할 번역 템플릿 생성 (사용자 정의 프롬프트를 기본 템플릿에 추가)"""
+        custom_prompt = self.custom_prompt if self.custom_prompt else "사용자 정의 프롬프트가 없습니다."
+        if len(self.languages) > 1:
+            return self.templates['multi'].format(languages=", ".join(self.languages), custom_prompt=custom_prompt)
+        base_template = self.templates.get(self.language.lower(), self.templates['korean'])
+        return base_template.format(custom_prompt=custom_prompt)
+    
+    def multi_generation_config(self):
+        """다국어 번역용 구조화(JSON) 출력 설정"""
+        properties = {'original': {'type': 'string'}}
+        for lang in self.languages:
+            properties[lang] = {'type': 'string'}
+        return genai.types.GenerationConfig(
+            temperature=GENERATION_CONFIG.temperature,
+            response_mime_type="application/json",
+            response_schema={
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': properties,
+                    'required': ['original'] + self.languages
+                }
+            }
+        )
+    
+    def parse_multi_response(self, chunk, response_text):
+        """다국어 JSON 응답을 청크 순서에 맞춰 언어별 번역 딕셔너리 목록으로 변환"""
+        try:
+            data = json.loads(response_text)
+        except ValueError:
+            logger.warning("다국어 번역 응답을 JSON으로 해석할 수 없습니다.")
+            return [None] * len(chunk)
+        if not isinstance(data, list):
+            data = [data]
+        
+        # 원본 파일명으로 먼저 매칭하고, 없으면 순서로 매칭
+        by_original = {entry.get('original'): entry for entry in data if isinstance(entry, dict)}
+        parsed = []
+        for j, original_name in enumerate(chunk):
+            entry = by_original.get(original_name)
+            if entry is None and j < len(data) and isinstance(data[j], dict):
+                entry = data[j]
+            if entry is None:
+                parsed.append(None)
+                continue
+            translations = {}
+            for lang in self.languages:
+                value = str(entry.get(lang) or '').strip()
+                if value:
+                    translations[lang] = value
+            parsed.append(translations)
+        return parsed
+    
+    def translate_chunk(self, model, chunk, timeout=None):
+        """청크 하나를 번역하여 결과 목록 반환 (번역 결과가 없는 항목은 제외, timeout은 요청 마감 시간)"""
+        # 파일명들을 개행으로 구분된 하나의 텍스트로 변환
+        input_text = "\n".join(chunk)
+        
+        # 번역 요청을 위한 메시지 배열 생성 (템플릿은 시스템 지시문에 있으므로 파일명만 전송)
+        parts = [{"text": input_text}]
+        
+        # 청크의 이름에 나온 용어집 용어만 힌트로 추가
+        terms = [term for name in chunk for term in self.glossary_terms.get(name, ())]
+        if terms:
+            hint = self.rule_engine.glossary_hint(terms)
+            parts.insert(0, {"text": f"다음 용어집의 번역을 그대로 사용하세요 (용어집은 응답에 포함하지 마세요):\n{hint}\n\n번역할 파일명:"})
+        if any(name in self.series_families for name in chunk):
+            parts.insert(0, {"text": "{1}, {2} 같은 중괄호 자리표시자는 번역하지 말고 번역된 이름의 알맞은 위치에 그대로 남겨 두세요."})
+        
+        messages = [
+            {"role": "user", "parts": parts}
+        ]
+        
+        # Gemini API 호출 (여러 언어는 한 번의 요청으로 구조화된 출력을 받음)
+        logger.info(f"Gemini API 요청 - 언어: {', '.join(self.languages)}, 입력 길이: {len(input_text)}")
+        request_options = {'timeout': timeout} if timeout else None
+        request_started = time.monotonic()
+        if len(self.languages) > 1:
+            response = model.generate_content(messages, generation_config=self.multi_generation_config(),
+                                              request_options=request_options)
+        else:
+            response = model.generate_content(messages, request_options=request_options)
+        elapsed = time.monotonic() - request_started
+        self.metrics.record_response(response, elapsed)
+        self.hedger.record_latency(elapsed)
+        
+        # 응답 텍스트 획득
+        translated_text = response.text.strip()
+        logger.info(f"배치 번역 완료. 응답 길이: {len(translated_text)}")
+        
+        if len(self.languages) > 1:
+            parsed = self.parse_multi_response(chunk, translated_text)
+        else:
+            # 번역된 결과를 줄별로 분리
+            translated_lines = translated_text.split('\n')
+            parsed = [
+                {self.language: translated_lines[j].strip()} if j < len(translated_lines) else None
+                for j in range(len(chunk))
+            ]
+        
+        # 원본 파일명과 번역된 파일명을 매핑
+        results = []
+        for original_name, translations in zip(chunk, parsed):
+            if translations is None:
+                logger.warning(f"번역 결과 누락: {original_name}")
+                continue
+            if not translations.get(self.language):  # 빈 문자열이 아닌 경우만 추가
+                continue
+            results.append({
+                'original': original_name,
+                'translated': translations[self.language],
+                'translations': translations
+            })
+        return results
+    
+    def get_model_for_key(self, api_key, template):
+        """API 키별 모델 객체 반환 (컨텍스트 캐시는 키마다 따로 등록)"""
+        # 요청마다 연결 사용 시각을 갱신하고, 유휴 연결이 갱신되어 닫혔으면 새 연결의 모델로 교체
+        manager = GeminiClientManager.instance()
+        client = manager.get_client(api_key)
+        model = self._models.get(api_key)
+        if model is None or model._client is not client:
+            # 템플릿은 시스템 지시문으로 한 번만 등록하고, 가능하면 컨텍스트 캐시를 사용
+            # (연결 및 모델 객체는 실행 간에 재사용되어 설정 비용은 최초 1회만 발생)
+            model = manager.get_cached_model(api_key, self.model_name, template)
+            if model is not None:
+                self.metrics.context_cache = True
+            else:
+                model = manager.get_model(api_key, self.model_name, template)
+            self._models[api_key] = model
+        return model
+    
+    def resolve_with_rules(self, all_translations):
+        """용어집/규칙으로 번역되는 이름은 결과에 바로 추가하고, API로 보낼 이름 목록 반환
+
+        용어집은 기본 언어 기준이므로 여러 언어를 함께 번역할 때는 로컬 번역을 하지 않고
+        용어 힌트만 사용한다.
+        """
+        if not self.rule_engine:
+            return list(self.filenames)
+        
+        names_to_send = []
+        offline_results = []
+        for name in self.filenames:
+            resolved, terms = self.rule_engine.resolve(name)
+            if resolved and len(self.languages) == 1:
+                offline_results.append({
+                    'original': name,
+                    'translated': resolved,
+                    'translations': {self.language: resolved}
+                })
+                continue
+            if terms:
+                self.glossary_terms[name] = terms
+            names_to_send.append(name)
+        
+        all_translations.extend(offline_results)
+        self.metrics.offline_resolved = len(offline_results)
+        logger.info(f"용어집/규칙으로 로컬 번역: {len(offline_results)}개, API 요청 대상: {len(names_to_send)}개")
+        return names_to_send
+    
+    def prompt_hash(self):
+        """공유 캐시 키에 쓸 프롬프트 해시 (사용자 정의 프롬프트나 용어집/규칙이 바뀌면 달라짐)
+
+        언어는 캐시 키에 따로 들어가므로, 한 언어만 번역한 결과와 여러 언어를 함께 번역한 결과를 같이 쓴다.
+        """
+        rules = [sorted(self.rule_engine.glossary.items()), self.rule_engine.regex_rules] if self.rule_engine else []
+        payload = json.dumps([self.custom_prompt or '', rules], ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+    
+    def resolve_with_shared_cache(self, names, all_translations):
+        """공유 캐시에 모든 언어의 번역이 있는 이름은 결과에 바로 추가하고, API로 보낼 이름 목록 반환"""
+        if self.shared_cache is None or not names:
+            return names
+        cached = self.shared_cache.lookup(names, self.languages)
+        if not cached:
+            return names
+        cached_results = [{
+            'original': name,
+            'translated': cached[name][self.language],
+            'translations': cached[name]
+        } for name in names if name in cached]
+        all_translations.extend(cached_results)
+        if self.checkpoint is not None:
+            self.checkpoint.append(cached_results)
+        self.metrics.shared_cache_hits = len(cached_results)
+        logger.info(f"공유 캐시에서 번역 {len(cached_results)}개를 받아 요청하지 않습니다.")
+        return [name for name in names if name not in cached]
+    
+    def store_shared_cache(self, chunk_results):
+        """API로 새로 받은 번역을 공유 캐시에 기록 (일정 개수가 모이면 서버로 전송)"""
+        if self.shared_cache is not None:
+            self.metrics.shared_cache_stored += self.shared_cache.store(chunk_results)
+    
+    def flush_shared_cache(self):
+        """공유 캐시에 아직 보내지 않은 번역을 전송"""
+        if self.shared_cache is not None:
+            self.metrics.shared_cache_stored += self.shared_cache.flush()
+    
+    def group_series(self, names):
+        """숫자만 다른 이름 묶음을 템플릿 하나로 바꾼 요청 목록 반환"""
+        items, self.series_families = group_series(names)
+        self.series_member_template = {
+            name: template for template, family in self.series_families.items() for name, _ in family.members
+        }
+        for template, family in self.series_families.items():
+            terms = self.glossary_terms.get(family.members[0][0])
+            if terms:
+                self.glossary_terms[template] = terms
+        member_count = sum(len(family.members) for family in self.series_families.values())
+        self.metrics.series_families = len(self.series_families)
+        self.metrics.series_members = member_count
+        if self.series_families:
+            logger.info(f"시리즈 감지: {len(self.series_families)}개 묶음, {member_count}개 이름을 템플릿으로 번역")
+        return items
+    
+    def item_weight(self, name):
+        """요청 항목 하나가 대신하는 원본 이름 수 (진행률 계산용)"""
+        family = self.series_families.get(name)
+        return len(family.members) if family else 1
+    
+    def expand_series(self, chunk_results):
+        """템플릿 번역 결과를 멤버별 결과로 펼치고, (결과 목록, 개별로 다시 번역할 이름 목록) 반환"""
+        results = []
+        fallback_names = []
+        for result in chunk_results:
+            family = self.series_families.get(result['original'])
+            if family is None:
+                results.append(result)
+                continue
+            expanded = {lang: family.expand(name) for lang, name in result['translations'].items()}
+            if any(members is None for members in expanded.values()):
+                # 자리표시자가 사라졌거나 바뀌면 멤버를 하나씩 따로 번역
+                logger.warning(f"시리즈 템플릿 자리표시자 불일치, 개별 번역으로 전환: {result['original']} -> {result['translated']}")
+                fallback_names.extend(name for name, _ in family.members)
+                self.metrics.series_families -= 1
+                self.metrics.series_members -= len(family.members)
+                continue
+            for j, (name, _) in enumerate(family.members):
+                translations = {lang: members[j][1] for lang, members in expanded.items()}
+                results.append({
+                    'original': name,
+                    'translated': translations[self.language],
+                    'translations': translations
+                })
+        return results, fallback_names
+    
+    def checkpoint_late_result(self, future):
+        """취소 후 도착한 응답을 체크포인트에 기록 (이미 비용을 낸 요청 결과 보존)"""
+        if self.checkpoint is None or future.cancelled() or future.exception() is not None:
+            return
+        chunk_results, _ = future.result()  # (결과, 소요 시간)
+        self.checkpoint.append(self.expand_series(chunk_results)[0])
+    
+    def prepare(self, all_translations):
+        """API로 보낼 요청 항목 목록 반환 (로컬에서 번역되는 이름의 결과는 all_translations에 추가)"""
+        # 용어집/규칙으로 완전히 번역되는 이름은 API에 보내지 않음
+        names_to_send = self.resolve_with_rules(all_translations)
+        
+        # 팀 공유 캐시에 이미 있는 번역은 API에 보내지 않음
+        names_to_send = self.resolve_with_shared_cache(names_to_send, all_translations)
+        
+        # 숫자만 다른 이름 묶음은 템플릿 하나만 요청하고 결과를 로컬에서 펼침
+        names_to_send = self.group_series(names_to_send)
+        self.total_chunks = (len(names_to_send) + self.chunk_size - 1) // self.chunk_size
+        return names_to_send
+    
+    def translate_request(self, api_key, template, chunk, timeout):
+        """API 키 하나로 청크를 번역하여 (결과 목록, 소요 시간) 반환 (요청 스레드에서 실행)"""
+        model = self.get_model_for_key(api_key, template)
+        started = time.monotonic()
+        chunk_results = self.translate_chunk(model, chunk, timeout)
+        return chunk_results, time.monotonic() - started
+    
+    def new_request(self, chunk, generation=0):
+        """청크 하나의 요청 묶음 (원 요청과 중복 요청이 함께 사용하는 상태)"""
+        self.sent_chunks += 1
+        self.hedger.record_sent()
+        return {'chunk': chunk, 'generation': generation, 'started': time.monotonic(),
+                'attempts': 0, 'hedged': False, 'done': False, 'primary_elapsed': None}
+    
+    def complete_request(self, request, outcome, finished_at, retry_chunks, is_hedge=False):
+        """결과가 정해진 요청 묶음을 처리하여 (새 번역 결과 목록, 처리를 마친 원본 이름 수) 반환
+
+        outcome은 (결과 목록, 소요 시간) 또는 예외이며, 다시 보낼 청크는 retry_chunks에 넣는다.
+        - 할당량 초과/잘못된 키: 다른 키로 다시 보내도록 맨 앞에 넣음
+        - 마감 시간 초과, 응답에서 빠진 이름: 아직 다시 요청하지 않은 이름만 한 번 더 요청
+        - 시리즈 템플릿 결과는 멤버별로 펼치고, 받은 결과는 체크포인트와 공유 캐시에 기록
+        """
+        chunk, generation = request['chunk'], request['generation']
+        failed = isinstance(outcome, Exception)
+        timed_out = failed and isinstance(outcome, (google_exceptions.DeadlineExceeded, TimeoutError))
+        self.hedger.record_completion(request, finished_at, is_hedge and not failed, timed_out)
+        if failed:
+            e = outcome
+            if self.chunk_sizer:
+                self.chunk_sizer.record_error(generation, e)
+            if isinstance(e, google_exceptions.ResourceExhausted) or is_invalid_key_error(e):
+                # 할당량 초과/잘못된 키는 다른 키로 다시 시도 (청크 크기가 줄었으면 나눠서)
+                size = self.chunk_sizer.acquire()[0] if self.chunk_sizer else len(chunk)
+                retry_chunks.extendleft(reversed([chunk[i:i + size] for i in range(0, len(chunk), size)]))
+                self.sent_chunks -= 1
+                return [], 0
+            retry_names = [name for name in chunk if name not in self.retried_names] if timed_out else []
+            if retry_names:
+                # 마감 시간 초과는 일시적인 지연일 수 있으므로 한 번만 다시 요청
+                self.retried_names.update(retry_names)
+                retry_chunks.append(retry_names)
+                logger.warning(f"{self.log_prefix}요청 마감 시간 초과, {len(retry_names)}개 항목 다시 요청: {str(e)}")
+            else:
+                # 현재 청크에서 오류가 발생해도 계속 진행 (해당 키는 잠시 쉼)
+                logger.error(f"{self.log_prefix}파일명 청크 번역 중 오류 발생: {str(e)}", exc_info=e)
+            return [], sum(self.item_weight(name) for name in chunk if name not in retry_names)
+        
+        chunk_results, elapsed = outcome
+        if self.chunk_sizer:
+            self.chunk_sizer.record_success(generation, len(chunk), len(chunk_results), elapsed)
+        # 응답에서 빠진 이름은 한 번만 다시 요청 (청크 크기가 줄었으면 작은 청크로)
+        returned_names = {result['original'] for result in chunk_results}
+        missing_names = [name for name in chunk if name not in returned_names and name not in self.retried_names]
+        if missing_names:
+            self.retried_names.update(missing_names)
+            size = self.chunk_sizer.acquire()[0] if self.chunk_sizer else self.chunk_size
+            retry_chunks.extend(missing_names[i:i + size] for i in range(0, len(missing_names), size))
+            logger.info(f"{self.log_prefix}응답에서 빠진 {len(missing_names)}개 항목 다시 요청")
+        chunk_results, fallback_names = self.expand_series(chunk_results)
+        if fallback_names:
+            chunk_size = self.chunk_size
+            retry_chunks.extend(fallback_names[i:i + chunk_size] for i in range(0, len(fallback_names), chunk_size))
+            self.total_chunks += (len(fallback_names) + chunk_size - 1) // chunk_size
+        self.store_shared_cache(chunk_results)
+        # 받은 결과는 바로 체크포인트에 기록 (중단되어도 다시 요청하지 않음)
+        if self.checkpoint is not None:
+            self.checkpoint.append(chunk_results)
+        missing = set(missing_names)
+        return chunk_results, sum(self.item_weight(name) for name in chunk if name not in missing) - len(fallback_names)
+
+
+# 번역을 위한 쓰레드 클래스
+class TranslationThread(QThread):
+    # 시그널 정의
+    progress_signal = pyqtSignal(int, int)  # (현재 번역 중인 파일 인덱스, 전체 파일 수)
+    result_signal = pyqtSignal(list)  # 번역 결과 리스트
+    partial_result_signal = pyqtSignal(list)  # 실행 중 도착한 번역 결과 묶음 (미리보기용)
+    error_signal = pyqtSignal(str)  # 오류 메시지
+    stats_signal = pyqtSignal(dict)  # 요청/토큰 사용량 통계
+    key_usage_signal = pyqtSignal(list)  # API 키별 사용량 및 상태
+    
+    def __init__(self, api_keys, filenames, language, chunk_size=10, delay_time=3, model_name="gemini-2.0-flash", custom_prompt=None, extra_languages=None, checkpoint=None, completed_translations=None, rule_engine=None, adaptive_chunk=False, shared_cache_url=None):
+        super().__init__()
+        self.api_keys = api_keys
+        self.delay_time = delay_time
+        self.control = RunControl()
+        self.pipeline = TranslationPipeline(
+            filenames, language, chunk_size, model_name, custom_prompt, extra_languages,
+            checkpoint, completed_translations, rule_engine, adaptive_chunk, shared_cache_url
+        )
+        # UI에서 먼저 번역하도록 요청한 이름 (직접 지정한 묶음 목록, 화면에 보이는 이름)
+        self._priority_lock = threading.Lock()
+        self._explicit_priority = []
+        self._viewport_priority = None
+    
+    def prioritize(self, names, explicit=False):
+        """먼저 번역할 이름 전달 (UI 스레드에서 호출)
+
+        화면에 보이는 이름은 스크롤할 때마다 새 목록으로 바뀌고,
+        직접 지정한 이름은 번역될 때까지 유지되며 최근 지정한 것이 먼저 전송된다.
+        """
+        with self._priority_lock:
+            if explicit:
+                self._explicit_priority.append(list(names))
+            else:
+                self._viewport_priority = list(names)
+    
+    def _take_priority_requests(self):
+        """UI에서 들어온 우선순위 요청을 꺼냄 (직접 지정한 묶음 목록, 보이는 이름 목록 또는 None)"""
+        with self._priority_lock:
+            explicit, self._explicit_priority = self._explicit_priority, []
+            viewport, self._viewport_priority = self._viewport_priority, None
+        return explicit, viewport
+    
     def run(self):
+        pipeline = self.pipeline
         try:
-            # API 키 설정
-            genai.configure(api_key=self.api_key)
+            # 번역 템플릿 생성
+            template = pipeline.build_template()
             
-            # 생성 설정
-            generation_config = genai.types.GenerationConfig(temperature=0.8)
-            safety_settings = [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-            ]
-            model = genai.GenerativeModel(
-                model_name=self.model_name,
-                generation_config=generation_config,
-                safety_settings=safety_settings
-            )
+            # API 키 풀 (키마다 요청 후 설정된 대기 시간만큼 쉬고, 여러 키는 동시에 사용)
+            key_pool = ApiKeyPool(self.api_keys, self.delay_time)
             
-            # 번역 템플릿 선택 (사용자 정의 프롬프트를 기본 템플릿에 추가)
-            base_template = self.templates.get(self.language.lower(), self.templates['korean'])
-            template = base_template.format(custom_prompt=self.custom_prompt if self.custom_prompt else "사용자 정의 프롬프트가 없습니다.")
+            # 결과 저장 리스트 (이어서 번역하는 경우 이전 결과 포함)
+            all_translations = list(pipeline.completed_translations)
+            total_count = len(pipeline.completed_translations) + len(pipeline.filenames)
+            if pipeline.checkpoint is not None:
+                pipeline.checkpoint.start()
             
-            # 결과 저장 리스트
-            all_translations = []
+            # 로컬 규칙/공유 캐시로 번역되는 이름을 빼고, 시리즈는 템플릿 하나로 묶은 요청 목록
+            names_to_send = pipeline.prepare(all_translations)
             
-            # 파일명 배열을 청크 크기에 맞게 나누기
-            chunk_size = self.chunk_size
-            filename_chunks = [self.filenames[i:i + chunk_size] for i in range(0, len(self.filenames), chunk_size)]
+            # 요청할 이름 대기열 (청크는 보낼 때마다 구성: 재시도 청크 -> 직접 지정 -> 화면에 보이는 이름 -> 원래 순서)
+            chunk_size = pipeline.chunk_size
+            ordered_names = deque(names_to_send)
+            unsent_names = set(names_to_send)
+            explicit_names = deque()
+            viewport_names = deque()
+            retry_chunks = deque()  # 할당량 초과 등으로 다시 보낼 청크
+            processed_count = total_count - sum(pipeline.item_weight(name) for name in names_to_send)
+            # 청크 하나의 요청 묶음은 원 요청과 중복 요청(hedge) 중 먼저 온 응답으로 끝남
+            in_flight = {}  # future -> (요청 묶음, 키 상태, 중복 요청 여부, 포기할 시각)
+            open_requests = 0  # 결과가 정해지지 않은 요청 묶음 수
             
-            # 각 청크별로 번역 처리
-            for i, chunk in enumerate(filename_chunks):
-                try:
-                    # 진행 상황 전송
-                    current_progress = i * chunk_size
-                    self.progress_signal.emit(current_progress, len(self.filenames))
-                    
-                    # 청크 처리 사이에 설정된 시간만큼 대기 (첫 번째 청크는 대기 안함)
-                    if i > 0:
-                        logger.info(f"청크 처리 사이 {self.delay_time}초 대기 중... ({i}/{len(filename_chunks)})")
-                        time.sleep(self.delay_time)
-                    
-                    # 파일명들을 개행으로 구분된 하나의 텍스트로 변환
-                    input_text = "\n".join(chunk)
-                    
-                    # 번역 요청을 위한 메시지 배열 생성
-                    messages = [
-                        {"role": "user", "parts": [{"text": template + "\n\n" + input_text}]}
-                    ]
-                    
-                    # Gemini API 호출
-                    logger.info(f"Gemini API 요청 - 언어: {self.language}, 입력 길이: {len(input_text)}, 청크: {i+1}/{len(filename_chunks)}")
-                    response = model.generate_content(messages)
+            def request_items(names):
+                # 시리즈 멤버는 템플릿으로 바꾸고, 이미 보낸 이름은 제외
+                items = (pipeline.series_member_template.get(name, name) for name in names)
+                return [item for item in items if item in unsent_names]
+            
+            def update_priorities():
+                explicit, viewport = self._take_priority_requests()
+                for names in explicit:
+                    explicit_names.extendleft(reversed(request_items(names)))
+                if viewport is not None:
+                    viewport_names.clear()
+                    viewport_names.extend(request_items(viewport))
+            
+            def has_pending():
+                return bool(retry_chunks or unsent_names)
+            
+            def next_chunk():
+                if retry_chunks:
+                    return retry_chunks.popleft()
+                size = pipeline.chunk_sizer.acquire()[0] if pipeline.chunk_sizer else chunk_size
+                chunk = []
+                for queue in (explicit_names, viewport_names, ordered_names):
+                    while queue and len(chunk) < size:
+                        name = queue.popleft()
+                        if name in unsent_names:
+                            unsent_names.discard(name)
+                            chunk.append(name)
+                return chunk
+            
+            def submit_attempt(request, key_state, is_hedge):
+                deadline = pipeline.hedger.deadline()
+                future = executor.submit(pipeline.translate_request, key_state.api_key, template, request['chunk'], deadline)
+                in_flight[future] = (request, key_state, is_hedge, time.monotonic() + deadline * RequestHedger.ABANDON_FACTOR)
+                request['attempts'] += 1
+            
+            def send_hedges():
+                # p95가 지나도록 응답이 없는 요청은 쉬고 있는 키로 한 번 더 보냄 (예산 이내)
+                hedge_delay = pipeline.hedger.hedge_delay()
+                if hedge_delay is None:
+                    return
+                now = time.monotonic()
+                waiting = [
+                    request for request, _, is_hedge, _ in list(in_flight.values())
+                    if not is_hedge and not request['hedged'] and not request['done'] and now - request['started'] >= hedge_delay
+                ]
+                for request in waiting:
+                    if not pipeline.hedger.can_hedge():
+                        return
+                    key_state = key_pool.try_acquire()
+                    if key_state is None:
+                        return
+                    request['hedged'] = True
+                    pipeline.hedger.record_hedge()
+                    logger.info(f"응답 지연 {now - request['started']:.1f}초 (p95 {hedge_delay:.1f}초) - "
+                                f"{len(request['chunk'])}개 청크 중복 요청 - {key_state.label}")
+                    submit_attempt(request, key_state, True)
+            
+            control = self.control
+            pause_started = None
+            
+            # 진행 상황/결과 미리보기는 일정 간격으로 묶어서 전송
+            ui_throttle = SignalThrottle()
+            pending_batch = list(all_translations)
+            ui_dirty = True
+            
+            def flush_ui_updates(force=False):
+                nonlocal pending_batch, ui_dirty
+                if not ui_dirty or not ui_throttle.ready(force):
+                    return
+                self.progress_signal.emit(processed_count, total_count)
+                self.key_usage_signal.emit(key_pool.usage())
+                if pending_batch:
+                    self.partial_result_signal.emit(pending_batch)
+                    pending_batch = []
+                ui_dirty = False
+            
+            # 포기한 요청이 스레드를 붙잡고 있어도 새 요청을 보낼 수 있도록 여유를 둠
+            executor = ThreadPoolExecutor(max_workers=len(key_pool) * 2)
+            try:
+                while (has_pending() or open_requests) and not control.cancelled:
+                    # 일시정지 중에는 새 요청을 보내지 않고, 재개 시 쉰 시간만큼 키별 요청 시각을 미룸
+                    if control.paused:
+                        if pause_started is None:
+                            pause_started = time.monotonic()
+                            logger.info("번역 일시정지")
+                    elif pause_started is not None:
+                        key_pool.shift(time.monotonic() - pause_started, pause_started)
+                        pause_started = None
+                        logger.info("번역 재개")
                     
-                    # 응답 텍스트 획득
-                    translated_text = response.text.strip()
-                    logger.info(f"배치 번역 완료. 응답 길이: {len(translated_text)}")
+                    # 응답이 늦은 요청의 중복 요청에 먼저 키를 배정 (느린 요청 하나가 실행 끝을 붙잡지 않도록)
+                    if not control.paused:
+                        send_hedges()
                     
-                    # 번역된 결과를 줄별로 분리
-                    translated_lines = translated_text.split('\n')
+                    # 사용 가능한 키마다 다음 청크 배정 (UI에서 요청한 우선순위 먼저 반영)
+                    update_priorities()
+                    while has_pending() and not control.paused:
+                        key_state = key_pool.try_acquire()
+                        if key_state is None:
+                            break
+                        chunk = next_chunk()
+                        generation = pipeline.chunk_sizer.acquire()[1] if pipeline.chunk_sizer else 0
+                        request = pipeline.new_request(chunk, generation)
+                        logger.info(f"청크 번역 요청 ({pipeline.sent_chunks}/{max(pipeline.total_chunks, pipeline.sent_chunks)}, "
+                                    f"{len(chunk)}개) - {key_state.label}")
+                        submit_attempt(request, key_state, False)
+                        open_requests += 1
                     
-                    # 원본 파일명과 번역된 파일명을 매핑
-                    for j, original_name in enumerate(chunk):
-                        if j < len(translated_lines):
-                            translated_name = translated_lines[j].strip()
-                            if translated_name:  # 빈 문자열이 아닌 경우만 추가
-                                all_translations.append({
-                                    'original': original_name,
-                                    'translated': translated_name
-                                })
-                                
-                                # 각 파일 번역 후 진행 상황 업데이트
-                                self.progress_signal.emit(current_progress + j + 1, len(self.filenames))
-                        else:
-                            logger.warning(f"번역 결과 누락: {original_name}")
+                    flush_ui_updates()
+                    if not in_flight:
+                        if not key_pool.has_usable_keys():
+                            logger.error("사용 가능한 API 키가 없어 번역을 중단합니다.")
+                            break
+                        # 모든 키가 대기/쿨다운 중이면 가장 빠른 키까지 대기 (취소 시 즉시 깨어남)
+                        control.sleep(min(max(key_pool.seconds_until_available() or 0.0, 0.05), 0.2))
+                        continue
                     
-                except Exception as e:
-                    logger.error(f"파일명 청크 번역 중 오류 발생: {str(e)}", exc_info=True)
-                    # 오류 발생 시 대기 시간을 늘리고 재시도 (추가 지연)
-                    logger.info("API 오류 발생 - 10초 대기 후 다음 청크로 계속...")
-                    time.sleep(10)
-                    # 현재 청크에서 오류가 발생해도 계속 진행
-                    continue
+                    # 완료된 요청 처리 (취소/일시정지를 바로 반영하도록 짧게 나눠 대기)
+                    timeout = key_pool.seconds_until_available() if has_pending() else None
+                    timeout = 0.2 if timeout is None else min(timeout, 0.2)
+                    done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                    completed = []
+                    for future in done:
+                        request, key_state, is_hedge, _ = in_flight.pop(future)
+                        try:
+                            outcome = future.result()
+                        except Exception as e:
+                            outcome = e
+                        key_pool.release(key_state, outcome if isinstance(outcome, Exception) else None)
+                        completed.append((request, is_hedge, outcome))
+                    # 마감 시간이 한참 지나도 돌아오지 않는 요청은 키를 풀어 주고 응답이 없는 것으로 처리
+                    now = time.monotonic()
+                    for future, (request, key_state, is_hedge, abandon_at) in list(in_flight.items()):
+                        if now >= abandon_at:
+                            del in_flight[future]
+                            error = TimeoutError(f"{now - request['started']:.0f}초 동안 응답 없음")
+                            key_pool.release(key_state, error)
+                            completed.append((request, is_hedge, error))
+                    for request, is_hedge, outcome in completed:
+                        request['attempts'] -= 1
+                        if not is_hedge:
+                            request['primary_elapsed'] = now - request['started']
+                        if request['done'] or (isinstance(outcome, Exception) and request['attempts']):
+                            continue  # 먼저 온 응답을 이미 사용했거나, 다른 시도가 아직 진행 중
+                        request['done'] = True
+                        open_requests -= 1
+                        chunk_results, processed = pipeline.complete_request(request, outcome, now, retry_chunks, is_hedge)
+                        all_translations.extend(chunk_results)
+                        pending_batch.extend(chunk_results)
+                        processed_count += processed
+                        ui_dirty = True
+                flush_ui_updates(force=True)
+            finally:
+                if in_flight:
+                    # 취소 시나 중복 요청에 밀린 요청은 기다리지 않고, 늦게 도착한 응답도 체크포인트에는 기록
+                    logger.info(f"진행 중인 요청 {len(in_flight)}건은 기다리지 않습니다.")
+                    for future in in_flight:
+                        future.add_done_callback(pipeline.checkpoint_late_result)
+                executor.shutdown(wait=False, cancel_futures=True)
+                pipeline.flush_shared_cache()
+            
+            # 요청/토큰 통계 전송
+            pipeline.metrics.key_usage = key_pool.usage()
+            pipeline.metrics.hedging = pipeline.hedger.summary(time.monotonic())
+            if pipeline.chunk_sizer:
+                pipeline.metrics.chunk_size = pipeline.chunk_sizer.size
+                pipeline.metrics.chunk_size_changes = len(pipeline.chunk_sizer.changes)
+                logger.info(f"청크 크기 자동 조절 - 최종 {pipeline.chunk_sizer.size}개, 조절 {len(pipeline.chunk_sizer.changes)}회")
+            else:
+                pipeline.metrics.chunk_size = chunk_size
+            logger.info(f"번역 요청 통계 - {pipeline.metrics.format_summary()}")
+            logger.info(f"API 키별 사용량 - {format_key_usage(pipeline.metrics.key_usage)}")
+            self.stats_signal.emit(pipeline.metrics.summary())
             
-            # 최종 결과 전송
+            # 최종 결과 전송 (취소된 경우 그때까지 받은 결과)
             if all_translations:
-                logger.info(f"전체 파일명 번역 완료. 번역된 파일 수: {len(all_translations)}")
+                if self.control.cancelled:
+                    logger.info(f"번역 취소됨. 완료된 파일 수: {len(all_translations)}")
+                else:
+                    logger.info(f"전체 파일명 번역 완료. 번역된 파일 수: {len(all_translations)}")
                 self.result_signal.emit(all_translations)
-            else:
+            elif not self.control.cancelled:
                 self.error_signal.emit("모든 파일명 번역에 실패했습니다.")
                 
         except Exception as e:
@@ -175,6 +1898,70 @@ Custom User Prompt:
             self.error_signal.emit(f"번역 처리 중 오류 발생: {str(e)}")
 
 
+# 번역 결과 매핑 파일 (번역과 검토/적용을 다른 시점이나 다른 PC에서 진행)
+MAPPING_FIELDS = ('type', 'path', 'new_name')  # path는 기준 폴더에서의 상대 경로 ('/' 구분)
+
+
+def mapping_format(path):
+    """확장자로 매핑 파일 형식 결정 ('csv' 또는 'jsonl')"""
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def write_mapping(path, rows):
+    """(유형, 상대 경로, 새 이름) 행을 하나씩 매핑 파일에 기록하고 기록한 행 수 반환"""
+    count = 0
+    if mapping_format(path) == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(MAPPING_FIELDS)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(dict(zip(MAPPING_FIELDS, row)), ensure_ascii=False) + '\n')
+                count += 1
+    return count
+
+
+def _read_mapping_records(f, file_format):
+    """매핑 파일의 줄별 레코드 반환 (JSON으로 해석할 수 없는 줄은 None)"""
+    if file_format == 'csv':
+        yield from csv.DictReader(f)
+        return
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+def iter_mapping(path, warn=True):
+    """매핑 파일을 한 줄씩 읽어 (유형, 상대 경로, 새 이름) 반환 (파일 전체를 메모리에 올리지 않음)
+
+    형식이 잘못되었거나 기준 폴더 밖을 가리키는 줄은 건너뛴다 (warn이면 경고를 남김).
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for line_number, record in enumerate(_read_mapping_records(f, mapping_format(path)), 1):
+            if not isinstance(record, dict):
+                if warn:
+                    logger.warning(f"매핑 파일 {line_number}번째 항목 형식 오류 - 건너뜀")
+                continue
+            item_type = record.get('type')
+            parts = str(record.get('path') or '').replace('\\', '/').split('/')
+            new_name = sanitize_filename(str(record.get('new_name') or '').strip())
+            if (item_type not in ENTRY_TYPE_NAMES or not new_name or new_name in ('.', '..')
+                    or not all(parts) or '..' in parts or ':' in parts[0]):
+                if warn:
+                    logger.warning(f"매핑 파일 {line_number}번째 항목이 올바르지 않음 - 건너뜀: {record}")
+                continue
+            yield item_type, '/'.join(parts), new_name
+
+
 # 파일명 변경을 위한 쓰레드 클래스
 class RenameThread(QThread):
     progress_signal = pyqtSignal(int, int)  # (현재 처리 중인 파일 인덱스, 전체 파일 수)
@@ -184,6 +1971,36 @@ class RenameThread(QThread):
     def __init__(self, items_to_rename):
         super().__init__()
         self.items_to_rename = items_to_rename
+        self.control = RunControl()
+    
+    def rename_item(self, original_path, new_name, item_type):
+        """항목 하나의 이름을 변경하고 새 경로 반환 (실패 시 None)"""
+        # 원본 경로와 새 경로 계산
+        directory = os.path.dirname(original_path)
+        new_path = os.path.join(directory, os.path.basename(new_name))
+        
+        # 이미 동일한 이름의 파일이 있는지 확인
+        if os.path.exists(new_path) and original_path != new_path:
+            logger.warning(f"이름 변경 실패 - 이미 존재하는 경로: {new_path}")
+            return None
+        
+        # 이름 변경 시도
+        try:
+            os.rename(original_path, new_path)
+        except PermissionError:
+            logger.error(f"권한 오류: {original_path} - 파일이 사용 중이거나 권한이 없습니다.")
+            return None
+        except FileNotFoundError:
+            logger.error(f"파일을 찾을 수 없음: {original_path}")
+            return None
+        except OSError as e:
+            logger.error(f"OS 오류: {str(e)} - {original_path}")
+            return None
+        
+        # 로그 추가 (폴더 구조 추적을 위한 디버깅)
+        if item_type == 'folder':
+            logger.info(f"폴더 이름 변경: {original_path} -> {new_path} (깊이: {original_path.count(os.sep)})")
+        return new_path
     
     def run(self):
         # 이름 변경 성공한 항목 목록
@@ -201,58 +2018,1171 @@ class RenameThread(QThread):
             # 파일을 먼저 처리한 후 깊이순으로 정렬된 폴더를 처리
             items_to_process = files_to_rename + folders_to_rename
             
-            # 이름 변경 처리
-            for i, item in enumerate(items_to_process):
-                try:
-                    # 진행 상황 업데이트
-                    self.progress_signal.emit(i+1, total_items)
-                    
-                    original_path = item['original_path']
-                    new_name = item['new_name']
-                    item_type = item['type']
-                    
-                    # 원본 경로와 새 경로 계산
-                    directory = os.path.dirname(original_path)
-                    new_path = os.path.join(directory, os.path.basename(new_name))
-                    
-                    # 이미 동일한 이름의 파일이 있는지 확인
-                    if os.path.exists(new_path) and original_path != new_path:
-                        logger.warning(f"이름 변경 실패 - 이미 존재하는 경로: {new_path}")
+            # 진행 상황은 일정 간격으로만 전송
+            ui_throttle = SignalThrottle()
+            
+            # 이름 변경 처리
+            for i, item in enumerate(items_to_process):
+                # 일시정지/취소 확인 (취소 시 이미 변경한 항목까지만 결과로 전송)
+                if not self.control.wait_if_paused():
+                    logger.info(f"이름 변경 취소됨. 변경된 항목 수: {len(renamed_items)}")
+                    break
+                
+                try:
+                    # 진행 상황 업데이트
+                    if ui_throttle.ready(force=(i + 1 == total_items)):
+                        self.progress_signal.emit(i+1, total_items)
+                    
+                    original_path = item['original_path']
+                    item_type = item['type']
+                    
+                    new_path = self.rename_item(original_path, item['new_name'], item_type)
+                    if new_path is None:
+                        continue
+                    
+                    # 성공 목록에 추가
+                    renamed_items.append({
+                        'original_path': original_path,
+                        'new_path': new_path,
+                        'type': item_type
+                    })
+                    
+                    # 처리 간격
+                    self.control.sleep(0.1)  # 시스템 과부하 방지
+                    
+                except Exception as e:
+                    logger.error(f"파일 이름 변경 오류: {str(e)} - {original_path}")
+            
+            # 결과 신호 전송
+            self.result_signal.emit(renamed_items)
+            
+        except Exception as e:
+            self.error_signal.emit(str(e))
+            logger.exception("이름 변경 스레드 오류")
+
+
+# 매핑 파일로 이름을 변경하는 쓰레드 클래스
+class MappingRenameThread(RenameThread):
+    """매핑 파일을 스트리밍으로 읽어 기준 폴더 아래 항목 이름 변경
+
+    파일은 읽는 즉시 변경하고, 폴더는 깊이별 임시 파일에 모았다가 깊은 폴더부터 변경한다.
+    항목 목록을 메모리에 올리지 않으므로 결과도 개수만 전송한다.
+    """
+    summary_signal = pyqtSignal(dict)  # 변경/실패 항목 수
+    
+    def __init__(self, mapping_path, root_path):
+        super().__init__([])
+        self.mapping_path = mapping_path
+        self.root_path = root_path
+    
+    def iter_rename_order(self, spool_dir):
+        """파일 행은 바로 내보내고 폴더 행은 깊이별 임시 파일에 모았다가 깊은 것부터 내보냄"""
+        spools = {}  # 깊이 -> 임시 파일
+        try:
+            for item_type, relative_path, new_name in iter_mapping(self.mapping_path):
+                if item_type == 'folder':
+                    depth = relative_path.count('/')
+                    spool = spools.get(depth)
+                    if spool is None:
+                        spool = spools[depth] = open(os.path.join(spool_dir, f"{depth}.jsonl"), 'w', encoding='utf-8')
+                    spool.write(json.dumps([relative_path, new_name], ensure_ascii=False) + '\n')
+                    continue
+                yield item_type, relative_path, new_name
+        finally:
+            for spool in spools.values():
+                spool.close()
+        
+        for depth in sorted(spools, reverse=True):
+            with open(spools[depth].name, 'r', encoding='utf-8') as f:
+                for line in f:
+                    relative_path, new_name = json.loads(line)
+                    yield 'folder', relative_path, new_name
+    
+    def run(self):
+        counts = {'files': 0, 'folders': 0, 'failed': 0, 'total': 0, 'cancelled': False}
+        try:
+            # 진행률 표시를 위해 먼저 항목 수만 셈 (잘못된 줄 경고는 적용할 때 한 번만 남김)
+            total = sum(1 for _ in iter_mapping(self.mapping_path, warn=False))
+            counts['total'] = total
+            ui_throttle = SignalThrottle()
+            processed = 0
+            
+            with tempfile.TemporaryDirectory(prefix="mapping_") as spool_dir:
+                rows = self.iter_rename_order(spool_dir)
+                try:
+                    for item_type, relative_path, new_name in rows:
+                        # 일시정지/취소 확인
+                        if not self.control.wait_if_paused():
+                            counts['cancelled'] = True
+                            logger.info(f"매핑 적용 취소됨. 처리한 항목 수: {processed}")
+                            break
+                        
+                        processed += 1
+                        if ui_throttle.ready(force=(processed == total)):
+                            self.progress_signal.emit(processed, total)
+                        
+                        original_path = os.path.join(self.root_path, *relative_path.split('/'))
+                        if self.rename_item(original_path, new_name, item_type) is None:
+                            counts['failed'] += 1
+                        elif item_type == 'folder':
+                            counts['folders'] += 1
+                        else:
+                            counts['files'] += 1
+                finally:
+                    rows.close()
+            
+            logger.info(f"매핑 적용 결과 - 파일 {counts['files']}개, 폴더 {counts['folders']}개, 실패 {counts['failed']}개")
+            self.summary_signal.emit(counts)
+            
+        except Exception as e:
+            self.error_signal.emit(str(e))
+            logger.exception("매핑 적용 쓰레드 오류")
+
+
+# 스캔 항목 유형 및 상태 플래그
+ENTRY_FILE = 0
+ENTRY_FOLDER = 1
+ENTRY_TYPE_NAMES = ('file', 'folder')
+FLAG_CHECKED = 0x01
+FLAG_SCRIPT_SKIPPED = 0x02  # 스크립트 감지로 자동 선택 해제됨
+
+
+# 스캔한 파일/폴더 목록을 압축해서 보관하는 저장소
+class EntryStore:
+    """항목마다 딕셔너리를 만들지 않고 디렉토리 테이블 + 배열로 보관한다.
+
+    - 디렉토리 경로는 테이블에 한 번만 저장하고 항목은 부모 디렉토리 번호만 가진다.
+    - 이름은 UTF-8로 하나의 bytearray에 이어 붙이고 시작 위치만 배열로 보관한다.
+    - 유형과 상태(체크 여부 등), 이름의 스크립트 비트는 항목당 1바이트 배열이다.
+    전체 경로는 필요할 때만 조합한다.
+    """
+    def __init__(self):
+        self.directories = []  # 디렉토리 번호 -> 경로
+        self._directory_index = {}  # 경로 -> 디렉토리 번호
+        self.parents = array('I')
+        self.types = array('B')
+        self.flags = array('B')
+        self.scripts = array('B')  # 이름의 스크립트 비트 (처음 필요할 때 한 번만 판정)
+        self._name_data = bytearray()
+        self._name_offsets = array('Q', [0])
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add_directory(self, path):
+        """디렉토리 경로를 테이블에 등록하고 번호 반환"""
+        index = self._directory_index.get(path)
+        if index is None:
+            index = len(self.directories)
+            path = sys.intern(path)
+            self.directories.append(path)
+            self._directory_index[path] = index
+        return index
+
+    def add(self, directory_index, name, entry_type, flags=0):
+        """항목 추가 후 항목 번호 반환"""
+        self.parents.append(directory_index)
+        self.types.append(entry_type)
+        self.flags.append(flags)
+        # 윈도우의 짝 없는 서로게이트 등도 손실 없이 보관
+        self._name_data += name.encode('utf-8', 'surrogatepass')
+        self._name_offsets.append(len(self._name_data))
+        return len(self.parents) - 1
+
+    def name(self, index):
+        start = self._name_offsets[index]
+        end = self._name_offsets[index + 1]
+        return self._name_data[start:end].decode('utf-8', 'surrogatepass')
+
+    def directory(self, index):
+        return self.directories[self.parents[index]]
+
+    def path(self, index):
+        return os.path.join(self.directories[self.parents[index]], self.name(index))
+
+    def type_name(self, index):
+        return ENTRY_TYPE_NAMES[self.types[index]]
+
+    def is_folder(self, index):
+        return self.types[index] == ENTRY_FOLDER
+
+    def is_checked(self, index):
+        return bool(self.flags[index] & FLAG_CHECKED)
+
+    def set_checked(self, index, checked):
+        # 사용자가 직접 바꾼 항목은 자동 선택 해제 표시도 지움
+        if checked:
+            self.flags[index] = (self.flags[index] | FLAG_CHECKED) & ~FLAG_SCRIPT_SKIPPED & 0xFF
+        else:
+            self.flags[index] &= ~(FLAG_CHECKED | FLAG_SCRIPT_SKIPPED) & 0xFF
+
+    def set_all_checked(self, checked):
+        # 바이트 변환표로 모든 항목의 체크 비트를 한 번에 변경
+        cleared = ~(FLAG_CHECKED | FLAG_SCRIPT_SKIPPED) & 0xFF
+        table = bytes(((value & cleared) | FLAG_CHECKED) if checked else (value & cleared) for value in range(256))
+        self.flags = array('B', self.flags.tobytes().translate(table))
+
+    def script_masks(self):
+        """항목별 스크립트 비트 배열 (아직 판정하지 않은 항목만 판정)"""
+        if len(self.scripts) < len(self):
+            self.scripts.extend(classify_scripts(self.name(index) for index in range(len(self.scripts), len(self))))
+        return self.scripts
+
+    def apply_script_skips(self, languages):
+        """이미 대상 언어이거나 번역할 글자가 없는 이름을 선택 해제하고 해제한 항목 수 반환
+
+        이전에 자동으로 해제한 항목은 다시 선택한 뒤 현재 언어 기준으로 다시 판정한다.
+        이름은 스캔 후 한 번만 판정하고, 언어가 바뀌면 저장한 스크립트 비트로 선택 상태만 다시 계산한다.
+        """
+        count = len(self)
+        if not count:
+            return 0
+        # 스크립트 비트 조합(256가지)별 판정 결과와 상태 변환을 바이트 변환표로 만들어 항목 전체에 한 번에 적용
+        skip_table = bytes(0xFF if is_already_translated(mask, languages) else 0 for mask in range(256))
+        restored = bytes(((value | FLAG_CHECKED) & ~FLAG_SCRIPT_SKIPPED & 0xFF) if value & FLAG_SCRIPT_SKIPPED else value
+                         for value in range(256))
+        checked_table = bytes(0xFF if value & FLAG_CHECKED else 0 for value in range(256))
+        skipped_table = bytes((value & ~FLAG_CHECKED & 0xFF) | FLAG_SCRIPT_SKIPPED for value in range(256))
+        
+        flags = self.flags.tobytes().translate(restored)
+        # 선택된 항목 중 이미 번역된 이름 위치만 0xFF인 마스크 (바이트열을 큰 정수로 보고 비트 연산)
+        skip_mask = (int.from_bytes(self.script_masks().tobytes().translate(skip_table), 'little')
+                     & int.from_bytes(flags.translate(checked_table), 'little'))
+        flags_value = int.from_bytes(flags, 'little')
+        skipped_value = int.from_bytes(flags.translate(skipped_table), 'little')
+        all_bytes = (1 << (8 * count)) - 1
+        new_flags = (skipped_value & skip_mask) | (flags_value & (all_bytes ^ skip_mask))
+        self.flags = array('B', new_flags.to_bytes(count, 'little'))
+        return skip_mask.to_bytes(count, 'little').count(0xFF)
+
+    def script_skipped_count(self):
+        """스크립트 감지로 선택 해제된 상태인 항목 수"""
+        table = bytes(1 if value & FLAG_SCRIPT_SKIPPED else 0 for value in range(256))
+        return self.flags.tobytes().translate(table).count(1)
+
+    def checked_indexes(self):
+        """체크된 항목 번호 목록"""
+        return array('I', (index for index, flags in enumerate(self.flags) if flags & FLAG_CHECKED))
+
+
+# 스캔 포함/제외 규칙 (한 번 컴파일하여 스캔 중 항목마다 적용)
+SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+FILTER_CONDITION_PATTERN = re.compile(r'^(size|mtime|depth)\s*(<=|>=|<|>|=)\s*(.+)$', re.IGNORECASE)
+FILTER_COMPARATORS = {
+    '<': lambda value, limit: value < limit,
+    '<=': lambda value, limit: value <= limit,
+    '>': lambda value, limit: value > limit,
+    '>=': lambda value, limit: value >= limit,
+    '=': lambda value, limit: value == limit,
+}
+
+
+class ScanFilter:
+    """스캔할 때 포함/제외할 항목을 판정하는 규칙 묶음
+
+    규칙은 한 줄(또는 ';')에 하나씩 적는다.
+      -*.tmp, +*.mp4          이름 glob 제외/포함 (대소문자 구분 없음)
+      -re:^\\., +re:S\\d+E\\d+    이름 정규식 제외/포함
+      size>10MB, size<=500KB  파일 크기
+      mtime>=2024-01-01       수정 시각 (날짜 또는 '30d' = 30일 전, mtime>30d는 최근 30일 이내)
+      depth<=2                기준 폴더로부터의 깊이 (0 = 기준 폴더 바로 아래)
+    제외 규칙에 맞는 폴더는 목록에서 빠지고 안으로 들어가지도 않는다.
+    포함 규칙이 있으면 파일은 하나 이상에 맞아야 하며, 크기 조건은 파일에만 적용된다.
+    제외 확장자 목록은 파일에만 적용한다 (이름이 'Trip.jpg'인 폴더는 그대로 탐색).
+    """
+
+    def __init__(self, exclude_patterns=(), include_patterns=(), size_checks=(), mtime_checks=(), depth_checks=(),
+                 exclude_extensions=()):
+        self.exclude_extensions = frozenset(ext.lower().lstrip('.') for ext in exclude_extensions)
+        self.exclude = self.compile_patterns(exclude_patterns)
+        self.include = self.compile_patterns(include_patterns)
+        self.size_checks = [(FILTER_COMPARATORS[op], limit) for op, limit in size_checks]
+        self.mtime_checks = [(FILTER_COMPARATORS[op], limit) for op, limit in mtime_checks]
+        self.depth_checks = [(FILTER_COMPARATORS[op], limit) for op, limit in depth_checks]
+        self.needs_stat = bool(self.size_checks or self.mtime_checks)
+        # 깊이 상한은 그보다 깊은 폴더를 나열하지 않도록 탐색에도 반영
+        limits = [limit - (op == '<') for op, limit in depth_checks if op in ('<', '<=', '=')]
+        self.max_depth = max(min(limits), 0) if limits else None
+
+    @staticmethod
+    def compile_patterns(patterns):
+        """(종류, 패턴) 목록을 하나의 정규식으로 합쳐 이름당 한 번만 검사
+
+        그룹 번호를 참조하는 정규식은 합치면 번호가 달라지므로 따로 컴파일한다.
+        """
+        if not patterns:
+            return None
+        combined = [(kind, pattern) for kind, pattern in patterns
+                    if kind == 'glob' or not has_group_number_reference(pattern)]
+        separate = [(kind, pattern) for kind, pattern in patterns
+                    if kind != 'glob' and has_group_number_reference(pattern)]
+        matchers = []
+        if combined:
+            parts = [f"(?i:{fnmatch.translate(pattern)})" if kind == 'glob'
+                     else f"(?s:.*?)(?:{pattern})"  # 정규식은 이름 어디에든 맞으면 됨
+                     for kind, pattern in combined]
+            try:
+                matchers.append(re.compile('|'.join(parts)).match)
+            except re.error:
+                # 전역 플래그 등으로 합칠 수 없는 정규식이 있으면 모두 따로 컴파일
+                separate = list(patterns)
+        matchers.extend(re.compile(fnmatch.translate(pattern), re.IGNORECASE).match if kind == 'glob'
+                        else re.compile(pattern).search for kind, pattern in separate)
+        if len(matchers) == 1:
+            return matchers[0]
+        return lambda name: any(match(name) for match in matchers)
+
+    @classmethod
+    def from_text(cls, text, exclude_extensions=()):
+        """규칙 텍스트와 제외 확장자 목록으로 필터 생성 (규칙이 없으면 None, 잘못된 규칙은 ValueError)"""
+        exclude = []
+        include = []
+        size_checks = []
+        mtime_checks = []
+        depth_checks = []
+        for line in re.split(r'[\n;]', text or ''):
+            rule = line.strip()
+            if not rule or rule.startswith('#'):
+                continue
+            condition = FILTER_CONDITION_PATTERN.match(rule)
+            if condition:
+                field, op, value = condition.group(1).lower(), condition.group(2), condition.group(3).strip()
+                if field == 'size':
+                    size_checks.append((op, cls.parse_size(value)))
+                elif field == 'mtime':
+                    mtime_checks.append((op, cls.parse_time(value)))
+                else:
+                    if not value.isdigit():
+                        raise ValueError(f"깊이는 0 이상의 정수여야 합니다: {rule}")
+                    depth_checks.append((op, int(value)))
+                continue
+            if rule[0] not in '+-' or len(rule) < 2:
+                raise ValueError(f"알 수 없는 규칙입니다: {rule}")
+            target = include if rule[0] == '+' else exclude
+            pattern = rule[1:].strip()
+            if pattern.lower().startswith('re:'):
+                pattern = pattern[3:]
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"정규식 오류: {rule} ({e})")
+                target.append(('regex', pattern))
+            else:
+                target.append(('glob', pattern))
+        if not (exclude or include or size_checks or mtime_checks or depth_checks or exclude_extensions):
+            return None
+        return cls(exclude, include, size_checks, mtime_checks, depth_checks, exclude_extensions)
+
+    @staticmethod
+    def parse_size(value):
+        match = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([KMGT]?)B?', value.strip().upper())
+        if not match:
+            raise ValueError(f"크기 형식 오류: {value} (예: 500KB, 10MB)")
+        unit = match.group(2) + 'B' if match.group(2) else ''
+        return int(float(match.group(1)) * SIZE_UNITS[unit])
+
+    @staticmethod
+    def parse_time(value):
+        days = re.fullmatch(r'(\d+)\s*d', value.strip(), re.IGNORECASE)
+        if days:
+            return time.time() - int(days.group(1)) * 86400
+        try:
+            return datetime.datetime.fromisoformat(value.strip()).timestamp()
+        except ValueError:
+            raise ValueError(f"시각 형식 오류: {value} (예: 2024-01-01, 30d)")
+
+    def prunes(self, name):
+        """제외 규칙에 맞아 목록에서 빼고 들어가지도 않을 폴더인지"""
+        return self.exclude is not None and bool(self.exclude(name))
+
+    def accepts(self, name, is_dir, depth, entry=None):
+        """항목을 목록에 넣을지 판정 (entry는 크기/시각 조건에 쓸 os.DirEntry)"""
+        if self.exclude is not None and self.exclude(name):
+            return False
+        if not is_dir:
+            if self.exclude_extensions and os.path.splitext(name)[1].lower().lstrip('.') in self.exclude_extensions:
+                return False
+            if self.include is not None and not self.include(name):
+                return False
+        for compare, limit in self.depth_checks:
+            if not compare(depth, limit):
+                return False
+        if self.needs_stat:
+            try:
+                stat = entry.stat() if entry is not None else None
+            except OSError:
+                return False
+            if stat is None:
+                return True
+            if not is_dir:
+                for compare, limit in self.size_checks:
+                    if not compare(stat.st_size, limit):
+                        return False
+            for compare, limit in self.mtime_checks:
+                if not compare(stat.st_mtime, limit):
+                    return False
+        return True
+
+
+# 여러 디렉토리를 동시에 나열하는 병렬 탐색기
+class ParallelDirectoryWalker:
+    """네트워크 드라이브(SMB/NFS)에서 디렉토리 나열마다 생기는 왕복 지연을 겹쳐서 처리한다.
+
+    - 작업자마다 대기 디렉토리 덱을 두고 자기 덱은 뒤에서(깊이 우선) 꺼내며,
+      비어 있으면 다른 작업자 덱의 앞(얕은 디렉토리)에서 가져온다(work stealing).
+    - 마운트(공유)별 동시 나열 수를 제한해 한 파일 서버에 요청이 몰리지 않게 한다.
+      하위 폴더는 부모의 마운트를 그대로 물려받아 폴더마다 stat을 다시 요청하지 않는다.
+    - max_depth가 0이면 기준 디렉토리만, None이면 깊이 제한 없이 나열한다.
+    - entry_filter(ScanFilter)가 있으면 나열하는 작업자 스레드에서 바로 걸러낸다.
+    """
+    DEFAULT_WORKERS = 16
+    DEFAULT_PER_MOUNT_LIMIT = 8
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, per_mount_limit=DEFAULT_PER_MOUNT_LIMIT, max_depth=None, list_dir=None,
+                 entry_filter=None):
+        self.max_workers = max(1, max_workers)
+        self.per_mount_limit = max(1, per_mount_limit)
+        self.max_depth = max_depth
+        if entry_filter is not None and entry_filter.max_depth is not None:
+            self.max_depth = entry_filter.max_depth if max_depth is None else min(max_depth, entry_filter.max_depth)
+        self.entry_filter = entry_filter
+        self.list_dir = list_dir or self.filtered_listing  # 벤치마크에서 지연을 넣을 때 교체
+
+    @staticmethod
+    def mount_key(path):
+        """동시 나열 수를 제한할 마운트(공유) 식별자"""
+        drive = os.path.splitdrive(path)[0]
+        if drive:
+            return drive.lower()  # 윈도우 드라이브 문자 또는 \\서버\공유
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            return None
+
+    @staticmethod
+    def scandir_listing(path, depth=0, entry_filter=None, scandir=os.scandir):
+        """디렉토리 하나를 나열하여 (하위 폴더 이름, 파일 이름, 들어갈 폴더 이름) 반환"""
+        dirs = []
+        files = []
+        subdirs = []
+        with scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry_filter is not None and entry_filter.prunes(entry.name):
+                            continue
+                        if entry_filter is None or entry_filter.accepts(entry.name, True, depth, entry):
+                            dirs.append(entry.name)
+                        # os.walk와 같이 심볼릭 링크 폴더는 목록에만 넣고 들어가지 않음
+                        if not entry.is_symlink():
+                            subdirs.append(entry.name)
+                    elif entry.is_file():
+                        if entry_filter is None or entry_filter.accepts(entry.name, False, depth, entry):
+                            files.append(entry.name)
+                except OSError:
+                    continue
+        return dirs, files, subdirs
+
+    def filtered_listing(self, path, depth=0):
+        return self.scandir_listing(path, depth, self.entry_filter)
+
+    def walk(self, root):
+        """(디렉토리 경로, 하위 폴더 이름 목록, 파일 이름 목록)을 나열이 끝나는 순서대로 반환"""
+        worker_count = self.max_workers
+        deques = [deque() for _ in range(worker_count)]
+        deques[0].append((root, 0, self.mount_key(root)))
+        condition = threading.Condition()
+        state = {'outstanding': 1, 'stopped': False}  # 대기 중이거나 나열 중인 디렉토리 수
+        mount_limits = {}
+        results = deque()
+        results_ready = threading.Condition()
+        finished_workers = []
+
+        def take(worker):
+            own = deques[worker]
+            if own:
+                return own.pop()
+            for offset in range(1, worker_count):
+                victim = deques[(worker + offset) % worker_count]
+                if victim:
+                    return victim.popleft()
+            return None
+
+        def mount_limit(key):
+            with condition:
+                limit = mount_limits.get(key)
+                if limit is None:
+                    limit = mount_limits[key] = threading.BoundedSemaphore(self.per_mount_limit)
+                return limit
+
+        def run_worker(worker):
+            try:
+                while True:
+                    with condition:
+                        item = take(worker)
+                        while item is None and state['outstanding'] and not state['stopped']:
+                            condition.wait()
+                            item = take(worker)
+                        if item is None:
+                            return
+                    path, depth, mount = item
+                    try:
+                        with mount_limit(mount):
+                            dirs, files, subdirs = self.list_dir(path, depth)
+                    except OSError as e:
+                        logger.warning(f"디렉토리를 나열할 수 없음: {path} - {str(e)}")
+                        dirs, files, subdirs = [], [], []
+                    if self.max_depth is not None and depth >= self.max_depth:
+                        subdirs = []
+                    with condition:
+                        deques[worker].extend((os.path.join(path, name), depth + 1, mount) for name in subdirs)
+                        state['outstanding'] += len(subdirs) - 1
+                        condition.notify_all()
+                    with results_ready:
+                        results.append((path, dirs, files))
+                        results_ready.notify()
+            finally:
+                with results_ready:
+                    finished_workers.append(worker)
+                    results_ready.notify()
+
+        threads = [threading.Thread(target=run_worker, args=(worker,), daemon=True) for worker in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                with results_ready:
+                    while not results and len(finished_workers) < worker_count:
+                        results_ready.wait()
+                    if not results:
+                        return
+                    item = results.popleft()
+                yield item
+        finally:
+            # 호출자가 중간에 멈춰도 작업자가 남지 않도록 종료
+            with condition:
+                state['stopped'] = True
+                condition.notify_all()
+
+
+# 디렉토리 스캔 (파일 목록 불러오기와 작업 대기열에서 공통 사용)
+def scan_directory(directory_path, include_subfolders, entry_filter=None, max_depth=None):
+    """디렉토리를 스캔하여 (저장소, 폴더 항목 번호, 파일 항목 번호) 반환
+
+    하위 폴더를 포함하면 여러 디렉토리를 병렬로 나열하며, max_depth로 들어갈 깊이를 제한한다.
+    entry_filter(ScanFilter)에 맞지 않는 항목은 나열하면서 바로 건너뛴다.
+    """
+    store = EntryStore()
+    files = array('I')
+    folders = array('I')
+
+    walker = ParallelDirectoryWalker(max_depth=max_depth if include_subfolders else 0, entry_filter=entry_filter)
+    for root, dirs, filenames in walker.walk(directory_path):
+        # 전체 경로 표시 (항목의 부모 디렉토리)
+        parent = store.add_directory(root)
+
+        # 폴더 처리
+        for dirname in dirs:
+            folders.append(store.add(parent, dirname, ENTRY_FOLDER, FLAG_CHECKED))
+
+        # 파일 처리
+        for filename in filenames:
+            files.append(store.add(parent, filename, ENTRY_FILE, FLAG_CHECKED))
+
+    return store, folders, files
+
+
+# 불러온 목록의 이름 검색 색인
+class NameSearchIndex:
+    """표시 순서대로 소문자로 바꾼 이름을 한 문자열로 이어 붙이고 이름마다 시작 위치를 기록한다.
+
+    검색은 이어 붙인 문자열을 str.find로 훑어 찾은 위치를 이분 탐색으로 행에 대응시키고,
+    검색어가 이전 검색어를 포함하면(한 글자씩 더 입력하는 경우) 이전 결과 안에서만 다시 확인한다.
+    """
+    LINEAR_SCAN_THRESHOLD = 20000  # 일치가 이보다 많으면 이름마다 포함 여부를 확인하는 편이 빠름
+
+    def __init__(self, store, rows):
+        self.rows = rows
+        names = [store.name(index).lower() for index in rows]
+        self.text = '\n'.join(names) + '\n'
+        self.starts = array('Q', [0])
+        self.starts.extend(accumulate(len(name) + 1 for name in names))  # 마지막 값은 끝 위치
+        self._last_query = None
+        self._last_positions = None
+
+    def name_at(self, position):
+        return self.text[self.starts[position]:self.starts[position + 1] - 1]
+
+    def search(self, query):
+        """검색어를 이름에 포함하는 항목 번호를 표시 순서대로 반환"""
+        query = query.lower()
+        if (self._last_query is not None and self._last_query in query
+                and len(self._last_positions) < self.LINEAR_SCAN_THRESHOLD):
+            positions = array('I', (position for position in self._last_positions if query in self.name_at(position)))
+        else:
+            positions = array('I')
+            text = self.text
+            starts = self.starts
+            found = text.find(query)
+            while found != -1:
+                if len(positions) >= self.LINEAR_SCAN_THRESHOLD:
+                    names = text.split('\n')
+                    names.pop()
+                    positions = array('I', compress(range(len(names)), [query in name for name in names]))
+                    break
+                position = bisect.bisect_right(starts, found) - 1
+                positions.append(position)
+                found = text.find(query, starts[position + 1])  # 같은 이름의 다음 일치는 건너뜀
+        self._last_query = query
+        self._last_positions = positions
+        rows = self.rows
+        return array('I', (rows[position] for position in positions))
+
+
+# 스캔한 파일/폴더 목록 모델 (EntryStore를 직접 보여주며 보이는 행만 그림)
+class EntryListModel(QAbstractTableModel):
+    HEADERS = ["유형", "경로", "이름"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = EntryStore()
+        self._rows = array('I')  # 표시 순서대로의 항목 번호
+        self._icons = {}
+
+    def set_icons(self, folder_icon, file_icon):
+        self._icons = {ENTRY_FOLDER: folder_icon, ENTRY_FILE: file_icon}
+
+    def set_store(self, store, rows):
+        """저장소와 표시할 항목 순서 교체"""
+        self.beginResetModel()
+        self.store = store
+        self._rows = rows
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """같은 저장소에서 표시할 항목만 교체 (검색 결과 표시)"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rows(self):
+        return self._rows
+
+    def entry_at(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return self.store.type_name(entry)
+            if column == 1:
+                return self.store.directory(entry)
+            return self.store.name(entry)
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self.store.is_checked(entry) else Qt.Unchecked
+            if role == Qt.DecorationRole:
+                return self._icons.get(self.store.types[entry])
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != 0:
+            return False
+        self.store.set_checked(self._rows[index.row()], value == Qt.Checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def refresh_checks(self):
+        """체크 상태가 일괄 변경된 후 화면 갱신"""
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0), [Qt.CheckStateRole])
+
+
+# 번역 전/후 이름 표 모델 (보이는 행만 그리므로 결과가 많아도 가벼움)
+class TranslationTableModel(QAbstractTableModel):
+    HEADERS = ["유형", "원본 이름", "번역된 이름"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (유형, 원본 이름, 번역된 이름)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return "📁 폴더" if row[0] == 'folder' else "📄 파일"
+            return row[index.column()]
+        if role == Qt.ToolTipRole and index.column() > 0:
+            return row[index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """열 기준 정렬 (헤더 클릭 시 호출)"""
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda row: row[column], reverse=(order == Qt.DescendingOrder))
+        self.layoutChanged.emit()
+
+    def set_rows(self, rows):
+        """전체 행 교체"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """행 묶음 추가"""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_rows([])
+
+
+# 작업 대기열 (여러 기준 폴더를 설정과 함께 순서대로 등록)
+JOB_STATUS_LABELS = {
+    'waiting': '대기',
+    'scanning': '스캔 중',
+    'translating': '번역 중',
+    'done': '완료',
+    'failed': '실패',
+    'cancelled': '취소됨',
+}
+
+
+class TranslationJob:
+    """작업 대기열의 번역 작업 하나 (기준 폴더 + 추가 시점의 번역 설정)"""
+    def __init__(self, root_path, settings):
+        self.root_path = root_path
+        self.settings = settings  # 언어, 모델, 프롬프트, 청크 크기, 스캔 옵션, 용어집
+        self.reset()
+
+    def reset(self):
+        """실행 전 상태 초기화"""
+        self.status = 'waiting'
+        self.error = ''
+        self.total = 0  # 번역 대상 이름 수
+        self.processed = 0
+        self.translated = 0
+        self.requests = 0
+        self.started_at = None  # 번역 시작 시각 (처리량 계산용)
+        self.finished_at = None
+        self.mapping_path = ''
+        # 실행 중에만 사용하는 상태
+        self.store = None
+        self.indexes = None
+        self.pipeline = None  # 번역 요청 준비/응답 처리 (TranslationPipeline)
+        self.template = None
+        self.checkpoint = None
+        self.pending = deque()
+        self.in_flight = 0
+        self.results = {}  # 원본 이름 -> 기본 언어 번역
+
+    def languages(self):
+        """기본 언어 + 함께 번역할 언어 목록"""
+        language = self.settings['language']
+        return [language] + [lang for lang in self.settings['extra_languages'] if lang != language]
+
+    def throughput(self):
+        """번역 시작 이후 분당 처리한 이름 수"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return self.processed * 60.0 / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self):
+        """UI 표시용 상태 요약"""
+        return {
+            'status': self.status,
+            'error': self.error,
+            'total': self.total,
+            'processed': self.processed,
+            'translated': self.translated,
+            'requests': self.requests,
+            'throughput': self.throughput(),
+            'mapping_path': self.mapping_path,
+        }
+
+
+# 여러 기준 폴더의 번역 작업을 하나의 API 키 풀로 처리하는 쓰레드 클래스
+class JobQueueThread(QThread):
+    """작업 대기열 실행기
+
+    - 한 작업을 번역하는 동안 다음 작업을 미리 스캔한다.
+    - 요청은 번역 중인 작업 사이에서 청크 단위로 돌아가며(round-robin) 배정해 API 사용량을 공평하게 나눈다.
+    - 작업마다 결과를 체크포인트에 기록하고, 끝나면 매핑 파일로 저장한다.
+    """
+    job_signal = pyqtSignal(int, dict)  # (작업 번호, 상태 요약)
+    key_usage_signal = pyqtSignal(list)  # API 키별 사용량 및 상태
+    MAX_ACTIVE_JOBS = 3  # 동시에 스캔/번역하는 작업 수 (스캔 결과를 한꺼번에 메모리에 두지 않음)
+
+    def __init__(self, api_keys, jobs, delay_time=3):
+        super().__init__()
+        self.api_keys = api_keys
+        self.jobs = jobs
+        self.delay_time = delay_time
+        self.control = RunControl()
+
+    @staticmethod
+    def mapping_dir():
+        """작업 결과 매핑 파일 저장 디렉토리"""
+        base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation) or os.path.expanduser('~')
+        return os.path.join(base_dir, 'mappings')
+
+    def scan_job(self, job):
+        """기준 폴더를 스캔하여 (저장소, 번역할 항목 번호) 반환 (스캔 스레드에서 실행)"""
+        settings = job.settings
+        entry_filter = ScanFilter.from_text(settings.get('filter_rules', ''), settings['exclude_extensions'])
+        store, folders, files = scan_directory(job.root_path, settings['include_subfolders'], entry_filter,
+                                               settings.get('max_depth'))
+        # 이미 대상 언어인 이름은 목록에서와 같이 제외
+        store.apply_script_skips(job.languages())
+        indexes = array('I', (
+            index for index in folders + files
+            if store.is_checked(index) and (settings['translate_folders'] or not store.is_folder(index))
+        ))
+        return store, indexes
+
+    def prepare_job(self, job, store, indexes):
+        """스캔 결과로 번역기와 청크 목록 준비 (이전 실행의 체크포인트 결과는 다시 요청하지 않음)"""
+        settings = job.settings
+        names = [store.name(index) for index in indexes]
+        rule_engine = RuleEngine.from_text(settings['glossary_rules'])
+        # 화면에서 번역할 때와 같은 체크포인트를 사용 (대기열 결과를 화면에서 API 호출 없이 이어받을 수 있음)
+        checkpoint = RunCheckpoint.for_run(job.root_path, job.languages(), settings['model_name'],
+                                           settings['custom_prompt'], rule_engine)
+        completed = []
+        if checkpoint.exists():
+            requested_names = set(names)
+            completed = [result for result in checkpoint.load() if result['original'] in requested_names]
+        completed_names = {result['original'] for result in completed}
+        
+        pipeline = TranslationPipeline(
+            [name for name in names if name not in completed_names],
+            settings['language'],
+            settings['chunk_size'],
+            settings['model_name'],
+            settings['custom_prompt'],
+            settings['extra_languages'],
+            checkpoint,
+            completed,
+            rule_engine,
+            shared_cache_url=settings.get('shared_cache_url'),
+            label=job.root_path
+        )
+        checkpoint.start()
+        
+        results = list(completed)
+        names_to_send = pipeline.prepare(results)
+        chunk_size = pipeline.chunk_size
+        
+        job.store = store
+        job.indexes = indexes
+        job.pipeline = pipeline
+        job.template = pipeline.build_template()
+        job.checkpoint = checkpoint
+        job.pending = deque(names_to_send[i:i + chunk_size] for i in range(0, len(names_to_send), chunk_size))
+        job.results = {result['original']: result['translated'] for result in results}
+        job.total = len(completed) + len(pipeline.filenames)
+        job.processed = job.total - sum(pipeline.item_weight(name) for name in names_to_send)
+        job.translated = len(job.results)
+        job.started_at = time.monotonic()
+        logger.info(f"작업 준비 완료: {job.root_path} - 번역 대상 {job.total}개, 요청할 청크 {len(job.pending)}개")
+
+    def finish_job(self, job):
+        """번역 결과를 매핑 파일로 저장하고 작업 상태 정리"""
+        job.finished_at = time.monotonic()
+        job.pipeline.flush_shared_cache()
+        job.requests = job.pipeline.metrics.requests
+        if not job.results:
+            job.status = 'failed'
+            job.error = '번역 결과가 없습니다.' if job.total else '번역할 항목이 없습니다.'
+        else:
+            store = job.store
+            
+            def mapping_rows():
+                for index in job.indexes:
+                    translated = job.results.get(store.name(index))
+                    if translated:
+                        relative_path = os.path.relpath(store.path(index), job.root_path).replace(os.sep, '/')
+                        yield store.type_name(index), relative_path, sanitize_filename(translated)
+            
+            try:
+                os.makedirs(self.mapping_dir(), exist_ok=True)
+                folder_name = sanitize_filename(os.path.basename(os.path.normpath(job.root_path))) or 'root'
+                path = os.path.join(self.mapping_dir(), f"{folder_name}_{os.path.basename(job.checkpoint.path)}")
+                count = write_mapping(path, mapping_rows())
+                job.mapping_path = path
+                job.status = 'done'
+                logger.info(f"작업 완료: {job.root_path} - 매핑 {count}개 저장 ({path})")
+            except OSError as e:
+                job.status = 'failed'
+                job.error = f"매핑 파일 저장 실패: {str(e)}"
+                logger.error(f"작업 매핑 파일 저장 오류: {str(e)}")
+        # 스캔 결과 등 큰 상태는 바로 해제
+        job.store = None
+        job.indexes = None
+        job.pipeline = None
+        job.results = {}
+
+    def run(self):
+        key_pool = ApiKeyPool(self.api_keys, self.delay_time)
+        control = self.control
+        waiting = deque(index for index, job in enumerate(self.jobs) if job.status == 'waiting')
+        scanning = {}  # future -> 작업 번호
+        active = deque()  # 번역 중인 작업 번호 (청크를 돌아가며 배정할 순서)
+        in_flight = {}  # future -> (작업 번호, 요청 묶음, 키 상태)
+        pause_started = None
+        
+        # 작업 상태는 일정 간격으로 묶어서 전송
+        ui_throttle = SignalThrottle()
+        dirty_jobs = set()
+        
+        def flush_ui_updates(force=False):
+            if not dirty_jobs or not ui_throttle.ready(force):
+                return
+            for index in sorted(dirty_jobs):
+                self.job_signal.emit(index, self.jobs[index].snapshot())
+            self.key_usage_signal.emit(key_pool.usage())
+            dirty_jobs.clear()
+        
+        def set_status(index, status, error=''):
+            job = self.jobs[index]
+            job.status = status
+            job.error = error
+            dirty_jobs.add(index)
+            flush_ui_updates(force=True)
+        
+        scan_executor = ThreadPoolExecutor(max_workers=1)
+        executor = ThreadPoolExecutor(max_workers=len(key_pool))
+        try:
+            while (waiting or scanning or active) and not control.cancelled:
+                # 일시정지 중에는 새 스캔/요청을 시작하지 않고, 재개 시 쉰 시간만큼 키별 요청 시각을 미룸
+                if control.paused:
+                    if pause_started is None:
+                        pause_started = time.monotonic()
+                        logger.info("작업 대기열 일시정지")
+                elif pause_started is not None:
+                    key_pool.shift(time.monotonic() - pause_started, pause_started)
+                    pause_started = None
+                    logger.info("작업 대기열 재개")
+                
+                # 번역 중인 작업이 적으면 다음 작업을 미리 스캔
+                while waiting and not scanning and len(active) < self.MAX_ACTIVE_JOBS and not control.paused:
+                    index = waiting.popleft()
+                    scanning[scan_executor.submit(self.scan_job, self.jobs[index])] = index
+                    set_status(index, 'scanning')
+                
+                # 스캔이 끝난 작업은 번역 대상으로 등록
+                for future in [future for future in scanning if future.done()]:
+                    index = scanning.pop(future)
+                    job = self.jobs[index]
+                    try:
+                        self.prepare_job(job, *future.result())
+                    except Exception as e:
+                        logger.error(f"작업 준비 중 오류 발생: {job.root_path} - {str(e)}", exc_info=True)
+                        set_status(index, 'failed', str(e))
                         continue
-                    
-                    # 이름 변경 시도
+                    if job.pending:
+                        active.append(index)
+                        set_status(index, 'translating')
+                    else:
+                        self.finish_job(job)
+                        set_status(index, job.status, job.error)
+                
+                # 사용 가능한 키마다 번역 중인 작업을 돌아가며 청크 하나씩 배정
+                while not control.paused and any(self.jobs[index].pending for index in active):
+                    key_state = key_pool.try_acquire()
+                    if key_state is None:
+                        break
+                    while not self.jobs[active[0]].pending:
+                        active.rotate(-1)
+                    index = active[0]
+                    active.rotate(-1)
+                    job = self.jobs[index]
+                    pipeline = job.pipeline
+                    request = pipeline.new_request(job.pending.popleft())
+                    request['attempts'] += 1
+                    job.in_flight += 1
+                    future = executor.submit(pipeline.translate_request, key_state.api_key, job.template,
+                                             request['chunk'], pipeline.hedger.deadline())
+                    in_flight[future] = (index, request, key_state)
+                
+                flush_ui_updates()
+                futures = list(in_flight) + list(scanning)
+                if not futures:
+                    if active and not key_pool.has_usable_keys():
+                        logger.error("사용 가능한 API 키가 없어 작업 대기열을 중단합니다.")
+                        for index in active:
+                            set_status(index, 'failed', '사용 가능한 API 키가 없습니다.')
+                        active.clear()
+                        break
+                    # 모든 키가 대기/쿨다운 중이면 가장 빠른 키까지 대기 (취소 시 즉시 깨어남)
+                    control.sleep(min(max(key_pool.seconds_until_available() or 0.0, 0.05), 0.2))
+                    continue
+                
+                # 완료된 요청 처리 (취소/일시정지를 바로 반영하도록 짧게 나눠 대기)
+                timeout = key_pool.seconds_until_available() if any(self.jobs[index].pending for index in active) else None
+                timeout = 0.2 if timeout is None else min(timeout, 0.2)
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in in_flight:
+                        continue
+                    index, request, key_state = in_flight.pop(future)
+                    job = self.jobs[index]
+                    pipeline = job.pipeline
+                    job.in_flight -= 1
                     try:
-                        os.rename(original_path, new_path)
-                        
-                        # 로그 추가 (폴더 구조 추적을 위한 디버깅)
-                        if item_type == 'folder':
-                            logger.info(f"폴더 이름 변경: {original_path} -> {new_path} (깊이: {original_path.count(os.sep)})")
-                        
-                        # 성공 목록에 추가
-                        renamed_items.append({
-                            'original_path': original_path,
-                            'new_path': new_path,
-                            'type': item_type
-                        })
-                    except PermissionError:
-                        logger.error(f"권한 오류: {original_path} - 파일이 사용 중이거나 권한이 없습니다.")
-                    except FileNotFoundError:
-                        logger.error(f"파일을 찾을 수 없음: {original_path}")
-                    except OSError as e:
-                        logger.error(f"OS 오류: {str(e)} - {original_path}")
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = e
+                    key_pool.release(key_state, outcome if isinstance(outcome, Exception) else None)
+                    # 재시도/시리즈 펼치기/체크포인트 기록은 화면 번역과 같은 처리 사용 (다시 보낼 청크는 작업 대기열로)
+                    now = time.monotonic()
+                    request['attempts'] -= 1
+                    request['primary_elapsed'] = now - request['started']
+                    request['done'] = True
+                    chunk_results, processed = pipeline.complete_request(request, outcome, now, job.pending)
+                    job.results.update((result['original'], result['translated']) for result in chunk_results)
+                    job.processed += processed
+                    job.translated = len(job.results)
+                    job.requests = pipeline.metrics.requests
+                    dirty_jobs.add(index)
                     
-                    # 처리 간격
-                    time.sleep(0.1)  # 시스템 과부하 방지
-                    
-                except Exception as e:
-                    logger.error(f"파일 이름 변경 오류: {str(e)} - {original_path}")
-            
-            # 결과 신호 전송
-            self.result_signal.emit(renamed_items)
-            
-        except Exception as e:
-            self.error_signal.emit(str(e))
-            logger.exception("이름 변경 스레드 오류")
+                    if not job.pending and not job.in_flight:
+                        active.remove(index)
+                        self.finish_job(job)
+                        set_status(index, job.status, job.error)
+            flush_ui_updates(force=True)
+        finally:
+            if in_flight:
+                # 취소 시 진행 중인 요청은 기다리지 않고, 늦게 도착한 응답도 체크포인트에는 기록
+                logger.info(f"작업 대기열 취소 - 진행 중인 요청 {len(in_flight)}건은 기다리지 않습니다.")
+                for future, (index, _, _) in in_flight.items():
+                    future.add_done_callback(self.jobs[index].pipeline.checkpoint_late_result)
+            executor.shutdown(wait=False, cancel_futures=True)
+            scan_executor.shutdown(wait=False, cancel_futures=True)
+            # 끝나지 않은 작업은 취소로 표시 (다음 실행에서 체크포인트부터 이어서 진행)
+            for index, job in enumerate(self.jobs):
+                if job.status in ('scanning', 'translating') or (control.cancelled and job.status == 'waiting'):
+                    job.status = 'cancelled'
+                    job.store = None
+                    job.indexes = None
+                    self.job_signal.emit(index, job.snapshot())
+        logger.info(f"작업 대기열 종료 - API 키별 사용량: {format_key_usage(key_pool.usage())}")
+
+
+# 작업 대기열 표 모델
+class JobQueueModel(QAbstractTableModel):
+    HEADERS = ["기준 폴더", "언어", "상태", "진행", "처리량", "결과 파일"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = []
+        self._snapshots = []  # 실행 쓰레드가 보낸 작업별 상태 요약
+
+    def jobs(self):
+        return list(self._jobs)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        state = self._snapshots[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return job.root_path
+            if column == 1:
+                return ", ".join(LANGUAGE_LABELS[lang] for lang in job.languages())
+            if column == 2:
+                return JOB_STATUS_LABELS[state['status']]
+            if column == 3:
+                return f"{state['processed']}/{state['total']} (요청 {state['requests']}회)" if state['total'] else ""
+            if column == 4:
+                return f"{state['throughput']:.1f}개/분" if state['throughput'] else ""
+            return state['mapping_path']
+        if role == Qt.ToolTipRole:
+            if column == 2 and state['error']:
+                return state['error']
+            if column in (0, 5):
+                return self.data(index, Qt.DisplayRole)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def add_job(self, job):
+        row = len(self._jobs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._jobs.append(job)
+        self._snapshots.append(job.snapshot())
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """선택한 작업 삭제"""
+        self.beginResetModel()
+        removed = set(rows)
+        self._jobs = [job for row, job in enumerate(self._jobs) if row not in removed]
+        self._snapshots = [state for row, state in enumerate(self._snapshots) if row not in removed]
+        self.endResetModel()
+
+    def update_job(self, row, snapshot):
+        """실행 쓰레드가 보낸 상태로 작업 행 갱신"""
+        self._snapshots[row] = snapshot
+        self.dataChanged.emit(self.index(row, 2), self.index(row, len(self.HEADERS) - 1))
+
+    def reset_jobs(self, rows):
+        """다시 실행할 작업 상태 초기화"""
+        for row in rows:
+            self._jobs[row].reset()
+            self._snapshots[row] = self._jobs[row].snapshot()
+        if self._jobs:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._jobs) - 1, len(self.HEADERS) - 1))
 
 
 # 메인 윈도우 클래스
@@ -264,14 +3194,48 @@ class TranslationApp(QMainWindow):
         self.settings = QSettings("TranslationApp", "FileNameTranslator")
         
         # 앱 데이터 초기화
-        self.selected_files = []
-        self.translated_filenames = {}
+        self.entry_store = EntryStore()  # 스캔한 파일/폴더 목록
+        self.all_rows = array('I')  # 목록에 표시하는 전체 항목 번호 (검색하지 않을 때)
+        self.search_index = None  # 첫 검색 때 만드는 이름 검색 색인
+        self.scanned_root = ""  # 목록을 불러온 기준 폴더 (매핑 파일의 상대 경로 기준)
+        self.translated_filenames = {}  # 원본 이름 -> 정제된 새 이름
+        self.translation_results = {}  # 원본 이름 -> {언어: 번역된 이름}
+        self.current_processing_indexes = array('I')  # 번역 중인 항목 번호
+        self.processing_by_name = {}  # 원본 이름 -> 번역 중인 항목 번호
+        self.active_thread = None  # 일시정지/취소 대상 작업 스레드
+        self.run_result_handled = False  # 작업 스레드의 결과 시그널 처리 여부
+        self.script_skipped_count = 0  # 스크립트 감지로 요청하지 않은 항목 수 (마지막 실행)
+        self.current_model_name = ""  # 마지막 번역 실행의 모델 (학습된 청크 크기 저장용)
+        self.current_adaptive_chunk = False  # 마지막 번역 실행의 청크 크기 자동 조절 여부
+        self.current_checkpoint = None  # 진행 중인 번역 실행의 체크포인트 (RunCheckpoint)
+        self.last_run_stats = None  # 마지막 번역 실행의 요청/토큰 통계
         
         # UI 초기화
         self.init_ui()
         
         # 저장된 설정 불러오기
         self.load_settings()
+        
+        # 저장된 API 키가 있으면 백그라운드에서 연결 미리 준비
+        self.warm_up_connection()
+        
+        # 마지막 경로에 중단된 번역이 있으면 안내
+        last_directory = self.path_input.text().strip()
+        if last_directory and RunCheckpoint.exists_for_root(last_directory):
+            self.statusBar().showMessage('이전에 중단된 번역이 있습니다. 파일을 가져온 뒤 같은 설정으로 번역하기를 누르면 이어서 진행합니다.')
+    
+    def warm_up_connection(self):
+        """백그라운드 스레드에서 Gemini 연결 준비"""
+        api_keys = parse_api_keys(self.api_key_input.text())
+        model_name = self.model_input.text().strip()
+        if not model_name:
+            return
+        for api_key in api_keys:
+            threading.Thread(
+                target=GeminiClientManager.instance().warm_up,
+                args=(api_key, model_name),
+                daemon=True
+            ).start()
     
     def init_ui(self):
         # 메인 윈도우 설정
@@ -290,7 +3254,7 @@ class TranslationApp(QMainWindow):
         api_key_layout = QHBoxLayout()
         
         self.api_key_input = QLineEdit()
-        self.api_key_input.setPlaceholderText("Google Gemini API 키를 입력하세요")
+        self.api_key_input.setPlaceholderText("Google Gemini API 키를 입력하세요 (여러 개는 쉼표로 구분하면 키별로 나눠 동시에 요청)")
         self.api_key_input.setEchoMode(QLineEdit.Password)  # 입력 내용 숨기기
         
         self.save_api_key_btn = QPushButton("API 키 저장")
@@ -313,6 +3277,13 @@ class TranslationApp(QMainWindow):
         self.model_input = QLineEdit("gemini-2.0-flash")
         self.model_input.setPlaceholderText("예: gemini-2.0-flash, gemini-1.5-pro")
         model_layout.addWidget(self.model_input, 1)
+        model_layout.addSpacing(20)
+        
+        # 팀 공유 번역 캐시 서버 (cache_server.py, 비워두면 사용하지 않음)
+        model_layout.addWidget(QLabel("공유 캐시 서버:"))
+        self.shared_cache_input = QLineEdit()
+        self.shared_cache_input.setPlaceholderText("예: http://192.168.0.10:8765 (비워두면 사용 안 함)")
+        model_layout.addWidget(self.shared_cache_input, 1)
         
         translation_settings_layout.addLayout(model_layout)
         
@@ -327,6 +3298,17 @@ class TranslationApp(QMainWindow):
         
         translation_settings_layout.addWidget(prompt_group)
         
+        # 용어집/정규식 규칙 설정 (일치하는 이름은 API 없이 번역)
+        glossary_group = QGroupBox("용어집 / 규칙 (이름 전체가 규칙으로 번역되면 API를 호출하지 않음)")
+        glossary_layout = QVBoxLayout()
+        self.glossary_input = QTextEdit()
+        self.glossary_input.setPlaceholderText("한 줄에 하나씩 입력하세요. 예)\n원문 = 번역\nre:IMG_(\\d+) = 사진_\\1")
+        self.glossary_input.setMaximumHeight(80)
+        glossary_layout.addWidget(self.glossary_input)
+        glossary_group.setLayout(glossary_layout)
+        
+        translation_settings_layout.addWidget(glossary_group)
+        
         # 청크 크기 및 대기 시간 설정
         chunk_delay_layout = QHBoxLayout()
         
@@ -337,6 +3319,10 @@ class TranslationApp(QMainWindow):
         self.chunk_size_input.setFixedWidth(50)
         chunk_size_layout.addWidget(self.chunk_size_input)
         chunk_size_layout.addWidget(QLabel("개"))
+        # 응답 시간/오류에 따라 청크 크기 자동 조절 (입력값은 처음 실행할 때의 시작 크기)
+        self.adaptive_chunk_checkbox = QCheckBox("자동 조절")
+        self.adaptive_chunk_checkbox.setChecked(True)
+        chunk_size_layout.addWidget(self.adaptive_chunk_checkbox)
         
         # 대기 시간 설정
         delay_time_layout = QHBoxLayout()
@@ -387,7 +3373,14 @@ class TranslationApp(QMainWindow):
         self.exclude_extensions_input.setPlaceholderText("예: jpg,png,mp3,wav (쉼표로 구분)")
         self.exclude_extensions_input.setFixedWidth(300)  # 입력창 너비 고정
         exclude_ext_layout.addWidget(self.exclude_extensions_input)
-        exclude_ext_layout.addStretch(1)  # 남은 공간을 채우기 위한 스트레치 추가
+        exclude_ext_layout.addSpacing(20)
+        
+        # 포함/제외 규칙 (스캔할 때 한 번 컴파일하여 적용)
+        exclude_ext_layout.addWidget(QLabel("필터 규칙:"))
+        self.filter_rules_input = QLineEdit()
+        self.filter_rules_input.setPlaceholderText("예: -*.tmp; +*.mp4; -re:^\\.; size>10MB; mtime>30d; depth<=2")
+        self.filter_rules_input.setToolTip(ScanFilter.__doc__)
+        exclude_ext_layout.addWidget(self.filter_rules_input, 1)
         file_layout.addLayout(exclude_ext_layout)
         
         # 파일 탐색 설정 (체크박스들을 한 줄에 배치)
@@ -398,6 +3391,14 @@ class TranslationApp(QMainWindow):
         self.include_subfolders_checkbox.setChecked(False)
         file_settings_layout.addWidget(self.include_subfolders_checkbox)
         
+        # 하위 폴더 깊이 제한
+        file_settings_layout.addWidget(QLabel("깊이 제한:"))
+        self.max_depth_input = QLineEdit("")
+        self.max_depth_input.setPlaceholderText("무제한")
+        self.max_depth_input.setFixedWidth(60)
+        file_settings_layout.addWidget(self.max_depth_input)
+        file_settings_layout.addSpacing(20)
+        
         # 폴더명 번역 설정
         self.translate_folders_checkbox = QCheckBox("폴더명도 번역")
         self.translate_folders_checkbox.setChecked(False)
@@ -425,15 +3426,44 @@ class TranslationApp(QMainWindow):
         self.select_all_checkbox.stateChanged.connect(self.toggle_select_all)
         select_all_layout.addWidget(self.select_all_checkbox)
         select_all_layout.addStretch(1)
+        
+        # 불러온 목록에서 이름 검색 (입력이 멈추면 한 번만 검색)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("이름 검색")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setFixedWidth(250)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(100)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        select_all_layout.addWidget(self.search_input)
         files_layout.addLayout(select_all_layout)
         
         #1200 1000 800
-        self.files_tree = QTreeWidget()
-        self.files_tree.setHeaderLabels(["유형", "경로", "이름"])
+        self.files_model = EntryListModel(self)
+        self.files_model.set_icons(
+            self.style().standardIcon(QStyle.SP_DirIcon),
+            self.style().standardIcon(QStyle.SP_FileIcon)
+        )
+        self.files_tree = QTreeView()
+        self.files_tree.setModel(self.files_model)
+        self.files_tree.setRootIsDecorated(False)
+        self.files_tree.setUniformRowHeights(True)  # 행 높이 계산 생략 (대량 목록 스크롤 속도)
         self.files_tree.setColumnWidth(0, 60)   # 유형 컬럼 너비 증가
         self.files_tree.setColumnWidth(1, 380)  # 경로 컬럼 너비 조정
         self.files_tree.setColumnWidth(2, 380)  # 이름 컬럼 너비 조정
         self.files_tree.setAlternatingRowColors(True)
+        self.files_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        
+        # 번역 중에는 화면에 보이는 항목과 직접 지정한 항목을 먼저 번역
+        self.viewport_priority_timer = QTimer(self)
+        self.viewport_priority_timer.setSingleShot(True)
+        self.viewport_priority_timer.setInterval(150)  # 스크롤이 멈춘 뒤 한 번만 전달
+        self.viewport_priority_timer.timeout.connect(self.send_viewport_priority)
+        self.files_tree.verticalScrollBar().valueChanged.connect(lambda _: self.viewport_priority_timer.start())
+        self.files_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.files_tree.customContextMenuRequested.connect(self.show_files_context_menu)
         
         files_layout.addWidget(self.files_tree)
         files_group.setLayout(files_layout)
@@ -441,22 +3471,65 @@ class TranslationApp(QMainWindow):
         # 번역 결과 영역
         results_splitter = QSplitter(Qt.Horizontal)
         
-        # 번역된 파일명 텍스트 영역
+        # 번역된 파일명 표 (헤더 클릭으로 정렬)
         translated_group = QGroupBox("번역된 파일명")
         translated_layout = QVBoxLayout()
-        self.translated_text = QTextEdit()
-        self.translated_text.setReadOnly(True)
-        translated_layout.addWidget(self.translated_text)
+        self.translation_model = TranslationTableModel(self)
+        self.translated_table = QTableView()
+        self.translated_table.setModel(self.translation_model)
+        self.translated_table.setSortingEnabled(True)
+        self.translated_table.sortByColumn(-1, Qt.AscendingOrder)  # 초기에는 도착 순서 유지
+        self.translated_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.translated_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.translated_table.setAlternatingRowColors(True)
+        self.translated_table.setWordWrap(False)
+        self.translated_table.verticalHeader().setVisible(False)
+        self.translated_table.verticalHeader().setDefaultSectionSize(22)
+        self.translated_table.setColumnWidth(0, 70)
+        self.translated_table.setColumnWidth(1, 450)
+        self.translated_table.horizontalHeader().setStretchLastSection(True)
+        translated_layout.addWidget(self.translated_table)
         translated_group.setLayout(translated_layout)
         
         results_splitter.addWidget(translated_group)
         
+        # 작업 대기열 (여러 기준 폴더를 현재 설정과 함께 등록해 한 번에 처리)
+        job_group = QGroupBox("작업 대기열 (결과는 매핑 파일로 저장)")
+        job_layout = QVBoxLayout()
+        self.job_model = JobQueueModel(self)
+        self.job_table = QTableView()
+        self.job_table.setModel(self.job_model)
+        self.job_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.job_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.job_table.setWordWrap(False)
+        self.job_table.verticalHeader().setVisible(False)
+        self.job_table.verticalHeader().setDefaultSectionSize(22)
+        self.job_table.setColumnWidth(0, 300)
+        self.job_table.setColumnWidth(3, 160)
+        self.job_table.horizontalHeader().setStretchLastSection(True)
+        job_layout.addWidget(self.job_table)
+        
+        job_button_layout = QHBoxLayout()
+        self.add_job_btn = QPushButton("현재 폴더/설정을 대기열에 추가")
+        self.add_job_btn.clicked.connect(self.add_job_to_queue)
+        self.remove_job_btn = QPushButton("선택 작업 삭제")
+        self.remove_job_btn.clicked.connect(self.remove_selected_jobs)
+        self.run_queue_btn = QPushButton("대기열 실행")
+        self.run_queue_btn.clicked.connect(self.run_job_queue)
+        job_button_layout.addWidget(self.add_job_btn)
+        job_button_layout.addWidget(self.remove_job_btn)
+        job_button_layout.addStretch(1)
+        job_button_layout.addWidget(self.run_queue_btn)
+        job_layout.addLayout(job_button_layout)
+        job_group.setLayout(job_layout)
+        
         # 스플리터 설정
         files_result_splitter.addWidget(files_group)
         files_result_splitter.addWidget(results_splitter)
+        files_result_splitter.addWidget(job_group)
         
         # 스플리터 크기 비율 설정
-        files_result_splitter.setSizes([400, 200])
+        files_result_splitter.setSizes([400, 200, 120])
         
         main_layout.addWidget(files_result_splitter, 1)
         
@@ -479,6 +3552,19 @@ class TranslationApp(QMainWindow):
         language_layout.addWidget(self.korean_radio)
         language_layout.addWidget(self.english_radio)
         language_layout.addWidget(self.japanese_radio)
+        
+        # 기본 언어가 바뀌면 이미 받은 다른 언어 결과를 API 호출 없이 표시
+        self.language_group.buttonClicked.connect(self.on_language_changed)
+        
+        # 한 번의 요청으로 함께 번역할 추가 언어
+        language_layout.addSpacing(20)
+        language_layout.addWidget(QLabel("함께 번역할 언어:"))
+        self.extra_language_checkboxes = {}
+        for lang in LANGUAGES:
+            checkbox = QCheckBox(LANGUAGE_LABELS[lang])
+            checkbox.toggled.connect(self.apply_script_skips)
+            self.extra_language_checkboxes[lang] = checkbox
+            language_layout.addWidget(checkbox)
         language_layout.addStretch(1)
         
         language_group.setLayout(language_layout)
@@ -492,6 +3578,11 @@ class TranslationApp(QMainWindow):
         self.progress_bar.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.progress_bar)
         
+        # API 키별 사용량 표시
+        self.key_usage_label = QLabel("")
+        self.key_usage_label.setWordWrap(True)
+        main_layout.addWidget(self.key_usage_label)
+        
         # 버튼 영역
         button_layout = QHBoxLayout()
         
@@ -504,9 +3595,34 @@ class TranslationApp(QMainWindow):
         self.apply_btn.setEnabled(False)  # 초기 상태: 비활성화
         self.apply_btn.setMinimumHeight(40)
         
+        # 번역 결과를 매핑 파일로 내보내거나, 저장된 매핑 파일로 이름 변경
+        self.export_btn = QPushButton("매핑 내보내기")
+        self.export_btn.clicked.connect(self.export_mapping)
+        self.export_btn.setEnabled(False)
+        self.export_btn.setMinimumHeight(40)
+        
+        self.apply_mapping_btn = QPushButton("매핑 파일 적용")
+        self.apply_mapping_btn.clicked.connect(self.apply_mapping_file)
+        self.apply_mapping_btn.setMinimumHeight(40)
+        
+        # 실행 중인 번역/이름 변경 제어 버튼
+        self.pause_btn = QPushButton("일시정지")
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.setMinimumHeight(40)
+        
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.clicked.connect(self.cancel_active_run)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setMinimumHeight(40)
+        
         button_layout.addStretch(1)
         button_layout.addWidget(self.translate_btn)
         button_layout.addWidget(self.apply_btn)
+        button_layout.addWidget(self.export_btn)
+        button_layout.addWidget(self.apply_mapping_btn)
+        button_layout.addWidget(self.pause_btn)
+        button_layout.addWidget(self.cancel_btn)
         button_layout.addStretch(1)
         
         main_layout.addLayout(button_layout)
@@ -516,13 +3632,27 @@ class TranslationApp(QMainWindow):
     
     def toggle_select_all(self, state):
         """전체 선택/해제 체크박스 토글 시 호출"""
-        check_state = Qt.Checked if state == Qt.Checked else Qt.Unchecked
-        
-        # 모든 항목의 체크 상태 변경
-        root = self.files_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            item = root.child(i)
-            item.setCheckState(0, check_state)
+        checked = state == Qt.Checked
+        if self.files_model.rowCount() < len(self.all_rows):
+            # 검색 중에는 보이는 항목만 변경
+            for index in self.files_model.rows():
+                self.entry_store.set_checked(index, checked)
+        else:
+            # 모든 항목의 체크 상태 변경
+            self.entry_store.set_all_checked(checked)
+        self.files_model.refresh_checks()
+    
+    def apply_search(self):
+        """검색어를 이름에 포함하는 항목만 목록에 표시 (검색어가 없으면 전체)"""
+        query = self.search_input.text().strip()
+        if not query:
+            self.files_model.set_rows(self.all_rows)
+            return
+        if self.search_index is None:
+            self.search_index = NameSearchIndex(self.entry_store, self.all_rows)
+        rows = self.search_index.search(query)
+        self.files_model.set_rows(rows)
+        self.statusBar().showMessage(f"'{query}' 검색 결과: {len(rows)}개 / 전체 {len(self.all_rows)}개")
     
     def load_settings(self):
         """저장된 설정 불러오기"""
@@ -532,20 +3662,33 @@ class TranslationApp(QMainWindow):
         chunk_size = self.settings.value("chunk_size", "10")
         delay_time = self.settings.value("delay_time", "3")
         include_subfolders = self.settings.value("include_subfolders", False, type=bool)
+        max_depth = self.settings.value("max_depth", "")
         exclude_extensions = self.settings.value("exclude_extensions", "")
+        filter_rules = self.settings.value("filter_rules", "")
         model_name = self.settings.value("model_name", "gemini-2.0-flash")
+        shared_cache_url = self.settings.value("shared_cache_url", "")
         custom_prompt = self.settings.value("custom_prompt", "")
+        glossary_rules = self.settings.value("glossary_rules", "")
         translate_folders = self.settings.value("translate_folders", False, type=bool)
+        extra_languages = self.settings.value("extra_languages", "")
+        adaptive_chunk = self.settings.value("adaptive_chunk_size", True, type=bool)
         
         self.api_key_input.setText(api_key)
         self.path_input.setText(last_directory)
         self.chunk_size_input.setText(chunk_size)
         self.delay_time_input.setText(delay_time)
         self.include_subfolders_checkbox.setChecked(include_subfolders)
+        self.max_depth_input.setText(max_depth)
         self.exclude_extensions_input.setText(exclude_extensions)
+        self.filter_rules_input.setText(filter_rules)
         self.model_input.setText(model_name)
+        self.shared_cache_input.setText(shared_cache_url)
         self.prompt_input.setText(custom_prompt)
+        self.glossary_input.setPlainText(glossary_rules)
         self.translate_folders_checkbox.setChecked(translate_folders)
+        self.adaptive_chunk_checkbox.setChecked(adaptive_chunk)
+        for lang, checkbox in self.extra_language_checkboxes.items():
+            checkbox.setChecked(lang in extra_languages.split(','))
         
         # 저장된 언어 선택 적용
         if selected_language == 1:
@@ -563,10 +3706,16 @@ class TranslationApp(QMainWindow):
         self.settings.setValue("chunk_size", self.chunk_size_input.text())
         self.settings.setValue("delay_time", self.delay_time_input.text())
         self.settings.setValue("include_subfolders", self.include_subfolders_checkbox.isChecked())
+        self.settings.setValue("max_depth", self.max_depth_input.text())
         self.settings.setValue("exclude_extensions", self.exclude_extensions_input.text())
+        self.settings.setValue("filter_rules", self.filter_rules_input.text())
         self.settings.setValue("model_name", self.model_input.text())
+        self.settings.setValue("shared_cache_url", self.shared_cache_input.text())
         self.settings.setValue("custom_prompt", self.prompt_input.toPlainText())
+        self.settings.setValue("glossary_rules", self.glossary_input.toPlainText())
         self.settings.setValue("translate_folders", self.translate_folders_checkbox.isChecked())
+        self.settings.setValue("extra_languages", ",".join(self.get_extra_languages()))
+        self.settings.setValue("adaptive_chunk_size", self.adaptive_chunk_checkbox.isChecked())
     
     def save_api_key(self):
         """API 키 저장 버튼 클릭 시 실행"""
@@ -576,6 +3725,7 @@ class TranslationApp(QMainWindow):
             return
         
         self.settings.setValue("api_key", api_key)
+        self.warm_up_connection()
         QMessageBox.information(self, '알림', 'API 키가 저장되었습니다.')
     
     def browse_directory(self):
@@ -597,133 +3747,68 @@ class TranslationApp(QMainWindow):
             return
         
         try:
-            # 트리 위젯 초기화
-            self.files_tree.clear()
-            
-            # 헤더 레이블 순서 변경
-            self.files_tree.setHeaderLabels(["유형", "경로", "이름"])
-            self.files_tree.setColumnWidth(0, 60)   # 유형 컬럼 너비 증가
-            self.files_tree.setColumnWidth(1, 380)  # 경로 컬럼 너비 조정
-            self.files_tree.setColumnWidth(2, 380)  # 이름 컬럼 너비 조정
-            self.files_tree.setAlternatingRowColors(True)
-            
-            # 제외할 확장자 목록 가져오기
-            exclude_extensions_text = self.exclude_extensions_input.text().strip().lower()
-            exclude_extensions = [ext.strip() for ext in exclude_extensions_text.split(',') if ext.strip()]
+            # 제외 확장자와 필터 규칙을 한 번만 컴파일
+            try:
+                entry_filter = ScanFilter.from_text(self.filter_rules_input.text(), self.get_exclude_extensions())
+            except ValueError as e:
+                QMessageBox.warning(self, '경고', f'필터 규칙이 올바르지 않습니다. {str(e)}')
+                return
             
-            # 디버깅용 메시지
-            if exclude_extensions:
-                print(f"제외할 확장자: {exclude_extensions}")
+            # 파일 목록 초기화
+            self.entry_store = EntryStore()
+            self.all_rows = array('I')
+            self.search_index = None
+            self.files_model.set_store(self.entry_store, self.all_rows)
             
             # 하위 폴더 포함 여부 확인
             include_subfolders = self.include_subfolders_checkbox.isChecked()
             
-            # 파일과 폴더 목록 가져오기
-            files = []
-            folders = []
-            
-            if include_subfolders:
-                # 하위 폴더를 포함한 모든 파일 및 폴더 가져오기
-                for root, dirs, filenames in os.walk(directory_path):
-                    # 폴더 처리
-                    for dirname in dirs:
-                        folder_path = os.path.join(root, dirname)
-                        # 전체 경로 표시
-                        display_path = os.path.dirname(folder_path)
-                        
-                        folders.append({
-                            'name': dirname,
-                            'path': folder_path,
-                            'display_path': display_path,
-                            'type': 'folder'
-                        })
-                    
-                    # 파일 처리
-                    for filename in filenames:
-                        file_path = os.path.join(root, filename)
-                        if os.path.isfile(file_path):
-                            # 확장자 확인 (첫 번째 문자의 점을 제거)
-                            _, ext = os.path.splitext(filename)
-                            ext = ext.lower().lstrip('.')
-                            
-                            if ext in exclude_extensions:
-                                print(f"제외된 파일: {filename}, 확장자: {ext}")
-                                continue  # 제외된 확장자는 건너뜀
-                            
-                            # 전체 경로 표시 (directory_path를 기준으로)
-                            display_path = os.path.dirname(file_path)
-                            
-                            files.append({
-                                'name': filename,
-                                'path': file_path,
-                                'display_path': display_path,
-                                'type': 'file'
-                            })
-            else:
-                # 현재 디렉토리의 파일과 폴더만 가져오기
-                for item_name in os.listdir(directory_path):
-                    item_path = os.path.join(directory_path, item_name)
-                    
-                    # 폴더 처리
-                    if os.path.isdir(item_path):
-                        folders.append({
-                            'name': item_name,
-                            'path': item_path,
-                            'display_path': directory_path,
-                            'type': 'folder'
-                        })
-                    # 파일 처리
-                    elif os.path.isfile(item_path):
-                        # 확장자 확인 (첫 번째 문자의 점을 제거)
-                        _, ext = os.path.splitext(item_name)
-                        ext = ext.lower().lstrip('.')
-                        
-                        if ext in exclude_extensions:
-                            print(f"제외된 파일: {item_name}, 확장자: {ext}")
-                            continue  # 제외된 확장자는 건너뜀
-                        
-                        # 루트 디렉토리 경로 표시
-                        display_path = directory_path
-                        
-                        files.append({
-                            'name': item_name,
-                            'path': item_path,
-                            'display_path': display_path,
-                            'type': 'file'
-                        })
-            
-            # 폴더와 파일을 하나의 목록으로 합치기
-            all_items = folders + files
+            # 파일과 폴더 목록 가져오기 (항목은 저장소에 번호로만 보관)
+            store, folders, files = scan_directory(directory_path, include_subfolders, entry_filter, self.get_max_depth())
             
-            if not all_items:
+            if not len(store):
                 QMessageBox.information(self, '알림', '선택한 경로에 파일이나 폴더가 없거나 모든 파일이 제외되었습니다.')
                 return
             
-            # 선택된 파일 목록 업데이트
-            self.selected_files = all_items
-            
-            # 트리 위젯에 파일 목록 추가 (유형을 앞에 표시)
-            for item in all_items:
-                display_path = item['display_path']
-                tree_item = QTreeWidgetItem([item['type'], display_path, item['name']])
-                
-                # 아이콘 설정
-                if item['type'] == 'folder':
-                    tree_item.setIcon(0, self.style().standardIcon(QStyle.SP_DirIcon))  # 아이콘 위치를 0번 컬럼으로 변경
-                else:
-                    tree_item.setIcon(0, self.style().standardIcon(QStyle.SP_FileIcon))  # 아이콘 위치를 0번 컬럼으로 변경
-                
-                tree_item.setCheckState(0, Qt.Checked)  # 체크박스는 첫 번째 컬럼에 유지
-                self.files_tree.addTopLevelItem(tree_item)
+            # 파일 목록 업데이트 (폴더를 먼저 표시, 모든 항목 체크)
+            self.entry_store = store
+            self.scanned_root = directory_path
+            self.all_rows = folders + files
+            self.files_model.set_store(store, self.all_rows)
+            if self.search_input.text().strip():
+                self.apply_search()
             
             # 전체 선택 체크박스 상태 업데이트
             self.select_all_checkbox.setChecked(True)
             
-            self.statusBar().showMessage(f'파일 {len(files)}개, 폴더 {len(folders)}개를 불러왔습니다.')
+            # 이미 대상 언어인 이름은 기본으로 선택 해제
+            skipped = self.apply_script_skips()
+            skipped_text = f' (이미 대상 언어이거나 번역할 글자가 없는 {skipped}개는 선택 해제)' if skipped else ''
+            self.statusBar().showMessage(f'파일 {len(files)}개, 폴더 {len(folders)}개를 불러왔습니다.{skipped_text}')
         except Exception as e:
             QMessageBox.critical(self, '오류', f'파일 목록을 불러오는 중 오류가 발생했습니다: {str(e)}')
             logger.error(f"파일 목록 불러오기 오류: {str(e)}")
     
+    def get_exclude_extensions(self):
+        """제외할 확장자 목록 (소문자, 앞의 점 제거)"""
+        text = self.exclude_extensions_input.text().strip().lower()
+        return [ext.strip().lstrip('.') for ext in text.split(',') if ext.strip().lstrip('.')]
+    
+    def get_shared_cache_url(self):
+        """공유 캐시 서버 주소 (비어 있으면 None, 스킴이 없으면 http://를 붙임)"""
+        url = self.shared_cache_input.text().strip()
+        if not url:
+            return None
+        return url if '://' in url else 'http://' + url
+    
+    def get_max_depth(self):
+        """하위 폴더 깊이 제한 (비어 있거나 올바르지 않으면 무제한)"""
+        try:
+            max_depth = int(self.max_depth_input.text())
+        except ValueError:
+            return None
+        return max_depth if max_depth >= 0 else None
+    
     def get_selected_language(self):
         """선택된 언어 가져오기"""
         if self.korean_radio.isChecked():
@@ -734,94 +3819,82 @@ class TranslationApp(QMainWindow):
             return "japanese"
         return "korean"  # 기본값
     
+    def get_extra_languages(self):
+        """함께 번역할 추가 언어 목록 가져오기"""
+        return [lang for lang, checkbox in self.extra_language_checkboxes.items() if checkbox.isChecked()]
+    
+    def apply_script_skips(self):
+        """현재 언어 설정 기준으로 이미 번역된 이름의 선택 해제 상태 갱신"""
+        language = self.get_selected_language()
+        languages = [language] + [lang for lang in self.get_extra_languages() if lang != language]
+        skipped = self.entry_store.apply_script_skips(languages)
+        self.files_model.refresh_checks()
+        return skipped
+    
+    def on_language_changed(self, button):
+        """기본 언어 변경 시 저장된 언어별 결과로 번역 목록 전환"""
+        self.apply_script_skips()
+        if not self.translation_results:
+            return
+        language = self.get_selected_language()
+        self.show_translations(language)
+        self.apply_btn.setEnabled(bool(self.translated_filenames))
+        self.export_btn.setEnabled(bool(self.translated_filenames))
+        if not self.translated_filenames:
+            self.statusBar().showMessage(f'{LANGUAGE_LABELS[language]} 번역 결과가 없습니다. 다시 번역하거나 함께 번역할 언어에 추가하세요.')
+    
     def translate_filenames(self):
         """번역하기 버튼 클릭 시 실행"""
-        # 체크된 항목 목록 가져오기
-        checked_items = []
-        root = self.files_tree.invisibleRootItem()
-        
-        for i in range(root.childCount()):
-            item = root.child(i)
-            if item.checkState(0) == Qt.Checked:
-                item_type = item.text(0)  # 유형
-                display_path = item.text(1)  # 경로
-                item_name = item.text(2)  # 이름
-                
-                # selected_files 배열에서 일치하는 항목 찾기
-                for file_item in self.selected_files:
-                    if file_item['name'] == item_name and file_item['display_path'] == display_path and file_item['type'] == item_type:
-                        checked_items.append(file_item)
-                        break
+        # 체크된 항목 번호 목록 가져오기
+        store = self.entry_store
+        checked_items = store.checked_indexes()
         
-        if not checked_items:
+        if not len(checked_items):
             QMessageBox.warning(self, '경고', '번역할 항목이 선택되지 않았습니다. 항목을 선택한 후 다시 시도하세요.')
             return
         
-        api_key = self.api_key_input.text().strip()
-        if not api_key:
+        api_keys = parse_api_keys(self.api_key_input.text())
+        if not api_keys:
             QMessageBox.warning(self, '경고', 'API 키를 입력하세요.')
             return
         
+        # 용어집/규칙 파싱
+        try:
+            rule_engine = RuleEngine.from_text(self.glossary_input.toPlainText())
+        except ValueError as e:
+            QMessageBox.warning(self, '경고', f'용어집/규칙 설정이 올바르지 않습니다. {str(e)}')
+            return
+        
         # 폴더명 번역 체크 여부 확인
         translate_folders = self.translate_folders_checkbox.isChecked()
         
-        # 제외할 확장자 목록 가져오기
-        exclude_extensions_text = self.exclude_extensions_input.text().strip().lower()
-        exclude_extensions = [ext.strip() for ext in exclude_extensions_text.split(',') if ext.strip()]
-        
-        # 확장자 및 폴더 설정에 따라 항목 필터링
-        excluded_items = []
-        filtered_items = []
+        # 폴더 설정에 따라 항목 필터링 (확장자와 필터 규칙은 스캔할 때 이미 적용됨)
+        excluded_folders = array('I')
+        filtered_items = array('I')
         
         for item in checked_items:
-            # 폴더 처리
-            if item['type'] == 'folder':
-                if translate_folders:
-                    filtered_items.append(item)
-                else:
-                    excluded_items.append(item)
-                continue
-                
-            # 파일 처리
-            filename = item['name']
-            _, ext = os.path.splitext(filename)
-            ext = ext.lower().lstrip('.')
-            
-            if ext in exclude_extensions:
-                excluded_items.append(item)
+            if store.is_folder(item) and not translate_folders:
+                excluded_folders.append(item)
             else:
                 filtered_items.append(item)
         
-        if not filtered_items:
-            # 제외 사유 메시지 생성
-            excluded_files_msg = f"제외된 파일: {len([item for item in excluded_items if item['type'] == 'file'])}개"
-            excluded_folders_msg = ""
-            if not translate_folders:
-                excluded_folders_count = len([item for item in excluded_items if item['type'] == 'folder'])
-                if excluded_folders_count > 0:
-                    excluded_folders_msg = f", 제외된 폴더: {excluded_folders_count}개 (폴더명 번역 옵션 꺼짐)"
-            
-            QMessageBox.warning(self, '경고', f'번역할 항목이 없습니다. {excluded_files_msg}{excluded_folders_msg}')
+        if not len(filtered_items):
+            QMessageBox.warning(self, '경고', f'번역할 항목이 없습니다. 제외된 폴더: {len(excluded_folders)}개 (폴더명 번역 옵션 꺼짐)')
             return
         
         # 번역 전 통계 표시
-        excluded_files = [item for item in excluded_items if item['type'] == 'file']
-        excluded_folders = [item for item in excluded_items if item['type'] == 'folder']
-        filtered_files = [item for item in filtered_items if item['type'] == 'file']
-        filtered_folders = [item for item in filtered_items if item['type'] == 'folder']
+        filtered_folders = [item for item in filtered_items if store.is_folder(item)]
+        filtered_files_count = len(filtered_items) - len(filtered_folders)
         
-        excluded_files_msg = f"{len(excluded_files)}개 파일이 확장자 제외 설정으로 인해 번역에서 제외됩니다." if excluded_files else ""
         excluded_folders_msg = f"{len(excluded_folders)}개 폴더가 '폴더명 번역' 옵션이 꺼져서 제외됩니다." if excluded_folders else ""
         
         translate_msg = []
-        if filtered_files:
-            translate_msg.append(f"• {len(filtered_files)}개 파일을 번역합니다.")
+        if filtered_files_count:
+            translate_msg.append(f"• {filtered_files_count}개 파일을 번역합니다.")
         if filtered_folders:
             translate_msg.append(f"• {len(filtered_folders)}개 폴더명을 번역합니다.")
         
         exclude_msg = []
-        if excluded_files_msg:
-            exclude_msg.append(f"• {excluded_files_msg}")
         if excluded_folders_msg:
             exclude_msg.append(f"• {excluded_folders_msg}")
         
@@ -829,6 +3902,9 @@ class TranslationApp(QMainWindow):
         stats_message += "\n".join(translate_msg)
         if exclude_msg:
             stats_message += "\n\n제외 항목:\n" + "\n".join(exclude_msg)
+        self.script_skipped_count = store.script_skipped_count()
+        if self.script_skipped_count:
+            stats_message += f"\n\n이미 대상 언어이거나 번역할 글자가 없어 선택 해제된 {self.script_skipped_count}개 항목은 요청하지 않습니다."
         
         reply = QMessageBox.information(
             self, 
@@ -841,11 +3917,12 @@ class TranslationApp(QMainWindow):
         if reply == QMessageBox.No:
             return
         
-        # 언어 선택 가져오기
+        # 언어 선택 가져오기 (기본 언어 + 함께 번역할 언어)
         language = self.get_selected_language()
+        extra_languages = self.get_extra_languages()
         
         # 번역할 항목 이름 목록 가져오기
-        item_names = [item['name'] for item in filtered_items]
+        item_names = [store.name(item) for item in filtered_items]
         
         # 설정 값 가져오기 (예외 처리 포함)
         try:
@@ -864,8 +3941,67 @@ class TranslationApp(QMainWindow):
             delay_time = 3
             self.delay_time_input.setText("3")
         
+        # 같은 기준 폴더/설정으로 중단된 실행이 있으면 남은 항목만 이어서 번역
+        # (경로 입력란은 목록을 불러온 뒤 바뀔 수 있으므로 목록을 불러온 기준 폴더 사용)
+        model_name = self.model_input.text().strip()
+        custom_prompt = self.prompt_input.toPlainText().strip() or None
+        checkpoint = RunCheckpoint.for_run(
+            self.scanned_root,
+            [language] + [lang for lang in extra_languages if lang != language],
+            model_name,
+            custom_prompt,
+            rule_engine
+        )
+        completed_translations = []
+        if checkpoint.exists():
+            requested_names = set(item_names)
+            completed_translations = [result for result in checkpoint.load() if result['original'] in requested_names]
+            if completed_translations:
+                completed_names = {result['original'] for result in completed_translations}
+                remaining_count = len([name for name in item_names if name not in completed_names])
+                reply = QMessageBox.question(
+                    self,
+                    '이어서 번역',
+                    f'이전 실행에서 {len(completed_names)}개 항목이 이미 번역되어 있습니다.\n'
+                    f'남은 {remaining_count}개 항목만 이어서 번역하시겠습니까?\n\n'
+                    f'"아니오"를 선택하면 저장된 결과를 버리고 처음부터 번역합니다.',
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes
+                )
+                if reply == QMessageBox.Yes:
+                    item_names = [name for name in item_names if name not in completed_names]
+                else:
+                    completed_translations = []
+                    checkpoint.remove()
+            else:
+                checkpoint.remove()
+        self.current_checkpoint = checkpoint
+        self.last_run_stats = None
+        
+        # 자동 조절 시 이 모델로 지난번에 학습된 청크 크기부터 시작
+        adaptive_chunk = self.adaptive_chunk_checkbox.isChecked()
+        self.current_model_name = model_name
+        self.current_adaptive_chunk = adaptive_chunk
+        if adaptive_chunk:
+            chunk_size = self.settings.value(self.learned_chunk_size_key(model_name), chunk_size, type=int)
+        
+        # 현재 처리 중인 항목 목록 저장 (번역 결과와 매핑하기 위함, 이름이 같으면 먼저 나온 항목)
+        self.current_processing_indexes = filtered_items
+        self.processing_by_name = {}
+        for item in filtered_items:
+            self.processing_by_name.setdefault(store.name(item), item)
+        self.translated_filenames = {}
+        self.translation_model.clear()
+        
+        # 남은 항목이 없으면 API 호출 없이 저장된 결과 표시
+        if not item_names:
+            logger.info(f"체크포인트에서 번역 결과 {len(completed_translations)}개 복원")
+            self.handle_translation_result(completed_translations)
+            return
+        
         # 설정 정보 로깅
-        logger.info(f"번역 설정 - 청크 크기: {chunk_size}, 대기 시간: {delay_time}초, 파일 수: {len(item_names)}")
+        logger.info(f"번역 설정 - 청크 크기: {chunk_size}, 대기 시간: {delay_time}초, 파일 수: {len(item_names)}, API 키: {len(api_keys)}개")
+        logger.info(f"스크립트 감지로 요청하지 않은 항목: {self.script_skipped_count}개")
         
         # 버튼 비활성화 및 상태 업데이트
         self.translate_btn.setEnabled(False)
@@ -874,24 +4010,125 @@ class TranslationApp(QMainWindow):
         
         # 번역 쓰레드 생성 및 시작 (설정 값 전달)
         self.translation_thread = TranslationThread(
-            api_key, 
+            api_keys, 
             item_names, 
             language,
             chunk_size,
             delay_time,
-            self.model_input.text().strip(),
-            self.prompt_input.toPlainText().strip() or None
+            model_name,
+            custom_prompt,
+            extra_languages,
+            checkpoint,
+            completed_translations,
+            rule_engine,
+            adaptive_chunk,
+            self.get_shared_cache_url()
         )
         self.translation_thread.progress_signal.connect(self.update_translation_progress)
+        self.translation_thread.stats_signal.connect(self.handle_translation_stats)
+        self.translation_thread.key_usage_signal.connect(self.update_key_usage)
+        self.translation_thread.partial_result_signal.connect(self.handle_partial_translations)
         self.translation_thread.result_signal.connect(self.handle_translation_result)
         self.translation_thread.error_signal.connect(self.handle_translation_error)
-        self.translation_thread.finished.connect(lambda: self.translate_btn.setEnabled(True))
+        self.translation_thread.finished.connect(self.on_run_finished)
         
-        # 현재 처리 중인 항목 목록 저장 (번역 결과와 매핑하기 위함)
-        self.current_processing_files = filtered_items
+        # 지금 보이는 항목부터 번역
+        self.translation_thread.prioritize(self.visible_entry_names())
         
+        self.start_run_controls(self.translation_thread)
         self.translation_thread.start()
     
+    def visible_entry_names(self):
+        """파일 목록에서 현재 화면에 보이는 항목 이름 목록"""
+        top_index = self.files_tree.indexAt(QPoint(0, 0))
+        if not top_index.isValid():
+            return []
+        bottom_index = self.files_tree.indexAt(QPoint(0, self.files_tree.viewport().height() - 1))
+        bottom = bottom_index.row() if bottom_index.isValid() else self.files_model.rowCount() - 1
+        store = self.entry_store
+        return [store.name(self.files_model.entry_at(row)) for row in range(top_index.row(), bottom + 1)]
+    
+    def active_translation_thread(self):
+        """실행 중인 파일명 번역 쓰레드 (없으면 None)"""
+        thread = self.active_thread
+        return thread if isinstance(thread, TranslationThread) and not thread.control.cancelled else None
+    
+    def send_viewport_priority(self):
+        """스크롤 후 화면에 보이는 항목을 먼저 번역하도록 전달"""
+        thread = self.active_translation_thread()
+        if thread is not None:
+            thread.prioritize(self.visible_entry_names())
+    
+    def show_files_context_menu(self, position):
+        """파일 목록 우클릭 메뉴 (번역 중 선택 항목 우선 번역)"""
+        rows = sorted({index.row() for index in self.files_tree.selectionModel().selectedRows()})
+        menu = QMenu(self)
+        prioritize_action = menu.addAction("선택 항목 먼저 번역")
+        prioritize_action.setEnabled(bool(rows) and self.active_translation_thread() is not None)
+        if menu.exec_(self.files_tree.viewport().mapToGlobal(position)) is not prioritize_action:
+            return
+        thread = self.active_translation_thread()
+        if thread is None:
+            return
+        store = self.entry_store
+        names = [store.name(self.files_model.entry_at(row)) for row in rows]
+        thread.prioritize(names, explicit=True)
+        logger.info(f"우선 번역 요청: {len(names)}개 항목")
+        self.statusBar().showMessage(f'선택한 {len(names)}개 항목을 먼저 번역합니다.')
+    
+    def start_run_controls(self, thread):
+        """작업 스레드 시작 시 일시정지/취소 버튼 활성화"""
+        self.active_thread = thread
+        self.run_result_handled = False
+        self.apply_mapping_btn.setEnabled(False)
+        self.run_queue_btn.setEnabled(False)
+        self.remove_job_btn.setEnabled(False)
+        self.pause_btn.setText("일시정지")
+        self.pause_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+    
+    def is_run_cancelled(self):
+        """현재 작업 스레드가 취소되었는지 여부"""
+        return self.active_thread is not None and self.active_thread.control.cancelled
+    
+    def toggle_pause(self):
+        """일시정지/재개 버튼 클릭 시 실행"""
+        if self.active_thread is None:
+            return
+        control = self.active_thread.control
+        if control.paused:
+            control.resume()
+            self.pause_btn.setText("일시정지")
+            self.statusBar().showMessage('재개됨')
+        else:
+            control.pause()
+            self.pause_btn.setText("재개")
+            self.statusBar().showMessage('일시정지됨 - 진행 중인 요청은 마저 받습니다.')
+    
+    def cancel_active_run(self):
+        """취소 버튼 클릭 시 실행 (완료된 결과는 유지)"""
+        if self.active_thread is None:
+            return
+        self.active_thread.control.cancel()
+        self.pause_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+        self.statusBar().showMessage('취소 중...')
+    
+    def on_run_finished(self):
+        """작업 스레드 종료 시 버튼 상태 복원"""
+        if self.is_run_cancelled() and not self.run_result_handled:
+            # 완료된 결과 없이 취소된 경우
+            self.statusBar().showMessage('작업이 취소되었습니다.')
+        self.active_thread = None
+        self.pause_btn.setText("일시정지")
+        self.pause_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+        self.translate_btn.setEnabled(True)
+        self.apply_mapping_btn.setEnabled(True)
+        self.export_btn.setEnabled(bool(self.translated_filenames))
+        self.run_queue_btn.setEnabled(True)
+        self.remove_job_btn.setEnabled(True)
+    
     def update_translation_progress(self, current, total):
         """번역 진행 상황 업데이트"""
         progress_percent = int((current / total) * 100) if total > 0 else 0
@@ -899,39 +4136,77 @@ class TranslationApp(QMainWindow):
         self.progress_bar.setFormat(f"{current}/{total} ({progress_percent}%)")
         self.statusBar().showMessage(f'번역 중... {current}/{total}')
     
+    def update_key_usage(self, usage):
+        """API 키별 사용량 표시 갱신"""
+        self.key_usage_label.setText(format_key_usage(usage))
+    
+    @staticmethod
+    def learned_chunk_size_key(model_name):
+        """모델별로 학습된 청크 크기를 저장할 설정 키"""
+        return "learned_chunk_size/" + (model_name.replace('/', '_') or 'default')
+    
+    def handle_translation_stats(self, stats):
+        """번역 요청/토큰 통계 저장"""
+        self.last_run_stats = stats
+        if stats.get('key_usage'):
+            self.update_key_usage(stats['key_usage'])
+        # 자동 조절로 학습된 청크 크기는 다음 실행의 시작 크기로 저장
+        if self.current_adaptive_chunk and stats.get('chunk_size'):
+            self.settings.setValue(self.learned_chunk_size_key(self.current_model_name), stats['chunk_size'])
+            logger.info(f"학습된 청크 크기 저장 ({self.current_model_name}): {stats['chunk_size']}")
+    
+    def format_run_stats(self):
+        """마지막 번역 실행의 토큰 통계 문자열"""
+        stats = self.last_run_stats
+        if not stats:
+            return ""
+        cache_text = "컨텍스트 캐시 사용" if stats['context_cache'] else "시스템 지시문 사용"
+        return (f" (요청 {stats['requests']}회, 로컬 규칙 번역 {stats['offline_resolved']}개, "
+                f"공유 캐시 {stats['shared_cache_hits']}개, "
+                f"시리즈 템플릿 번역 {stats['series_members']}개, 이미 번역됨(생략) {self.script_skipped_count}개, "
+                f"청크 크기 {stats['chunk_size']}, 중복 요청 {stats['hedged_requests']}회, 마감 초과 {stats['request_timeouts']}회, "
+                f"입력 토큰 {stats['prompt_tokens']}, "
+                f"캐시로 절약한 토큰 {stats['cached_tokens']}, {cache_text})")
+    
     def handle_translation_result(self, translations):
         """번역 결과 처리"""
+        self.run_result_handled = True
         if not translations:
             QMessageBox.warning(self, '경고', '번역 결과가 없습니다.')
             return
         
-        # 번역 결과 저장 (윈도우 호환성을 위한 처리 포함)
-        self.translated_filenames = {}
-        display_text = ''
+        # 언어별 번역 결과 보관 (기본 언어를 바꿔도 API를 다시 호출하지 않음)
+        self.translation_results = {item['original']: item['translations'] for item in translations}
+        self.show_translations(self.get_selected_language())
+        self.apply_btn.setEnabled(bool(self.translated_filenames))
         
-        for item in translations:
-            original_name = item['original']
-            
-            # 현재 처리 중인 항목 찾기
-            current_item = None
-            for proc_item in self.current_processing_files:
-                if proc_item['name'] == original_name:
-                    current_item = proc_item
-                    break
-            
-            if not current_item:
+        # 취소된 경우 그때까지 번역된 항목만 표시
+        if self.is_run_cancelled():
+            self.statusBar().showMessage(f'번역 취소됨. 완료된 {len(translations)}개 항목을 표시합니다.{self.format_run_stats()}')
+            QMessageBox.information(self, '알림', f'번역이 취소되었습니다. 완료된 {len(translations)}개 항목은 적용할 수 있습니다.')
+            return
+        
+        # 상태 업데이트
+        self.progress_bar.setValue(100)
+        self.statusBar().showMessage(f'번역 완료. {len(translations)}개 항목이 번역되었습니다.{self.format_run_stats()}')
+        
+        # 완료 알림
+        QMessageBox.information(self, '알림', f'번역이 완료되었습니다. {len(translations)}개 항목이 번역되었습니다.')
+    
+    def build_translation_rows(self, translations):
+        """(원본 이름, 번역된 이름) 목록을 적용 목록에 반영하고 표에 표시할 행 목록 반환"""
+        store = self.entry_store
+        rows = []
+        for original_name, translated in translations:
+            current_item = self.processing_by_name.get(original_name)
+            if not translated or current_item is None:
                 continue
             
             # 항목 유형에 따른 처리
-            item_type = current_item['type']
-            
-            # 번역된 이름 정규화
-            translated_name = unicodedata.normalize('NFKC', item['translated'])
+            item_type = store.type_name(current_item)
             
-            # 윈도우에서 사용할 수 없는 특수문자 처리
-            forbidden_chars = ['\\', '/', ':', '*', '?', '"', '<', '>', '|', '？', '！', '；', '：']
-            for char in forbidden_chars:
-                translated_name = translated_name.replace(char, '_')
+            # 번역된 이름 정규화 및 윈도우에서 사용할 수 없는 특수문자 처리
+            translated_name = sanitize_filename(translated)
             
             # 하위 폴더 구조 유지 (파일인 경우)
             if item_type == 'file' and os.path.sep in original_name:
@@ -940,26 +4215,25 @@ class TranslationApp(QMainWindow):
                 translated_name = os.path.join(dirname, translated_name)
             
             # 정제된 이름 저장
-            self.translated_filenames[original_name] = {
-                'new_name': translated_name,
-                'type': item_type,
-                'path': current_item['path']
-            }
-            
-            # 원본 이름과 번역된 이름을 함께 표시
-            type_icon = "📁 " if item_type == "folder" else "📄 "
-            display_text += f"{type_icon}{original_name} → {translated_name}\n"
-        
-        # 결과 표시
-        self.translated_text.setText(display_text)
-        self.apply_btn.setEnabled(True)
-        
-        # 상태 업데이트
-        self.progress_bar.setValue(100)
-        self.statusBar().showMessage(f'번역 완료. {len(translations)}개 항목이 번역되었습니다.')
-        
-        # 완료 알림
-        QMessageBox.information(self, '알림', f'번역이 완료되었습니다. {len(translations)}개 항목이 번역되었습니다.')
+            self.translated_filenames[original_name] = translated_name
+            rows.append((item_type, original_name, translated_name))
+        return rows
+    
+    def show_translations(self, language):
+        """선택한 언어의 번역 결과로 적용 목록과 표시 내용 갱신"""
+        self.translated_filenames = {}
+        rows = self.build_translation_rows(
+            (original_name, translations.get(language)) for original_name, translations in self.translation_results.items()
+        )
+        self.translation_model.set_rows(rows)
+    
+    def handle_partial_translations(self, translations):
+        """실행 중 도착한 번역 결과 묶음을 표에 추가 (미리보기)"""
+        language = self.get_selected_language()
+        rows = self.build_translation_rows(
+            (item['original'], item['translations'].get(language)) for item in translations
+        )
+        self.translation_model.append_rows(rows)
     
     def handle_translation_error(self, error_message):
         """번역 오류 처리"""
@@ -972,21 +4246,21 @@ class TranslationApp(QMainWindow):
             QMessageBox.warning(self, '경고', '적용할 번역 결과가 없습니다.')
             return
         
-        if not hasattr(self, 'current_processing_files') or not self.current_processing_files:
+        if not len(self.current_processing_indexes):
             QMessageBox.warning(self, '경고', '번역된 파일 정보가 없습니다. 다시 번역해주세요.')
             return
         
         # 변경할 항목 목록 준비
+        store = self.entry_store
         items_to_rename = []
         
-        for item in self.current_processing_files:
-            original_name = item['name']
+        for item in self.current_processing_indexes:
+            original_name = store.name(item)
             if original_name in self.translated_filenames:
-                translated_info = self.translated_filenames[original_name]
                 items_to_rename.append({
-                    'original_path': item['path'],
-                    'new_name': translated_info['new_name'],
-                    'type': translated_info['type']
+                    'original_path': store.path(item),
+                    'new_name': self.translated_filenames[original_name],
+                    'type': store.type_name(item)
                 })
         
         if not items_to_rename:
@@ -1030,8 +4304,9 @@ class TranslationApp(QMainWindow):
         self.rename_thread.progress_signal.connect(self.update_rename_progress)
         self.rename_thread.result_signal.connect(self.handle_rename_result)
         self.rename_thread.error_signal.connect(self.handle_rename_error)
-        self.rename_thread.finished.connect(lambda: self.translate_btn.setEnabled(True))
+        self.rename_thread.finished.connect(self.on_run_finished)
         
+        self.start_run_controls(self.rename_thread)
         self.rename_thread.start()
     
     def update_rename_progress(self, current, total):
@@ -1043,14 +4318,23 @@ class TranslationApp(QMainWindow):
     
     def handle_rename_result(self, renamed_items):
         """이름 변경 결과 처리"""
+        self.run_result_handled = True
+        cancelled = self.is_run_cancelled()
         if not renamed_items:
-            QMessageBox.warning(self, '경고', '파일명 변경 결과가 없습니다.')
+            if not cancelled:
+                QMessageBox.warning(self, '경고', '파일명 변경 결과가 없습니다.')
             return
         
+        # 이름이 바뀌었으므로 해당 실행의 체크포인트 삭제 (취소된 경우 남은 항목을 위해 유지)
+        if not cancelled and self.current_checkpoint is not None:
+            self.current_checkpoint.remove()
+            self.current_checkpoint = None
+        
         # 초기화
-        self.current_processing_files = []
+        self.current_processing_indexes = array('I')
         self.translated_filenames = {}
-        self.translated_text.clear()
+        self.translation_results = {}
+        self.translation_model.clear()
         
         # 폴더와 파일 개수 확인
         renamed_files = [item for item in renamed_items if item['type'] == 'file']
@@ -1068,14 +4352,212 @@ class TranslationApp(QMainWindow):
             status_message.append(f"{len(renamed_folders)}개 폴더")
         
         status_text = " 및 ".join(status_message) + "의 이름이 변경되었습니다."
-        self.statusBar().showMessage(f'이름 변경 완료. {status_text}')
-        
-        # 완료 알림
-        QMessageBox.information(self, '알림', f'이름 변경이 완료되었습니다. {status_text}')
+        if cancelled:
+            self.statusBar().showMessage(f'이름 변경 취소됨. 취소 전까지 {status_text}')
+            QMessageBox.information(self, '알림', f'이름 변경이 취소되었습니다. 취소 전까지 {status_text}')
+        else:
+            self.statusBar().showMessage(f'이름 변경 완료. {status_text}')
+            
+            # 완료 알림
+            QMessageBox.information(self, '알림', f'이름 변경이 완료되었습니다. {status_text}')
         
         # 변경된 디렉토리의 파일 목록 다시 가져오기
         self.get_files()
     
+    def export_mapping(self):
+        """번역 결과를 경로 기준 매핑 파일(JSONL/CSV)로 내보내기"""
+        if not self.translated_filenames or not len(self.current_processing_indexes):
+            QMessageBox.warning(self, '경고', '내보낼 번역 결과가 없습니다.')
+            return
+        
+        root = self.scanned_root
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, '매핑 파일 저장', os.path.join(root, 'translation_mapping.jsonl'),
+            'JSON Lines (*.jsonl);;CSV (*.csv)'
+        )
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            path += '.csv' if 'csv' in selected_filter.lower() else '.jsonl'
+        
+        # 번역된 항목을 하나씩 기록 (경로는 기준 폴더에서의 상대 경로)
+        store = self.entry_store
+        
+        def mapping_rows():
+            for item in self.current_processing_indexes:
+                new_name = self.translated_filenames.get(store.name(item))
+                if new_name:
+                    relative_path = os.path.relpath(store.path(item), root).replace(os.sep, '/')
+                    yield store.type_name(item), relative_path, new_name
+        
+        try:
+            count = write_mapping(path, mapping_rows())
+        except OSError as e:
+            QMessageBox.critical(self, '오류', f'매핑 파일을 저장하지 못했습니다: {str(e)}')
+            logger.error(f"매핑 파일 저장 오류: {str(e)}")
+            return
+        logger.info(f"매핑 파일 저장: {path} ({count}개 항목)")
+        self.statusBar().showMessage(f'{count}개 항목의 매핑을 저장했습니다: {path}')
+    
+    def apply_mapping_file(self):
+        """저장된 매핑 파일을 선택한 기준 폴더에 적용"""
+        path, _ = QFileDialog.getOpenFileName(self, '매핑 파일 선택', self.path_input.text(),
+                                              '매핑 파일 (*.jsonl *.csv);;모든 파일 (*)')
+        if not path:
+            return
+        root = QFileDialog.getExistingDirectory(self, '매핑을 적용할 기준 폴더 선택', self.path_input.text())
+        if not root:
+            return
+        
+        reply = QMessageBox.question(
+            self,
+            '확인',
+            f'"{os.path.basename(path)}"의 이름 변경을 다음 폴더 기준으로 적용하시겠습니까?\n{root}',
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        # 버튼 비활성화
+        self.apply_btn.setEnabled(False)
+        self.translate_btn.setEnabled(False)
+        
+        # 상태 업데이트
+        self.progress_bar.setValue(0)
+        self.statusBar().showMessage('매핑 파일 적용 중...')
+        
+        self.mapping_root = root
+        self.rename_thread = MappingRenameThread(path, root)
+        self.rename_thread.progress_signal.connect(self.update_rename_progress)
+        self.rename_thread.summary_signal.connect(self.handle_mapping_rename_result)
+        self.rename_thread.error_signal.connect(self.handle_rename_error)
+        self.rename_thread.finished.connect(self.on_run_finished)
+        
+        self.start_run_controls(self.rename_thread)
+        self.rename_thread.start()
+    
+    def handle_mapping_rename_result(self, counts):
+        """매핑 파일 적용 결과 처리"""
+        self.run_result_handled = True
+        status_text = (f"파일 {counts['files']}개, 폴더 {counts['folders']}개의 이름이 변경되었습니다. "
+                       f"(실패 {counts['failed']}개, 전체 {counts['total']}개)")
+        if counts['cancelled']:
+            self.statusBar().showMessage(f'매핑 적용 취소됨. 취소 전까지 {status_text}')
+            QMessageBox.information(self, '알림', f'매핑 적용이 취소되었습니다. 취소 전까지 {status_text}')
+        else:
+            self.progress_bar.setValue(100)
+            self.statusBar().showMessage(f'매핑 적용 완료. {status_text}')
+            QMessageBox.information(self, '알림', f'매핑 적용이 완료되었습니다. {status_text}')
+        
+        # 현재 목록의 폴더에 적용했다면 목록 다시 가져오기
+        if len(self.entry_store) and os.path.normcase(os.path.abspath(self.mapping_root)) == os.path.normcase(os.path.abspath(self.scanned_root)):
+            self.get_files()
+    
+    def current_job_settings(self):
+        """대기열 작업에 저장할 현재 번역 설정 (용어집이 올바르지 않으면 None)"""
+        glossary_rules = self.glossary_input.toPlainText()
+        try:
+            RuleEngine.from_text(glossary_rules)
+        except ValueError as e:
+            QMessageBox.warning(self, '경고', f'용어집/규칙 설정이 올바르지 않습니다. {str(e)}')
+            return None
+        
+        try:
+            chunk_size = int(self.chunk_size_input.text())
+            if chunk_size <= 0:
+                chunk_size = 10
+        except ValueError:
+            chunk_size = 10
+        
+        filter_rules = self.filter_rules_input.text()
+        try:
+            ScanFilter.from_text(filter_rules)
+        except ValueError as e:
+            QMessageBox.warning(self, '경고', f'필터 규칙이 올바르지 않습니다. {str(e)}')
+            return None
+        
+        return {
+            'language': self.get_selected_language(),
+            'extra_languages': self.get_extra_languages(),
+            'model_name': self.model_input.text().strip(),
+            'custom_prompt': self.prompt_input.toPlainText().strip() or None,
+            'chunk_size': chunk_size,
+            'include_subfolders': self.include_subfolders_checkbox.isChecked(),
+            'max_depth': self.get_max_depth(),
+            'translate_folders': self.translate_folders_checkbox.isChecked(),
+            'exclude_extensions': self.get_exclude_extensions(),
+            'filter_rules': filter_rules,
+            'glossary_rules': glossary_rules,
+            'shared_cache_url': self.get_shared_cache_url(),
+        }
+    
+    def add_job_to_queue(self):
+        """현재 경로와 설정으로 대기열에 작업 추가"""
+        directory_path = self.path_input.text().strip()
+        if not directory_path or not os.path.isdir(directory_path):
+            QMessageBox.warning(self, '경고', '유효한 디렉토리 경로가 아닙니다.')
+            return
+        settings = self.current_job_settings()
+        if settings is None:
+            return
+        self.job_model.add_job(TranslationJob(directory_path, settings))
+        self.statusBar().showMessage(f'작업 대기열에 추가했습니다: {directory_path}')
+    
+    def remove_selected_jobs(self):
+        """선택한 대기열 작업 삭제"""
+        rows = {index.row() for index in self.job_table.selectionModel().selectedRows()}
+        if rows:
+            self.job_model.remove_rows(rows)
+    
+    def run_job_queue(self):
+        """완료되지 않은 대기열 작업을 하나의 API 키 풀로 실행"""
+        api_keys = parse_api_keys(self.api_key_input.text())
+        if not api_keys:
+            QMessageBox.warning(self, '경고', 'API 키를 입력하세요.')
+            return
+        jobs = self.job_model.jobs()
+        rows = [row for row, job in enumerate(jobs) if job.status != 'done']
+        if not rows:
+            QMessageBox.warning(self, '경고', '실행할 작업이 없습니다. 대기열에 작업을 추가하세요.')
+            return
+        
+        try:
+            delay_time = int(self.delay_time_input.text())
+            if delay_time < 0:
+                delay_time = 3
+        except ValueError:
+            delay_time = 3
+            self.delay_time_input.setText("3")
+        
+        self.job_model.reset_jobs(rows)
+        logger.info(f"작업 대기열 실행 - 작업 {len(rows)}개, API 키: {len(api_keys)}개")
+        
+        self.translate_btn.setEnabled(False)
+        self.apply_btn.setEnabled(False)
+        self.statusBar().showMessage(f'작업 대기열 실행 중... ({len(rows)}개 작업)')
+        
+        self.job_thread = JobQueueThread(api_keys, jobs, delay_time)
+        self.job_thread.job_signal.connect(self.job_model.update_job)
+        self.job_thread.key_usage_signal.connect(self.update_key_usage)
+        self.job_thread.finished.connect(self.on_job_queue_finished)
+        self.job_thread.finished.connect(self.on_run_finished)
+        
+        self.start_run_controls(self.job_thread)
+        self.job_thread.start()
+    
+    def on_job_queue_finished(self):
+        """작업 대기열 실행 종료 시 결과 요약 표시"""
+        self.run_result_handled = True
+        jobs = self.job_model.jobs()
+        done_count = len([job for job in jobs if job.status == 'done'])
+        failed_count = len([job for job in jobs if job.status == 'failed'])
+        cancelled_count = len([job for job in jobs if job.status == 'cancelled'])
+        self.statusBar().showMessage(
+            f'작업 대기열 종료 - 완료 {done_count}개, 실패 {failed_count}개, 취소 {cancelled_count}개 '
+            f'(결과 매핑 파일: {JobQueueThread.mapping_dir()})'
+        )
+    
     def handle_rename_error(self, error_message):
         """이름 변경 오류 처리"""
         QMessageBox.critical(self, '오류', f'파일명 변경 중 오류가 발생했습니다: {error_message}')
@@ -0,0 +1,171 @@
+"""파일명 번역 공유 캐시 서버
+
+같은 네트워크의 여러 PC가 이미 번역한 이름을 함께 쓰도록 번역 결과를 SQLite에 보관한다.
+키는 (이름, 언어, 모델, 프롬프트 해시)이며, 번역기는 Gemini를 호출하기 전에 묶음으로 조회하고
+새로 받은 번역을 다시 기록한다.
+
+사용 예:
+    python cache_server.py --host 0.0.0.0 --port 8765 --db translation_cache.sqlite3
+
+API (JSON):
+    POST /lookup  {"model", "prompt_hash", "languages": [...], "names": [...]}
+                  -> {"results": {이름: {언어: 번역}}}  (저장된 언어만 포함)
+    POST /store   {"model", "prompt_hash", "entries": [{"name", "translations": {언어: 번역}}]}
+                  -> {"stored": 기록한 번역 수}
+    GET  /stats   -> {"entries": 저장된 번역 수}
+"""
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MAX_BATCH = 1000  # 요청 하나에 담을 수 있는 이름 수
+QUERY_BATCH = 400  # SQLite 변수 개수 제한에 맞춘 IN 절 크기
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class TranslationCacheStore:
+    """번역 결과 SQLite 저장소 (요청 스레드마다 연결을 따로 사용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    model TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    translated TEXT NOT NULL,
+                    updated REAL NOT NULL,
+                    PRIMARY KEY (model, prompt_hash, language, name)
+                ) WITHOUT ROWID
+            """)
+
+    def connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+        return conn
+
+    def lookup(self, model, prompt_hash, languages, names):
+        """저장된 번역을 {이름: {언어: 번역}}으로 반환"""
+        results = {}
+        conn = self.connection()
+        language_marks = ','.join('?' * len(languages))
+        for start in range(0, len(names), QUERY_BATCH):
+            batch = names[start:start + QUERY_BATCH]
+            rows = conn.execute(
+                f"SELECT name, language, translated FROM translations "
+                f"WHERE model = ? AND prompt_hash = ? AND language IN ({language_marks}) "
+                f"AND name IN ({','.join('?' * len(batch))})",
+                [model, prompt_hash, *languages, *batch]
+            )
+            for name, language, translated in rows:
+                results.setdefault(name, {})[language] = translated
+        return results
+
+    def store(self, model, prompt_hash, entries):
+        """번역 결과를 기록하고 기록한 번역 수 반환 (같은 키는 새 값으로 교체)"""
+        now = time.time()
+        rows = [
+            (model, prompt_hash, language, entry['name'], translated, now)
+            for entry in entries
+            for language, translated in entry['translations'].items()
+            if isinstance(translated, str) and translated
+        ]
+        with self.connection() as conn:
+            conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def count(self):
+        return self.connection().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+
+class CacheRequestHandler(BaseHTTPRequestHandler):
+    store = None  # 서버 시작 시 TranslationCacheStore 지정
+    protocol_version = 'HTTP/1.1'  # 클라이언트가 연결을 재사용할 수 있도록 유지
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            raise ValueError("요청 본문 크기가 올바르지 않습니다.")
+        payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        if not isinstance(payload, dict) or not isinstance(payload.get('model'), str) \
+                or not isinstance(payload.get('prompt_hash'), str):
+            raise ValueError("model과 prompt_hash가 필요합니다.")
+        return payload
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self.send_json(200, {'entries': self.store.count()})
+        else:
+            self.send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        try:
+            payload = self.read_json()
+            if self.path == '/lookup':
+                names = [name for name in payload.get('names', []) if isinstance(name, str)]
+                languages = [lang for lang in payload.get('languages', []) if isinstance(lang, str)]
+                if not languages or len(names) > MAX_BATCH:
+                    raise ValueError(f"언어가 없거나 이름이 {MAX_BATCH}개를 넘습니다.")
+                results = self.store.lookup(payload['model'], payload['prompt_hash'], languages, names)
+                self.send_json(200, {'results': results})
+            elif self.path == '/store':
+                entries = [
+                    entry for entry in payload.get('entries', [])
+                    if isinstance(entry, dict) and isinstance(entry.get('name'), str)
+                    and isinstance(entry.get('translations'), dict)
+                ]
+                if len(entries) > MAX_BATCH:
+                    raise ValueError(f"항목이 {MAX_BATCH}개를 넘습니다.")
+                stored = self.store.store(payload['model'], payload['prompt_hash'], entries)
+                self.send_json(200, {'stored': stored})
+            else:
+                self.send_json(404, {'error': 'not found'})
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+        except sqlite3.Error as e:
+            self.send_json(500, {'error': str(e)})
+
+    def log_request(self, code='-', size='-'):
+        # 요청마다 남기는 접근 로그는 생략하고 실패한 요청만 표시
+        if str(getattr(code, 'value', code)).startswith(('4', '5')):
+            super().log_request(code, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파일명 번역 공유 캐시 서버")
+    parser.add_argument('--host', default='0.0.0.0', help="수신할 주소")
+    parser.add_argument('--port', type=int, default=8765, help="수신할 포트")
+    parser.add_argument('--db', default='translation_cache.sqlite3', help="SQLite 파일 경로")
+    args = parser.parse_args()
+
+    CacheRequestHandler.store = TranslationCacheStore(args.db)
+    server = ThreadingHTTPServer((args.host, args.port), CacheRequestHandler)
+    print(f"공유 캐시 서버 시작: http://{args.host}:{args.port} (저장된 번역 {CacheRequestHandler.store.count()}개, {args.db})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""디렉토리 스캔 벤치마크 (직렬 탐색 vs 병렬 탐색)
+
+로컬에 임시 디렉토리 트리를 만들고, 디렉토리를 나열하거나 항목을 stat할 때마다 지연을 넣어
+네트워크 드라이브(SMB/NFS)의 왕복 지연을 흉내 낸다.
+
+사용 예:
+    python scan_benchmark.py --latency 20 --workers 1 4 8 16 32
+    python scan_benchmark.py --latency 20 --filter "size>1KB"  # 크기/수정 시각 규칙은 항목마다 stat
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+from GeminiFileTranslator import ParallelDirectoryWalker, ScanFilter
+
+
+def build_tree(root, fanout, depth, files_per_dir):
+    """폴더마다 fanout개의 하위 폴더와 files_per_dir개의 파일을 가진 트리 생성, 디렉토리 수 반환"""
+    count = 1
+    for i in range(files_per_dir):
+        open(os.path.join(root, f"file_{i}.txt"), 'w').close()
+    if depth > 0:
+        for i in range(fanout):
+            child = os.path.join(root, f"dir_{i}")
+            os.mkdir(child)
+            count += build_tree(child, fanout, depth - 1, files_per_dir)
+    return count
+
+
+class SlowEntry:
+    """stat을 처음 요청할 때 파일 서버 왕복 지연을 넣는 os.DirEntry 대리 객체"""
+
+    def __init__(self, entry, request):
+        self._entry = entry
+        self._request = request
+        self._stat = None
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self, *, follow_symlinks=True):
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks=True):
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self):
+        return self._entry.is_symlink()
+
+    def stat(self, *, follow_symlinks=True):
+        # os.DirEntry와 같이 결과를 보관해 같은 항목은 한 번만 요청
+        if self._stat is None:
+            self._stat = self._request(lambda: self._entry.stat(follow_symlinks=follow_symlinks))
+        return self._stat
+
+
+class SlowScandir:
+    """나열한 항목을 SlowEntry로 감싸는 os.scandir 대체"""
+
+    def __init__(self, path, request):
+        self._iterator = os.scandir(path)
+        self._request = request
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._iterator.close()
+
+    def __iter__(self):
+        return (SlowEntry(entry, self._request) for entry in self._iterator)
+
+
+def make_slow_listing(latency, capacity, stat_latency=None, entry_filter=None):
+    """나열/stat마다 지연이 걸리고 동시에 capacity개까지만 처리하는 파일 서버 흉내
+
+    stat_latency를 생략하면 나열과 같은 지연을 사용한다.
+    """
+    server = threading.BoundedSemaphore(capacity)
+    stat_latency = latency if stat_latency is None else stat_latency
+    stats = [0]  # 요청한 stat 수
+    stats_lock = threading.Lock()
+
+    def request_stat(call):
+        with server:
+            time.sleep(stat_latency)
+        with stats_lock:
+            stats[0] += 1
+        return call()
+
+    def slow_scandir(path):
+        return SlowScandir(path, request_stat)
+
+    def list_dir(path, depth=0):
+        with server:
+            time.sleep(latency)
+        return ParallelDirectoryWalker.scandir_listing(path, depth, entry_filter, slow_scandir)
+    list_dir.stats = stats
+    return list_dir
+
+
+def serial_walk(root, list_dir):
+    """os.walk처럼 디렉토리를 하나씩 나열 (비교 기준)"""
+    pending = [root]
+    while pending:
+        path = pending.pop()
+        dirs, files, subdirs = list_dir(path)
+        pending.extend(os.path.join(path, name) for name in subdirs)
+        yield path, dirs, files
+
+
+def measure(walk):
+    """탐색을 끝까지 실행하여 (소요 시간, 디렉토리 수, 파일 수) 반환"""
+    started = time.perf_counter()
+    directories = 0
+    files = 0
+    for _, _, filenames in walk:
+        directories += 1
+        files += len(filenames)
+    return time.perf_counter() - started, directories, files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직렬/병렬 디렉토리 탐색 속도 비교")
+    parser.add_argument('--fanout', type=int, default=4, help="폴더당 하위 폴더 수")
+    parser.add_argument('--depth', type=int, default=4, help="트리 깊이")
+    parser.add_argument('--files', type=int, default=20, help="폴더당 파일 수")
+    parser.add_argument('--latency', type=float, default=20.0, help="디렉토리 나열 1회당 넣을 지연 (ms)")
+    parser.add_argument('--stat-latency', type=float, default=None,
+                        help="항목 stat 1회당 넣을 지연 (ms, 생략하면 나열 지연과 같음)")
+    parser.add_argument('--filter', default='', help="스캔 필터 규칙 (예: \"size>1KB; -*.tmp\")")
+    parser.add_argument('--capacity', type=int, default=64, help="파일 서버가 동시에 처리하는 나열 요청 수")
+    parser.add_argument('--per-mount', type=int, default=ParallelDirectoryWalker.DEFAULT_PER_MOUNT_LIMIT,
+                        help="마운트별 동시 나열 제한")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16, 32], help="비교할 병렬 작업자 수")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="scan_benchmark_")
+    try:
+        directory_count = build_tree(root, args.fanout, args.depth, args.files)
+        try:
+            entry_filter = ScanFilter.from_text(args.filter) if args.filter else None
+        except ValueError as e:
+            print(f"잘못된 필터 규칙: {str(e)}")
+            return 1
+        stat_latency = args.latency if args.stat_latency is None else args.stat_latency
+        print(f"트리: 디렉토리 {directory_count}개, 파일 {directory_count * args.files}개, "
+              f"나열 지연 {args.latency:.0f}ms, stat 지연 {stat_latency:.0f}ms, 서버 동시 처리 {args.capacity}, "
+              f"마운트별 제한 {args.per_mount}")
+
+        list_dir = make_slow_listing(args.latency / 1000.0, args.capacity, stat_latency / 1000.0, entry_filter)
+        elapsed, directories, files = measure(serial_walk(root, list_dir))
+        print(f"{'직렬':>12}: {elapsed:7.2f}초  ({directories / elapsed:8.1f} 디렉토리/초, stat {list_dir.stats[0]}회)")
+        serial_elapsed = elapsed
+
+        for workers in args.workers:
+            list_dir = make_slow_listing(args.latency / 1000.0, args.capacity, stat_latency / 1000.0, entry_filter)
+            walker = ParallelDirectoryWalker(max_workers=workers, per_mount_limit=args.per_mount, list_dir=list_dir,
+                                             entry_filter=entry_filter)
+            elapsed, parallel_directories, parallel_files = measure(walker.walk(root))
+            if (parallel_directories, parallel_files) != (directories, files):
+                print(f"결과 불일치: 직렬 {directories}/{files}, 병렬 {parallel_directories}/{parallel_files}")
+                return 1
+            print(f"{f'병렬 {workers}개':>12}: {elapsed:7.2f}초  ({parallel_directories / elapsed:8.1f} 디렉토리/초, "
+                  f"stat {list_dir.stats[0]}회, 직렬 대비 {serial_elapsed / elapsed:5.1f}배)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GeminiFileTranslator
+from GeminiFileTranslator import GeminiClientManager
+
+
+class FakeModel:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.count_calls = 0
+
+    def count_tokens(self, contents):
+        self.count_calls += 1
+        return SimpleNamespace(total_tokens=self.tokens)
+
+
+class FakeCacheClient:
+    def __init__(self):
+        self.transport = mock.Mock()
+
+    def create_cached_content(self, request):
+        raise RuntimeError("cache unsupported")
+
+
+class ContextCacheTest(unittest.TestCase):
+    def make_manager(self, tokens):
+        manager = GeminiClientManager()
+        model = FakeModel(tokens)
+        manager.get_model = lambda api_key, model_name, system_instruction=None: model
+        return manager, model
+
+    def test_short_instruction_skips_cache_for_every_key(self):
+        manager, model = self.make_manager(200)
+        with mock.patch.object(GeminiFileTranslator.glm, 'CacheServiceClient') as cache_client:
+            self.assertIsNone(manager.get_cached_model("key1", "gemini-2.0-flash", "prompt"))
+            self.assertIsNone(manager.get_cached_model("key2", "gemini-2.0-flash", "prompt"))
+        cache_client.assert_not_called()
+        self.assertEqual(model.count_calls, 1)
+
+    def test_failed_creation_is_remembered_per_model_and_client_closed(self):
+        manager, model = self.make_manager(40000)
+        clients = []
+
+        def create_client(**kwargs):
+            clients.append(FakeCacheClient())
+            return clients[-1]
+
+        with mock.patch.object(GeminiFileTranslator.glm, 'CacheServiceClient', side_effect=create_client):
+            self.assertIsNone(manager.get_cached_model("key1", "gemini-2.0-flash", "prompt"))
+            self.assertIsNone(manager.get_cached_model("key2", "gemini-2.0-flash", "prompt"))
+        self.assertEqual(len(clients), 1)
+        clients[0].transport.close.assert_called_once()
+
+    def test_cache_min_tokens_by_model_prefix(self):
+        manager = GeminiClientManager()
+        self.assertEqual(manager.cache_min_tokens("models/gemini-2.5-flash-lite"), 1024)
+        self.assertEqual(manager.cache_min_tokens("gemini-2.0-flash"), 32768)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GeminiFileTranslator import RuleEngine
+
+
+class RuleEngineTest(unittest.TestCase):
+    def test_single_backreference_rule(self):
+        engine = RuleEngine.from_text(r"re:(\d)\1 = 같은숫자")
+        self.assertEqual(engine.resolve("55.txt"), ("같은숫자.txt", []))
+
+    def test_backreference_rule_after_other_rules(self):
+        engine = RuleEngine.from_text("\n".join([
+            r"re:IMG_(\d+) = 사진_\1",
+            r"re:(\d)\1x = 반복_\1",
+        ]))
+        self.assertEqual(engine.resolve("55x.txt"), ("반복_5.txt", []))
+        self.assertEqual(engine.resolve("IMG_12.jpg"), ("사진_12.jpg", []))
+        self.assertEqual(engine.resolve("56x.txt"), (None, []))
+
+    def test_escaped_backslash_is_not_backreference(self):
+        engine = RuleEngine.from_text("\n".join([
+            r"re:A\\1 = 가",
+            r"re:B(\d) = 나\1",
+        ]))
+        self.assertEqual(engine.resolve("A\\1.txt"), ("가.txt", []))
+        self.assertEqual(engine.resolve("B7.txt"), ("나7.txt", []))
+
+    def test_glossary_and_regex_together(self):
+        engine = RuleEngine.from_text("Report = 보고서\n" + r"re:(\d)\1 = 둘")
+        self.assertEqual(engine.resolve("Report 33.pdf"), ("보고서 둘.pdf", ["Report"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
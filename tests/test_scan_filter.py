@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GeminiFileTranslator import ScanFilter, scan_directory
+
+
+class ScanFilterTest(unittest.TestCase):
+    def test_backreference_rule_after_other_rules(self):
+        scan_filter = ScanFilter.from_text(r"-*.tmp; -re:^IMG_(\d+); -re:(\d)\1x", ['bak'])
+        self.assertFalse(scan_filter.accepts("55x.txt", False, 0))
+        self.assertTrue(scan_filter.accepts("56x.txt", False, 0))
+        self.assertFalse(scan_filter.accepts("IMG_1.jpg", False, 0))
+        self.assertFalse(scan_filter.accepts("a.TMP", False, 0))
+        self.assertFalse(scan_filter.accepts("a.bak", False, 0))
+
+    def test_include_backreference_rule(self):
+        scan_filter = ScanFilter.from_text(r"+re:(ab)\1")
+        self.assertTrue(scan_filter.accepts("xabab.mp4", False, 0))
+        self.assertFalse(scan_filter.accepts("xab.mp4", False, 0))
+
+    def test_excluded_extension_applies_to_files_only(self):
+        scan_filter = ScanFilter.from_text("", ['jpg'])
+        self.assertFalse(scan_filter.prunes("Trip.jpg"))
+        self.assertTrue(scan_filter.accepts("Trip.jpg", True, 0))
+        self.assertFalse(scan_filter.accepts("photo.JPG", False, 0))
+        with tempfile.TemporaryDirectory() as root:
+            os.mkdir(os.path.join(root, "Trip.jpg"))
+            open(os.path.join(root, "Trip.jpg", "a.txt"), 'w').close()
+            open(os.path.join(root, "Trip.jpg", "b.jpg"), 'w').close()
+            store, folders, files = scan_directory(root, True, scan_filter)
+            self.assertEqual([store.name(index) for index in folders], ["Trip.jpg"])
+            self.assertEqual([store.name(index) for index in files], ["a.txt"])
+
+    def test_exclude_rule_prunes_folders(self):
+        scan_filter = ScanFilter.from_text("-*.jpg")
+        self.assertTrue(scan_filter.prunes("Trip.jpg"))
+
+    def test_global_flag_rule(self):
+        scan_filter = ScanFilter.from_text(r"-re:(?i)^draft; -*.tmp")
+        self.assertFalse(scan_filter.accepts("DRAFT 1.txt", False, 0))
+        self.assertFalse(scan_filter.accepts("b.tmp", False, 0))
+        self.assertTrue(scan_filter.accepts("final.txt", False, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtWidgets import QApplication
+
+from GeminiFileTranslator import TranslationApp
+
+
+class ViewportPriorityTimerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        QCoreApplication.setOrganizationName("GeminiFileTranslatorTest")
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_large_scroll_keeps_debounce_interval(self):
+        window = TranslationApp()
+        try:
+            scroll_bar = window.files_tree.verticalScrollBar()
+            scroll_bar.setRange(0, 100000)
+            scroll_bar.setValue(30000)
+            self.assertTrue(window.viewport_priority_timer.isActive())
+            self.assertEqual(window.viewport_priority_timer.interval(), 150)
+        finally:
+            window.viewport_priority_timer.stop()
+            window.close()
+            window.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()